@@ -0,0 +1,73 @@
+"""
+Benchmark building NumPy arrays out of the interface counters of a fleet.
+
+Compares the usual list of dictionaries -> array conversion with `to_structured_array`, and a
+Python loop with `counter_rates`.
+
+Usage::
+
+    python benchmarks/bench_columnar.py [--interfaces 200000]
+"""
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import argparse
+import timeit
+
+import numpy
+
+from napalm_base.columnar import counter_rates, to_structured_array
+from napalm_base.test import models
+
+FIELDS = sorted(models.interface_counters)
+
+
+def snapshot(interfaces, offset):
+    return {'Ethernet{}'.format(i): {field: i * 1000 + offset * (n + 1)
+                                     for n, field in enumerate(FIELDS)}
+            for i in range(interfaces)}
+
+
+def naive_array(output):
+    dtype = [(str('interface'), 'U32')] + [(str(field), 'i8') for field in FIELDS]
+    return numpy.array([(name,) + tuple(row[field] for field in FIELDS)
+                        for name, row in output.items()], dtype=dtype)
+
+
+def naive_rates(before, after, interval):
+    rates = {}
+    for name, row in after.items():
+        if name not in before:
+            continue
+        previous = before[name]
+        rates[name] = {field: (row[field] - previous[field]) / interval
+                       if 0 <= previous[field] <= row[field] else float('nan')
+                       for field in FIELDS}
+    return rates
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--interfaces', type=int, default=200000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    before, after = snapshot(args.interfaces, 0), snapshot(args.interfaces, 10)
+    arrays = (to_structured_array('get_interfaces_counters', before),
+              to_structured_array('get_interfaces_counters', after))
+
+    def best(statement):
+        return min(timeit.repeat(statement, number=1, repeat=args.repeat))
+
+    print('interfaces:                     {}'.format(args.interfaces))
+    print('list of dicts -> array:         {:.3f}s'.format(best(lambda: naive_array(before))))
+    print('to_structured_array:            {:.3f}s'.format(
+        best(lambda: to_structured_array('get_interfaces_counters', before))))
+    print('rates, Python loop:             {:.3f}s'.format(
+        best(lambda: naive_rates(before, after, 30.0))))
+    print('counter_rates (arrays):         {:.3f}s'.format(
+        best(lambda: counter_rates(arrays[0], arrays[1], 30.0))))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,96 @@
+"""
+Benchmark extracting the fields of a large synthetic RPC reply (Junos-like interface
+information) with `find_txt`, comparing the per-call `xml_tree.xpath(path)` evaluation it used
+to do with the cached, precompiled and `find_txt_many` variants.
+
+Usage::
+
+    python benchmarks/bench_find_txt.py [--interfaces 10000]
+"""
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import argparse
+import time
+
+from lxml import etree
+
+from napalm_base import helpers
+from napalm_base.utils import py23_compat
+
+FIELDS = {
+    'name': 'name',
+    'admin_status': 'admin-status',
+    'oper_status': 'oper-status',
+    'mtu': 'mtu',
+    'speed': 'speed',
+    'description': 'description',
+    'mac': 'current-physical-address',
+    'input_bytes': 'traffic-statistics/input-bytes',
+    'output_bytes': 'traffic-statistics/output-bytes',
+}
+
+
+def rpc_reply(interfaces):
+    reply = etree.Element('rpc-reply')
+    information = etree.SubElement(reply, 'interface-information')
+    for i in range(interfaces):
+        interface = etree.SubElement(information, 'physical-interface')
+        for tag, text in (('name', 'ge-0/0/{}'.format(i)), ('admin-status', 'up'),
+                          ('oper-status', 'up'), ('mtu', '1514'), ('speed', '1000mbps'),
+                          ('current-physical-address', '00:05:86:71:{:02x}:{:02x}'.format(
+                              i >> 8 & 0xff, i & 0xff))):
+            etree.SubElement(interface, tag).text = '\n{}\n'.format(text)
+        statistics = etree.SubElement(interface, 'traffic-statistics')
+        etree.SubElement(statistics, 'input-bytes').text = str(i * 1000)
+        etree.SubElement(statistics, 'output-bytes').text = str(i * 2000)
+    return reply
+
+
+def uncompiled_find_txt(xml_tree, path, default=''):
+    """What find_txt used to do on every call."""
+    value = ''
+    try:
+        xpath_applied = xml_tree.xpath(path)
+        if len(xpath_applied) and xpath_applied[0] is not None:
+            xpath_result = xpath_applied[0]
+            if isinstance(xpath_result, type(xml_tree)):
+                value = xpath_result.text.strip()
+            else:
+                value = xpath_result
+    except Exception:
+        value = default
+    return py23_compat.text_type(value)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--interfaces', type=int, default=10000)
+    args = parser.parse_args()
+
+    interfaces = rpc_reply(args.interfaces).findall('.//physical-interface')
+    compiled = {field: etree.XPath(path) for field, path in FIELDS.items()}
+
+    cases = [
+        ('xml_tree.xpath per call', lambda i: {f: uncompiled_find_txt(i, p)
+                                               for f, p in FIELDS.items()}),
+        ('find_txt, string paths', lambda i: {f: helpers.find_txt(i, p)
+                                              for f, p in FIELDS.items()}),
+        ('find_txt, precompiled', lambda i: {f: helpers.find_txt(i, p)
+                                             for f, p in compiled.items()}),
+        ('find_txt_many', lambda i: helpers.find_txt_many(i, FIELDS)),
+    ]
+
+    print('interfaces: {}, fields: {}'.format(args.interfaces, len(FIELDS)))
+    expected = None
+    for name, extract in cases:
+        start = time.time()
+        records = [extract(interface) for interface in interfaces]
+        elapsed = time.time() - start
+        expected = expected or records
+        assert records == expected
+        print('{:26} {:6.2f}s'.format(name, elapsed))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,50 @@
+"""
+Microbenchmarks of the conversion helpers used in the hot loops of the getters, per value and
+in bulk. Run it before and after changing napalm_base/helpers.py to catch regressions.
+
+Usage::
+
+    python benchmarks/bench_helpers.py [--values 10000] [--repeat 5]
+"""
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import argparse
+import timeit
+
+from napalm_base import helpers
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--values', type=int, default=10000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    n = args.values
+    # route reflector: many peers, few distinct ASNs
+    asns = ['{}.{}'.format(1 + i % 3, i % 50) if i % 4 else '{}'.format(64512 + i % 50)
+            for i in range(n)]
+    counters = ['{}'.format(i * 1000) for i in range(n)]
+    counters_with_none = [None if i % 100 == 0 else c for i, c in enumerate(counters)]
+    counters_with_errors = ['n/a' if i % 100 == 0 else c for i, c in enumerate(counters)]
+
+    cases = [
+        ('as_number, uncached', lambda: [helpers._as_number(a) for a in asns]),
+        ('as_number', lambda: [helpers.as_number(a) for a in asns]),
+        ('as_numbers', lambda: helpers.as_numbers(asns)),
+        ('convert(int)', lambda: [helpers.convert(int, c, -1) for c in counters]),
+        ('convert_many(int)', lambda: helpers.convert_many(int, counters, -1)),
+        ('convert_many(int), 1% None', lambda: helpers.convert_many(int, counters_with_none, -1)),
+        ('convert_many(int), 1% n/a',
+         lambda: helpers.convert_many(int, counters_with_errors, -1)),
+    ]
+
+    print('values: {}'.format(n))
+    for name, statement in cases:
+        best = min(timeit.repeat(statement, number=1, repeat=args.repeat))
+        print('{:28} {:8.0f} ns/value'.format(name, best / n * 1e9))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+"""
+Benchmark the time it takes to ``import napalm_base`` in a fresh interpreter.
+
+Compares the current package against the cost the package used to pay by importing
+``pkg_resources`` eagerly to resolve its version and the installed drivers.
+
+Usage::
+
+    python benchmarks/bench_import.py [--runs 20]
+"""
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SCENARIOS = (
+    ('before (eager pkg_resources)', 'import pkg_resources; import napalm_base'),
+    ('after', 'import napalm_base'),
+)
+
+
+def cold_import(statement, runs):
+    """Return the wall time, in ms, of each run of `statement` in a new interpreter."""
+    env = dict(os.environ, PYTHONPATH=ROOT, PYTHONDONTWRITEBYTECODE='1')
+    timings = []
+    for _ in range(runs):
+        start = time.time()
+        subprocess.check_call([sys.executable, '-c', statement], env=env)
+        timings.append((time.time() - start) * 1000)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--runs', type=int, default=20)
+    args = parser.parse_args()
+
+    baseline = min(cold_import('pass', args.runs))
+    print('interpreter startup: {:.1f} ms'.format(baseline))
+    for name, statement in SCENARIOS:
+        timings = sorted(cold_import(statement, args.runs))
+        print('{:<30} min {:7.1f} ms   median {:7.1f} ms'.format(
+            name, timings[0] - baseline, timings[len(timings) // 2] - baseline))
+
+
+if __name__ == '__main__':
+    main()
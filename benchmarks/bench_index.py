@@ -0,0 +1,67 @@
+"""
+Benchmark building a TableIndex over large MAC and ARP tables, and querying it against linear
+scans of the tables.
+
+Usage::
+
+    python benchmarks/bench_index.py [--entries 1000000]
+"""
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import argparse
+import time
+import timeit
+
+from napalm_base.index import TableIndex
+
+
+def mac(i):
+    return '00:1C:{:02X}:{:02X}:{:02X}:{:02X}'.format(i >> 24 & 0xff, i >> 16 & 0xff,
+                                                      i >> 8 & 0xff, i & 0xff)
+
+
+def tables(entries):
+    mac_address_table = [{
+        'mac': mac(i), 'interface': 'Ethernet{}'.format(i % 48), 'vlan': i % 4000,
+        'static': False, 'active': True, 'moves': 0, 'last_move': 0.0,
+    } for i in range(entries)]
+    arp_table = [{
+        'interface': 'Vlan{}'.format(i % 4000), 'mac': mac(i), 'age': 0.0,
+        'ip': '10.{}.{}.{}'.format(i >> 16 & 0xff, i >> 8 & 0xff, i & 0xff),
+    } for i in range(entries)]
+    return mac_address_table, arp_table
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--entries', type=int, default=1000000)
+    args = parser.parse_args()
+
+    mac_address_table, arp_table = tables(args.entries)
+    start = time.time()
+    index = TableIndex(mac_address_table, arp_table)
+    built = time.time() - start
+
+    target = mac(args.entries // 2)
+    ip = arp_table[args.entries // 2]['ip']
+    number = 1000
+    scan = min(timeit.repeat(lambda: [e for e in mac_address_table if e['mac'] == target],
+                             number=1, repeat=3))
+    lookup = min(timeit.repeat(lambda: index.mac_table(mac=target),
+                               number=number, repeat=3)) / number
+    scan_ip = min(timeit.repeat(lambda: [e for e in arp_table if e['ip'] == ip],
+                                number=1, repeat=3))
+    lookup_ip = min(timeit.repeat(lambda: index.arp_table(ip=ip),
+                                  number=number, repeat=3)) / number
+
+    print('entries:               {}'.format(args.entries))
+    print('build (MAC + ARP):     {:.2f}s'.format(built))
+    print('MAC, linear scan:      {:10.1f} us'.format(scan * 1e6))
+    print('MAC, index:            {:10.1f} us'.format(lookup * 1e6))
+    print('IP, linear scan:       {:10.1f} us'.format(scan_ip * 1e6))
+    print('IP, index:             {:10.1f} us'.format(lookup_ip * 1e6))
+
+
+if __name__ == '__main__':
+    main()
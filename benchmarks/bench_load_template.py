@@ -0,0 +1,85 @@
+"""
+Benchmark rendering the same template many times with `helpers.load_template`, against the
+previous behaviour of building a new Jinja2 environment (and compiling the template) each time.
+
+Usage::
+
+    python benchmarks/bench_load_template.py [--renders 10000]
+"""
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import argparse
+import os
+import shutil
+import tempfile
+import time
+
+import jinja2
+
+from napalm_base import helpers
+from napalm_base.base import NetworkDriver
+from napalm_base.utils.jinja_filters import CustomJinjaFilters
+
+TEMPLATE_SOURCE = '{% for peer in peers %}ntp peer {{peer}}\n{% endfor %}'
+PEERS = ['172.17.17.{}'.format(i) for i in range(4)]
+
+
+class Driver(NetworkDriver):
+
+    def __init__(self):
+        pass
+
+    def load_merge_candidate(self, filename=None, config=None):
+        return config
+
+
+def uncached(template_path, template_name, template_source=None):
+    """What `load_template` used to do on every call."""
+    if template_source is not None:
+        return jinja2.Template(template_source).render(peers=PEERS)
+    environment = jinja2.Environment(loader=jinja2.FileSystemLoader([template_path]))
+    for filter_name, filter_function in CustomJinjaFilters.filters().items():
+        environment.filters[filter_name] = filter_function
+    return environment.get_template('{}.j2'.format(template_name)).render(peers=PEERS)
+
+
+def timed(renders, function):
+    start = time.time()
+    for _ in range(renders):
+        function()
+    return time.time() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--renders', type=int, default=10000)
+    args = parser.parse_args()
+
+    # load_template looks for the templates in <template_path>/<driver module>/templates
+    template_path = tempfile.mkdtemp()
+    driver_path = os.path.join(template_path, Driver.__module__.split('.')[-1], 'templates')
+    os.makedirs(driver_path)
+    with open(os.path.join(driver_path, 'ntp.j2'), 'w') as f:
+        f.write(TEMPLATE_SOURCE)
+
+    device = Driver()
+    try:
+        print('renders:                 {}'.format(args.renders))
+        print('file, new environment:   {:.2f}s'.format(timed(
+            args.renders, lambda: uncached(driver_path, 'ntp'))))
+        print('file, load_template:     {:.2f}s'.format(timed(
+            args.renders, lambda: helpers.load_template(device, 'ntp', template_path=template_path,
+                                                        peers=PEERS))))
+        print('string, new template:    {:.2f}s'.format(timed(
+            args.renders, lambda: uncached(driver_path, 'ntp', TEMPLATE_SOURCE))))
+        print('string, load_template:   {:.2f}s'.format(timed(
+            args.renders, lambda: helpers.load_template(device, 'ntp',
+                                                        template_source=TEMPLATE_SOURCE,
+                                                        peers=PEERS))))
+    finally:
+        shutil.rmtree(template_path)
+
+
+if __name__ == '__main__':
+    main()
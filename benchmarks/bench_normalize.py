@@ -0,0 +1,51 @@
+"""
+Benchmark normalizing the MAC and IP addresses of large tables with `helpers.mac`/`helpers.ip`
+called per row, against the bulk `helpers.macs`/`helpers.ips`.
+
+Usage::
+
+    python benchmarks/bench_normalize.py [--entries 200000]
+"""
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import argparse
+import time
+
+from napalm_base import helpers
+
+
+def timed(function, values):
+    start = time.time()
+    result = function(values)
+    return result, time.time() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--entries', type=int, default=200000)
+    args = parser.parse_args()
+
+    n = args.entries
+    tables = [
+        ('MAC, Cisco format', helpers.mac, helpers.macs,
+         ['{:04x}.{:04x}.{:04x}'.format(0x001c, i >> 16, i & 0xffff) for i in range(n)]),
+        ('MAC, lowercase', helpers.mac, helpers.macs,
+         ['00:1c:{:02x}:{:02x}:{:02x}:{:02x}'.format(i >> 24 & 0xff, i >> 16 & 0xff,
+                                                     i >> 8 & 0xff, i & 0xff) for i in range(n)]),
+        ('IPv4', helpers.ip, helpers.ips,
+         ['10.{}.{}.{}'.format(i >> 16 & 0xff, i >> 8 & 0xff, i & 0xff) for i in range(n)]),
+        ('IPv6, 1k distinct', helpers.ip, helpers.ips,
+         ['2001:0DB8::{:X}'.format(i % 1000) for i in range(n)]),
+    ]
+
+    print('entries: {}'.format(n))
+    for name, single, bulk, values in tables:
+        expected, per_row = timed(lambda v: [single(x) for x in v], values)
+        result, in_bulk = timed(bulk, values)
+        assert result == expected
+        print('{:20} per row: {:6.2f}s   bulk: {:6.2f}s'.format(name, per_row, in_bulk))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+"""
+Benchmark the memory held by a MAC address table as dictionaries and as records.
+
+Usage::
+
+    python benchmarks/bench_records.py [--entries 500000]
+"""
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import argparse
+import gc
+import time
+import tracemalloc
+
+from napalm_base.records import to_records
+
+
+def mac_address_table(entries):
+    return [{
+        'mac': '00:1C:58:{:02X}:{:02X}:{:02X}'.format(i >> 16 & 0xff, i >> 8 & 0xff, i & 0xff),
+        'interface': 'Ethernet{}'.format(i % 48),
+        'vlan': i % 4096,
+        'static': False,
+        'active': True,
+        'moves': i % 3,
+        'last_move': 1454417742.58 + i,
+    } for i in range(entries)]
+
+
+def measure(build):
+    gc.collect()
+    tracemalloc.start()
+    start = time.time()
+    result = build()
+    elapsed = time.time() - start
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, current, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--entries', type=int, default=500000)
+    args = parser.parse_args()
+
+    table, dict_bytes, _ = measure(lambda: mac_address_table(args.entries))
+    # only account for the rows, not for the strings and numbers shared by both representations
+    records, record_bytes, elapsed = measure(lambda: to_records(table, 'mac_address_table'))
+    rows_bytes = sum(r.__sizeof__() for r in table) + table.__sizeof__()
+
+    print('entries:                  {}'.format(args.entries))
+    print('dict rows (containers):   {:8.1f} MiB'.format(rows_bytes / 2.0 ** 20))
+    print('records (containers):     {:8.1f} MiB  (converted in {:.2f}s)'.format(
+        record_bytes / 2.0 ** 20, elapsed))
+    print('whole table as dicts:     {:8.1f} MiB'.format(dict_bytes / 2.0 ** 20))
+    print('whole table as records:   {:8.1f} MiB'.format(
+        (dict_bytes - rows_bytes + record_bytes) / 2.0 ** 20))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,78 @@
+"""
+Benchmark parsing synthetic ``show mac address-table`` outputs with `textfsm_extractor_many`,
+serially and with an increasing number of worker processes.
+
+Usage::
+
+    python benchmarks/bench_textfsm.py [--devices 2000] [--entries 200] [--processes 1 2 4 8]
+"""
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import argparse
+import multiprocessing
+import os
+import shutil
+import tempfile
+import time
+
+from napalm_base.helpers import textfsm_extractor_many
+
+TEMPLATE = r'''Value Required VLAN (\d+)
+Value Required MAC ([0-9a-f]{4}\.[0-9a-f]{4}\.[0-9a-f]{4})
+Value TYPE (\w+)
+Value PORTS (\S+)
+
+Start
+  ^\s*${VLAN}\s+${MAC}\s+${TYPE}\s+${PORTS}\s*$$ -> Record
+'''
+
+HEADER = '''          Mac Address Table
+-------------------------------------------
+
+Vlan    Mac Address       Type        Ports
+----    -----------       --------    -----
+'''
+
+
+def show_mac_address_table(device, entries):
+    lines = [HEADER]
+    for i in range(entries):
+        lines.append(' {:>4}    {:04x}.{:04x}.{:04x}    DYNAMIC     Gi1/0/{}\n'.format(
+            i % 4000 + 1, device, i >> 16, i & 0xffff, i % 48 + 1))
+    lines.append('Total Mac Addresses for this criterion: {}\n'.format(entries))
+    return ''.join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--devices', type=int, default=2000)
+    parser.add_argument('--entries', type=int, default=200)
+    parser.add_argument('--processes', type=int, nargs='+', default=[1, 2, 4, 8])
+    args = parser.parse_args()
+
+    template_dir = tempfile.mkdtemp()
+    try:
+        with open(os.path.join(template_dir, 'show_mac_address_table.tpl'), 'w') as f:
+            f.write(TEMPLATE)
+        jobs = [(template_dir, 'show_mac_address_table', show_mac_address_table(d, args.entries))
+                for d in range(args.devices)]
+
+        print('devices: {}, entries per device: {}, cores: {}'.format(
+            args.devices, args.entries, multiprocessing.cpu_count()))
+        start = time.time()
+        expected = textfsm_extractor_many(jobs)
+        serial = time.time() - start
+        print('in process:      {:6.2f}s'.format(serial))
+        for processes in args.processes:
+            start = time.time()
+            assert textfsm_extractor_many(jobs, processes=processes) == expected
+            elapsed = time.time() - start
+            print('{:2d} processes:    {:6.2f}s  (x{:.1f})'.format(processes, elapsed,
+                                                                   serial / elapsed))
+    finally:
+        shutil.rmtree(template_dir)
+
+
+if __name__ == '__main__':
+    main()
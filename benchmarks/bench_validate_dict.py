@@ -0,0 +1,102 @@
+"""
+Benchmark validating large nested getter results (`get_bgp_neighbors` and
+`get_interfaces_counters`), comparing the deep copy of the actual values that
+`_compare_getter_dict` used to do at every level with the current non-destructive comparison.
+
+Usage::
+
+    python benchmarks/bench_validate_dict.py [--peers 5000] [--interfaces 10000]
+"""
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import copy
+import time
+import argparse
+import tracemalloc
+
+from napalm_base import validate
+
+
+def bgp_neighbors(peers):
+    return {'global': {'router_id': '192.0.2.1', 'peers': {
+        '10.{}.{}.{}'.format(i >> 16 & 0xff, i >> 8 & 0xff, i & 0xff): {
+            'local_as': 65000, 'remote_as': 65001 + i % 100, 'remote_id': '192.0.2.2',
+            'is_up': True, 'is_enabled': True, 'description': 'peer {}'.format(i),
+            'uptime': 1000 + i,
+            'address_family': {
+                'ipv4': {'received_prefixes': 100, 'accepted_prefixes': 100,
+                         'sent_prefixes': 10},
+                'ipv6': {'received_prefixes': 0, 'accepted_prefixes': 0, 'sent_prefixes': 0},
+            }} for i in range(peers)}}}
+
+
+def bgp_neighbors_expected(actual):
+    """Every peer up and receiving prefixes, in strict mode."""
+    return {'global': {'router_id': '192.0.2.1', 'peers': dict(
+        [('_mode', 'strict')] +
+        [(peer, {'is_up': True, 'address_family': {'ipv4': {'received_prefixes': '>0'}}})
+         for peer in actual['global']['peers']])}}
+
+
+def interfaces_counters(interfaces):
+    counters = ['tx_errors', 'rx_errors', 'tx_discards', 'rx_discards', 'tx_octets',
+                'rx_octets', 'tx_unicast_packets', 'rx_unicast_packets',
+                'tx_multicast_packets', 'rx_multicast_packets', 'tx_broadcast_packets',
+                'rx_broadcast_packets']
+    return {'Ethernet{}'.format(i): {counter: i * 1000 for counter in counters}
+            for i in range(interfaces)}
+
+
+def interfaces_counters_expected(actual):
+    """No errors on one interface out of ten."""
+    return {interface: {'tx_errors': '<1', 'rx_errors': '<1'}
+            for interface in sorted(actual)[::10]}
+
+
+def deepcopy_compare_getter_dict(src, dst, mode, compare=validate._compare_getter_dict):
+    """What _compare_getter_dict used to do: deep copy dst before comparing it."""
+    return compare(src, copy.deepcopy(dst), mode)
+
+
+def run(compare, plan, actual):
+    original = validate._compare_getter_dict
+    validate._compare_getter_dict = compare
+    try:
+        tracemalloc.start()
+        start = time.time()
+        report = plan.evaluate([actual])
+        elapsed = time.time() - start
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    finally:
+        validate._compare_getter_dict = original
+    return report, elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--peers', type=int, default=5000)
+    parser.add_argument('--interfaces', type=int, default=10000)
+    args = parser.parse_args()
+
+    cases = [
+        ('get_bgp_neighbors', bgp_neighbors(args.peers), bgp_neighbors_expected),
+        ('get_interfaces_counters', interfaces_counters(args.interfaces),
+         interfaces_counters_expected),
+    ]
+    for getter, actual, expected in cases:
+        plan = validate.compile_plan(validation_source=[{getter: expected(actual)}])
+        print(getter)
+        reports = []
+        for name, compare in (('deepcopy', deepcopy_compare_getter_dict),
+                              ('seen keys', validate._compare_getter_dict)):
+            report, elapsed, peak = run(compare, plan, actual)
+            reports.append(report)
+            print('  {:10} {:8.3f}s {:10.1f} MiB peak allocated'.format(
+                name, elapsed, peak / 1024.0 / 1024))
+        assert reports[0] == reports[1]
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,115 @@
+"""
+Benchmark matching a list of expected entries against a large actual list (MAC address table)
+with `validate._compare_getter`, comparing the linear matching it used to do with the indexed
+matching of the elements with literal values. The expected entries are matched either by their
+anchored MAC address or only by numbers (VLAN and time of the last move).
+
+Usage::
+
+    python benchmarks/bench_validate_list.py [--sizes 1000 10000 100000] [--linear-max 10000]
+"""
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import re
+import copy
+import time
+import argparse
+
+from napalm_base import validate
+
+
+def mac_address_table(size):
+    return [{'mac': '00:05:86:71:{:02X}:{:02X}'.format(i >> 8 & 0xff, i & 0xff),
+             'interface': 'ge-0/0/{}'.format(i % 48), 'vlan': 100 + i % 64,
+             'static': False, 'active': True, 'moves': 0, 'last_move': float(i)}
+            for i in range(size)]
+
+
+def by_mac(entry):
+    return {'mac': '^{}$'.format(re.escape(entry['mac'])), 'interface': entry['interface'],
+            'vlan': entry['vlan']}
+
+
+def by_numbers(entry):
+    return {'vlan': entry['vlan'], 'last_move': entry['last_move'], 'active': True}
+
+
+def expected_entries(table, expected_entry):
+    """One entry out of ten, at most 2000, the last ones missing, compiled."""
+    expected = []
+    for entry in table[::10][:2000]:
+        expected.append(expected_entry(entry))
+    for entry in expected[-10:]:
+        entry['vlan'] = 4000
+    return validate._compile({'_mode': 'strict', 'list': expected})
+
+
+def linear_compare_getter_list(src, dst, mode):
+    """What _compare_getter_list used to do."""
+    result = {"complies": True, "present": [], "missing": [], "extra": []}
+    for src_element in src:
+        found = False
+
+        i = 0
+        while True:
+            try:
+                intermediate_match = src_element.compare(dst[i])
+                if isinstance(intermediate_match, dict) and intermediate_match["complies"] or \
+                   not isinstance(intermediate_match, dict) and intermediate_match:
+                    found = True
+                    result["present"].append(src_element.source)
+                    dst.pop(i)
+                    break
+                else:
+                    i += 1
+            except IndexError:
+                break
+
+        if not found:
+            result["complies"] = False
+            result["missing"].append(src_element.source)
+
+    if mode["strict"] and dst:
+        result["extra"] = dst
+        result["complies"] = False
+
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 100000])
+    parser.add_argument('--linear-max', type=int, default=10000,
+                        help='largest size run with the linear matching')
+    args = parser.parse_args()
+
+    cases = [
+        ('linear', linear_compare_getter_list),
+        ('indexed', validate._compare_getter_list),
+    ]
+
+    for size in args.sizes:
+        table = mac_address_table(size)
+        for expected_entry in (by_mac, by_numbers):
+            src = expected_entries(table, expected_entry)
+            print('actual: {}, expected: {}, {}'.format(size, len(src.elements),
+                                                        expected_entry.__name__))
+            expected = None
+            for name, compare in cases:
+                if name == 'linear' and size > args.linear_max:
+                    print('  {:10} skipped'.format(name))
+                    continue
+                dst = copy.deepcopy(table)
+                start = time.time()
+                result = compare(src.elements, dst, src.mode)
+                elapsed = time.time() - start
+                summary = (result['complies'], len(result['present']), len(result['missing']),
+                           len(result['extra']))
+                expected = expected or summary
+                assert summary == expected
+                print('  {:10} {:8.3f}s'.format(name, elapsed))
+
+
+if __name__ == '__main__':
+    main()
@@ -20,7 +20,6 @@ from __future__ import unicode_literals
 
 # Python std lib
 import sys
-import pkg_resources
 
 # Verify Python Version that is running
 try:
@@ -41,10 +40,32 @@ try:
 except ImportError:
     HAS_NAPALM = False
 
-try:
-    __version__ = pkg_resources.get_distribution('napalm-base').version
-except pkg_resources.DistributionNotFound:
-    __version__ = "Not installed"
+
+def _get_version():
+    # importlib.metadata and pkg_resources (even more) are slow to import
+    try:
+        from importlib import metadata
+    except ImportError:
+        import pkg_resources
+        try:
+            return pkg_resources.get_distribution('napalm-base').version
+        except pkg_resources.DistributionNotFound:
+            return "Not installed"
+    try:
+        return metadata.version('napalm-base')
+    except metadata.PackageNotFoundError:
+        return "Not installed"
+
+
+if sys.version_info >= (3, 7):
+    # Resolve __version__ only when somebody asks for it (PEP 562)
+    def __getattr__(name):
+        if name == '__version__':
+            globals()['__version__'] = _get_version()
+            return globals()['__version__']
+        raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+else:
+    __version__ = _get_version()
 
 
 if HAS_NAPALM and NAPALM_MAJOR >= 2:
@@ -53,14 +74,13 @@ if HAS_NAPALM and NAPALM_MAJOR >= 2:
     from napalm.base import NetworkDriver
 else:
     # Import std lib
-    import inspect
     import importlib
 
     # Import local modules
     from napalm_base.exceptions import ModuleImportError
     from napalm_base.mock import MockDriver
-    from napalm_base.utils import py23_compat
     from napalm_base.base import NetworkDriver
+    from napalm_base import registry
 
     def get_network_driver(module_name, prepend=True):
         """
@@ -80,6 +100,11 @@ else:
 
         :return: The first class derived from NetworkDriver, found in the library.
 
+        The class is stored in a process-wide registry (see `napalm_base.registry`), therefore
+        the library is imported and scanned only once. Drivers registered with
+        `register_network_driver` or advertised through the `napalm.drivers` entry points are
+        returned without scanning anything, their module is imported only at this point.
+
         :raise ModuleImportError: When the library is not installed or a derived class from \
         NetworkDriver was not found.
 
@@ -100,17 +125,14 @@ else:
         if module_name == "mock":
             return MockDriver
 
-        if not (isinstance(module_name, py23_compat.string_types) and len(module_name) > 0):
-            raise ModuleImportError('Please provide a valid driver name.')
+        module_install_name = registry.normalize_driver_name(module_name, prepend=prepend)
+        driver = registry.lookup_network_driver(module_install_name, prepend=False)
+        if driver is not None:
+            return driver
+
+        import inspect
 
         try:
-            # Only lowercase allowed
-            module_name = module_name.lower()
-            # Try to not raise error when users requests IOS-XR for e.g.
-            module_install_name = module_name.replace('-', '')
-            # Can also request using napalm_[SOMETHING]
-            if 'napalm_' not in module_install_name and prepend is True:
-                module_install_name = 'napalm_{name}'.format(name=module_install_name)
             module = importlib.import_module(module_install_name)
         except ImportError:
             raise ModuleImportError(
@@ -121,6 +143,7 @@ else:
 
         for name, obj in inspect.getmembers(module):
             if inspect.isclass(obj) and issubclass(obj, NetworkDriver):
+                registry.register_network_driver(module_install_name, obj, prepend=False)
                 return obj
 
         # looks like you don't have any Driver class in your module...
@@ -129,7 +152,15 @@ else:
             .format(install_name=module_install_name))
 
 
+from napalm_base.registry import register_network_driver  # noqa
+from napalm_base.registry import list_network_drivers  # noqa
+from napalm_base.registry import invalidate_network_driver  # noqa
+
+
 __all__ = [
     'get_network_driver',  # export the function
-    'NetworkDriver'  # also export the base class
+    'NetworkDriver',  # also export the base class
+    'register_network_driver',
+    'list_network_drivers',
+    'invalidate_network_driver',
 ]
@@ -0,0 +1,217 @@
+# Copyright 2017 Dravetech AB. All rights reserved.
+#
+# The contents of this file are licensed under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with the
+# License. You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations under
+# the License.
+
+"""
+asyncio front-end for NetworkDriver. Requires Python 3.5 or newer.
+
+The blocking driver calls run in a bounded thread pool shared by all the adapters (see
+`set_default_executor`).
+
+Example:
+
+.. code-block:: python
+
+    >>> driver = get_network_driver('eos')
+    >>> async with AsyncNetworkDriver(driver('edge01', 'admin', 'secret')) as device:
+    ...     facts = await device.get_facts()
+
+    >>> devices = [driver(hostname, 'admin', 'secret') for hostname in hostnames]
+    >>> results = await gather_getter(devices, 'get_interfaces_counters', concurrency=200)
+"""
+
+import asyncio
+import functools
+import threading
+from concurrent import futures
+
+from napalm_base.base import NetworkDriver
+
+
+DEFAULT_MAX_WORKERS = 64
+
+_default_executor = None
+_default_executor_lock = threading.Lock()
+
+
+def get_default_executor():
+    """Return the executor used by the adapters that were not given one, creating it if needed."""
+    global _default_executor
+    with _default_executor_lock:
+        if _default_executor is None:
+            _default_executor = futures.ThreadPoolExecutor(max_workers=DEFAULT_MAX_WORKERS)
+        return _default_executor
+
+
+def set_default_executor(executor):
+    """Replace the executor used by the adapters that were not given one."""
+    global _default_executor
+    with _default_executor_lock:
+        previous, _default_executor = _default_executor, executor
+    if previous is not None and previous is not executor:
+        previous.shutdown(wait=False)
+
+
+class AsyncNetworkDriver(object):
+    """
+    Wraps an instance of a NetworkDriver subclass and exposes its methods as coroutines.
+
+    All the `get_*` getters are available, in addition to the methods defined below.
+
+    When a call is cancelled, the blocking call keeps running in its thread (it can't be
+    interrupted). As the session is left in an unknown state, the device is closed as soon as
+    the blocking call returns.
+
+    :param device: (NetworkDriver) the driver instance.
+    :param executor: (concurrent.futures.Executor) where to run the blocking calls. By default,
+        the executor returned by `get_default_executor`.
+    """
+
+    def __init__(self, device, executor=None):
+        if not isinstance(device, NetworkDriver):
+            raise TypeError("{!r} is not an instance of NetworkDriver".format(device))
+        self.device = device
+        self.executor = executor
+
+    def __repr__(self):
+        return '{}({!r})'.format(self.__class__.__name__, self.device)
+
+    def _submit(self, func, *args, **kwargs):
+        loop = asyncio.get_event_loop()
+        return loop.run_in_executor(self.executor or get_default_executor(),
+                                    functools.partial(func, *args, **kwargs))
+
+    def _close_quietly(self):
+        try:
+            self.device.close()
+        except Exception:
+            pass
+
+    async def _call(self, name, *args, **kwargs):
+        lock = threading.Lock()
+        state = {'done': False, 'cancelled': False}
+
+        def call():
+            try:
+                # resolve the method in the thread, some drivers do I/O in __getattribute__
+                return getattr(self.device, name)(*args, **kwargs)
+            finally:
+                with lock:
+                    state['done'] = True
+                    close = state['cancelled']
+                if close:
+                    self._close_quietly()
+
+        future = self._submit(call)
+        try:
+            # shield the future, otherwise it's cancelled before the blocking call is over
+            return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            with lock:
+                state['cancelled'] = name != 'close'
+                close = state['done'] and state['cancelled']
+            if close:
+                (self.executor or get_default_executor()).submit(self._close_quietly)
+            raise
+
+    def __getattr__(self, name):
+        if not name.startswith('get_') or not callable(getattr(self.device, name, None)):
+            raise AttributeError("'{}' object has no attribute '{}'".format(
+                self.__class__.__name__, name))
+
+        async def getter(*args, **kwargs):
+            return await self._call(name, *args, **kwargs)
+
+        getter.__name__ = name
+        getter.__doc__ = getattr(self.device, name).__doc__
+        return getter
+
+    async def __aenter__(self):
+        await self.open()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, exc_traceback):
+        # Even if the task is cancelled again, let the session be closed
+        await asyncio.shield(self._submit(self._close_quietly))
+
+    async def open(self):
+        return await self._call('open')
+
+    async def close(self):
+        return await self._call('close')
+
+    async def is_alive(self):
+        return await self._call('is_alive')
+
+    async def cli(self, commands):
+        return await self._call('cli', commands)
+
+    async def ping(self, destination, **kwargs):
+        return await self._call('ping', destination, **kwargs)
+
+    async def traceroute(self, destination, **kwargs):
+        return await self._call('traceroute', destination, **kwargs)
+
+    async def load_template(self, template_name, **kwargs):
+        return await self._call('load_template', template_name, **kwargs)
+
+    async def load_replace_candidate(self, filename=None, config=None):
+        return await self._call('load_replace_candidate', filename=filename, config=config)
+
+    async def load_merge_candidate(self, filename=None, config=None):
+        return await self._call('load_merge_candidate', filename=filename, config=config)
+
+    async def compare_config(self):
+        return await self._call('compare_config')
+
+    async def commit_config(self):
+        return await self._call('commit_config')
+
+    async def discard_config(self):
+        return await self._call('discard_config')
+
+    async def rollback(self):
+        return await self._call('rollback')
+
+    async def compliance_report(self, validation_file=None, validation_source=None):
+        return await self._call('compliance_report', validation_file=validation_file,
+                                validation_source=validation_source)
+
+
+async def gather_getter(devices, getter, concurrency=100, open_device=True,
+                        return_exceptions=True, executor=None, **kwargs):
+    """
+    Run `getter` on every device and return the results, in the same order as `devices`.
+
+    :param devices: Iterable of NetworkDriver or AsyncNetworkDriver instances.
+    :param getter: (str) Name of the getter, e.g. "get_facts".
+    :param concurrency: (int) Maximum number of devices handled at the same time.
+    :param open_device: (bool) Open each device before calling the getter and close it after.
+    :param return_exceptions: (bool) Like `asyncio.gather`, return the exceptions in place of the
+        results instead of raising the first one.
+    :param executor: (concurrent.futures.Executor) used for the NetworkDriver instances.
+    :param kwargs: Arguments passed to the getter.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(device):
+        if not isinstance(device, AsyncNetworkDriver):
+            device = AsyncNetworkDriver(device, executor=executor)
+        async with semaphore:
+            if not open_device:
+                return await getattr(device, getter)(**kwargs)
+            async with device:
+                return await getattr(device, getter)(**kwargs)
+
+    return await asyncio.gather(*[run(device) for device in devices],
+                                return_exceptions=return_exceptions)
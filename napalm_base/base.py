@@ -17,6 +17,7 @@ from __future__ import print_function
 from __future__ import unicode_literals
 
 # local modules
+import napalm_base.cache
 import napalm_base.exceptions
 import napalm_base.helpers
 
@@ -26,6 +27,29 @@ from napalm_base import validate
 
 
 class NetworkDriver(object):
+    def __new__(cls, *args, **kwargs):
+        """
+        Enables the features requested through `optional_args` that are common to all the
+        drivers:
+
+            * getter_cache(bool or dict) - Cache the results of the getters. A dictionary is
+              passed as kwargs to `enable_getter_cache`.
+            * getter_records(bool) - The table getters return records instead of dictionaries,
+              see `enable_getter_records`.
+        """
+        instance = super(NetworkDriver, cls).__new__(cls)
+        optional_args = kwargs.get('optional_args')
+        if optional_args is None and len(args) > 4:
+            optional_args = args[4]
+        if not isinstance(optional_args, dict):
+            return instance
+        if optional_args.get('getter_cache'):
+            cache_args = optional_args['getter_cache']
+            instance.enable_getter_cache(**(cache_args if isinstance(cache_args, dict) else {}))
+        if optional_args.get('getter_records'):
+            instance.enable_getter_records()
+        return instance
+
     def __init__(self, hostname, username, password, timeout=60, optional_args=None):
         """
         This is the base class you have to inherit from when writing your own Network Driver to
@@ -69,6 +93,34 @@ class NetworkDriver(object):
         except Exception:
             pass
 
+    def enable_getter_cache(self, ttl=60, ttls=None, maxsize=128, copy=True):
+        """
+        Caches the results of the `get_*` methods, per method and arguments.
+
+        The cache is cleared by `load_merge_candidate`, `load_replace_candidate`, `commit_config`
+        and `rollback`. The hit and miss counters are available with `self.getter_cache.stats()`.
+
+        :param ttl: (int) Time in seconds the results are kept.
+        :param ttls: (dict) Time in seconds the results are kept, per getter name. Overrides `ttl`;
+            0 disables the cache for that getter.
+        :param maxsize: (int) Maximum number of results kept, the least recently used is discarded.
+        :param copy: (bool) Return copies of the cached results, so they can be safely modified.
+        :return: The `napalm_base.cache.GetterCache` instance.
+        """
+        getter_cache = napalm_base.cache.GetterCache(ttl=ttl, ttls=ttls, maxsize=maxsize, copy=copy)
+        return napalm_base.cache.install(self, getter_cache)
+
+    def enable_getter_records(self):
+        """
+        Makes the table getters return compact records (namedtuples generated from the models)
+        instead of dictionaries for each row. See `napalm_base.records`.
+
+        Only the getters listed in `napalm_base.records.TABLE_GETTERS` are affected, and their
+        `iter_*` counterparts. Must be called after `enable_getter_cache` if both are used.
+        """
+        import napalm_base.records
+        napalm_base.records.install(self)
+
     def open(self):
         """
         Opens a connection to the device.
@@ -138,6 +190,42 @@ class NetworkDriver(object):
                                                  template_path=template_path,
                                                  **template_vars)
 
+    @classmethod
+    def render_templates(cls, template_name, template_vars, template_source=None,
+                         template_path=None, processes=None):
+        """
+        Renders a template for many devices at once, without loading the configurations.
+
+        Unlike `load_template`, this does not need a connection to a device: the template is
+        compiled once and rendered with each set of variables.
+
+        Example::
+
+            >>> driver.render_templates('set_ntp_peers', {
+            ...     'edge01': {'peers': ['172.17.17.1']},
+            ...     'edge02': {'peers': ['172.17.17.2']},
+            ... })
+            {'edge01': u'ntp peer 172.17.17.1\n', 'edge02': u'ntp peer 172.17.17.2\n'}
+
+        :param template_name: Identifies the template name.
+        :param template_vars: Dictionary of dictionaries with the arguments of each rendering, \
+        keyed by an identifier such as the hostname, or a list of dictionaries.
+        :param template_source (optional): Custom config template rendered instead
+        :param template_path (optional): Absolute path to directory for the configuration templates
+        :param processes (optional): Number of processes to render very large batches in parallel.
+        :return: Dictionary with the rendered configurations, keyed like `template_vars` (by \
+        position for a list).
+        :raise TemplateNotImplemented: The template specified in template_name does not exist in \
+        the default path or in the custom path if any specified using parameter `template_path`.
+        :raise TemplateRenderException: The template could not be rendered.
+        """
+        return napalm_base.helpers.render_templates(cls,
+                                                    template_name,
+                                                    template_vars,
+                                                    template_source=template_source,
+                                                    template_path=template_path,
+                                                    processes=processes)
+
     def load_replace_candidate(self, filename=None, config=None):
         """
         Populates the candidate configuration. You can populate it from a file or from a string.
@@ -196,6 +284,37 @@ class NetworkDriver(object):
         """
         raise NotImplementedError
 
+    def get_many(self, getters, return_exceptions=False):
+        """
+        Runs several getters and returns their results, in the same order as requested.
+
+        The base implementation calls the getters one after the other. Drivers can override it
+        to combine the requests into a single RPC or CLI round trip.
+
+        :param getters: List of getter names, or tuples (getter name, dictionary of kwargs).
+        :param return_exceptions: (bool) If True, the exception raised by a getter is returned
+            in place of its result, instead of being raised.
+        :return: A list with the result of each getter.
+
+        Example::
+
+            >>> device.get_many(['get_facts', ('get_route_to', {'destination': '1.0.4.0/24'})])
+            [{'hostname': u'eos-router', ...}, {u'1.0.4.0/24': [...]}]
+        """
+        results = []
+        for getter in getters:
+            if isinstance(getter, (list, tuple)):
+                name, kwargs = getter
+            else:
+                name, kwargs = getter, {}
+            try:
+                results.append(getattr(self, name)(**(kwargs or {})))
+            except Exception as e:
+                if not return_exceptions:
+                    raise
+                results.append(e)
+        return results
+
     def get_facts(self):
         """
         Returns a dictionary containing the following information:
@@ -726,6 +845,20 @@ class NetworkDriver(object):
         """
         raise NotImplementedError
 
+    def iter_bgp_neighbors_detail(self, neighbor_address=''):
+        """
+        Yields tuples (vrf, remote_as, neighbor) one at a time, see `get_bgp_neighbors_detail`
+        for the format of neighbor.
+
+        The base implementation iterates over the output of `get_bgp_neighbors_detail`. Drivers
+        can override it to stream the neighbors as they are received from the device.
+        """
+        neighbors = self.get_bgp_neighbors_detail(neighbor_address=neighbor_address)
+        for vrf, vrf_ases in neighbors.items():
+            for remote_as, neighbor_list in vrf_ases.items():
+                for neighbor in neighbor_list:
+                    yield vrf, remote_as, neighbor
+
     def get_arp_table(self):
 
         """
@@ -755,6 +888,16 @@ class NetworkDriver(object):
         """
         raise NotImplementedError
 
+    def iter_arp_table(self):
+        """
+        Yields the entries of the ARP table one at a time, see `get_arp_table` for the format.
+
+        The base implementation iterates over the output of `get_arp_table`. Drivers can
+        override it to stream the entries as they are received from the device.
+        """
+        for entry in self.get_arp_table():
+            yield entry
+
     def get_ntp_peers(self):
 
         """
@@ -935,6 +1078,17 @@ class NetworkDriver(object):
         """
         raise NotImplementedError
 
+    def iter_mac_address_table(self):
+        """
+        Yields the entries of the MAC address table one at a time, see `get_mac_address_table`
+        for the format.
+
+        The base implementation iterates over the output of `get_mac_address_table`. Drivers can
+        override it to stream the entries as they are received from the device.
+        """
+        for entry in self.get_mac_address_table():
+            yield entry
+
     def get_route_to(self, destination='', protocol=''):
 
         """
@@ -1007,6 +1161,18 @@ class NetworkDriver(object):
         """
         raise NotImplementedError
 
+    def iter_route_to(self, destination='', protocol=''):
+        """
+        Yields tuples (prefix, route) one at a time, see `get_route_to` for the format of route.
+
+        The base implementation iterates over the output of `get_route_to`. Drivers can override
+        it to stream the routes as they are received from the device.
+        """
+        for prefix, routes in self.get_route_to(destination=destination,
+                                                protocol=protocol).items():
+            for route in routes:
+                yield prefix, route
+
     def get_snmp_information(self):
 
         """
@@ -1569,6 +1735,17 @@ class NetworkDriver(object):
         """
         raise NotImplementedError
 
+    def iter_ipv6_neighbors_table(self):
+        """
+        Yields the entries of the IPv6 neighbors table one at a time, see
+        `get_ipv6_neighbors_table` for the format.
+
+        The base implementation iterates over the output of `get_ipv6_neighbors_table`. Drivers
+        can override it to stream the entries as they are received from the device.
+        """
+        for entry in self.get_ipv6_neighbors_table():
+            yield entry
+
     def compliance_report(self, validation_file=None, validation_source=None):
         """
         Return a compliance report.
@@ -1577,7 +1754,8 @@ class NetworkDriver(object):
         report file. See https://napalm.readthedocs.io/en/latest/validate/index.html.
 
         :param validation_file: Path to the file containing compliance definition. Default is None.
-        :param validation_source: Dictionary containing compliance rules.
+        :param validation_source: Dictionary containing compliance rules, or a plan compiled with
+            `napalm_base.validate.compile_plan`, which can be reused across devices.
         :raise ValidationException: File is not valid.
         :raise NotImplementedError: Method not implemented.
         """
@@ -0,0 +1,187 @@
+# Copyright 2017 Dravetech AB. All rights reserved.
+#
+# The contents of this file are licensed under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with the
+# License. You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations under
+# the License.
+
+"""
+TTL cache for the results of the getters.
+
+Enabled per device through `optional_args`:
+
+.. code-block:: python
+
+    >>> device = driver(hostname, username, password, optional_args={
+    ...     'getter_cache': {'ttl': 30, 'ttls': {'get_facts': 300}, 'maxsize': 256},
+    ... })
+    >>> device.get_facts()  # hits the device
+    >>> device.get_facts()  # served from the cache for the next 300 seconds
+    >>> device.getter_cache.stats()
+    {'hits': 1, 'misses': 1, 'size': 1, 'getters': {'get_facts': {'hits': 1, 'misses': 1}}}
+
+or with `NetworkDriver.enable_getter_cache`. The cache is cleared by `load_merge_candidate`,
+`load_replace_candidate`, `commit_config` and `rollback`.
+"""
+
+# Python3 support
+from __future__ import print_function
+from __future__ import unicode_literals
+
+# Python std lib
+import copy
+import time
+import functools
+import weakref
+import threading
+from collections import OrderedDict
+
+# local modules
+from napalm_base.helpers import freeze
+
+
+DEFAULT_TTL = 60  # seconds
+DEFAULT_MAXSIZE = 128
+
+# getters that are not cached themselves
+UNCACHED_GETTERS = (
+    'get_many',  # calls the other getters, which are cached
+)
+
+# methods that change the state of the device and clear the cache
+INVALIDATING_METHODS = (
+    'load_merge_candidate',
+    'load_replace_candidate',
+    'commit_config',
+    'rollback',
+)
+
+
+class GetterCache(object):
+    """
+    Size-bounded LRU cache whose entries expire after a per-getter TTL.
+
+    :param ttl: (int) Default time to live, in seconds, of the cached results.
+    :param ttls: (dict) Time to live per getter name, overriding `ttl`. 0 disables the cache for
+        that getter.
+    :param maxsize: (int) Maximum number of results kept. The least recently used is discarded.
+    :param copy: (bool) Return a copy of the cached results, so callers can safely modify them.
+    """
+
+    def __init__(self, ttl=DEFAULT_TTL, ttls=None, maxsize=DEFAULT_MAXSIZE, copy=True):
+        self.ttl = ttl
+        self.ttls = dict(ttls or {})
+        self.maxsize = maxsize
+        self.copy = copy
+        self.hits = 0
+        self.misses = 0
+        self._counters = {}
+        self._entries = OrderedDict()  # key -> (expiration, result), least recently used first
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def ttl_for(self, getter):
+        return self.ttls.get(getter, self.ttl)
+
+    def _count(self, getter, hit):
+        counters = self._counters.setdefault(getter, {'hits': 0, 'misses': 0})
+        if hit:
+            self.hits += 1
+            counters['hits'] += 1
+        else:
+            self.misses += 1
+            counters['misses'] += 1
+
+    def _copy(self, result):
+        return copy.deepcopy(result) if self.copy else result
+
+    def call(self, getter, method, *args, **kwargs):
+        """
+        Return the result of `method(device, *args, **kwargs)`, from the cache when possible.
+
+        `args` must start with the device.
+        """
+        ttl = self.ttl_for(getter)
+        if not ttl:
+            return method(*args, **kwargs)
+
+        key = (getter, freeze(args[1:]), freeze(kwargs))  # args[0] is the device
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                self._entries.pop(key)
+                self._entries[key] = entry
+                self._count(getter, hit=True)
+                return self._copy(entry[1])
+            self._count(getter, hit=False)
+
+        result = method(*args, **kwargs)
+
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (now + ttl, result)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return self._copy(result)
+
+    def clear(self):
+        """Discard all the cached results. The counters are kept."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        """Return the hit and miss counters, globally and per getter."""
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'size': len(self._entries),
+                'getters': copy.deepcopy(self._counters),
+            }
+
+
+def _cached_getter(cache, name, device, function):
+    @functools.wraps(function)
+    def getter(*args, **kwargs):
+        return cache.call(name, function, device(), *args, **kwargs)
+    return getter
+
+
+def _invalidating_method(cache, device, function):
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        cache.clear()
+        try:
+            return function(device(), *args, **kwargs)
+        finally:
+            cache.clear()
+    return wrapper
+
+
+def install(device, cache):
+    """
+    Wrap the getters of `device` with `cache`.
+
+    The wrappers are set as attributes of the instance, shadowing the methods of the class.
+    """
+    cls = type(device)
+    # weak reference, the wrappers are stored in the device itself
+    ref = weakref.ref(device)
+    for name in dir(cls):
+        if name.startswith('get_') and name not in UNCACHED_GETTERS and \
+                callable(getattr(cls, name)):
+            setattr(device, name, _cached_getter(cache, name, ref, getattr(cls, name)))
+    for name in INVALIDATING_METHODS:
+        setattr(device, name, _invalidating_method(cache, ref, getattr(cls, name)))
+    device.getter_cache = cache
+    return cache
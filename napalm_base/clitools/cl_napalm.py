@@ -5,10 +5,13 @@ from __future__ import unicode_literals
 # import helpers
 from napalm_base import get_network_driver
 from napalm_base.clitools import helpers
+from napalm_base.records import to_plain
+from napalm_base.utils import py23_compat
 
 # stdlib
 import pip
 import json
+import types
 import logging
 import argparse
 import getpass
@@ -111,18 +114,22 @@ def build_help():
         help='Only returns diff, it does not deploy the configuration.',
     )
 
-    call = subparser.add_parser('call', help='Call a napalm method')
+    call = subparser.add_parser('call', help='Call one or more napalm methods')
     call.set_defaults(which='call')
     call.add_argument(
         dest='method',
         action='store',
-        help='Run this method'
+        nargs='+',
+        help='Run this method. When several methods are specified, they are requested at once '
+             'and the results are printed in a dictionary keyed by method name. The entries '
+             'returned by a single iter_* method are printed one JSON document per line.'
     )
     call.add_argument(
         '--method-kwargs', '-k',
         dest='method_kwargs',
         action='store',
-        help='kwargs to pass to the method. For example: "destination=1.1.1.1,protocol=bgp"'
+        help='kwargs to pass to the method. For example: "destination=1.1.1.1,protocol=bgp". '
+             'Only accepted when a single method is called.'
     )
 
     validate = subparser.add_parser('validate', help='Validate configuration/state')
@@ -134,6 +141,9 @@ def build_help():
     )
     args = parser.parse_args()
 
+    if getattr(args, 'which', None) == 'call' and len(args.method) > 1 and args.method_kwargs:
+        parser.error('--method-kwargs can only be used when calling a single method')
+
     if args.password is None:
         password = getpass.getpass('Enter password: ')
         setattr(args, 'password', password)
@@ -232,12 +242,21 @@ def configuration_change(device, config_file, strategy, dry_run):
 
 @debugging("method")
 def call_getter(device, method, **kwargs):
-    logger.debug("{} - Attempting to resolve method".format(method))
-    func = getattr(device, method)
-    logger.debug("{} - Attempting to call method with kwargs: {}".format(method, kwargs))
-    r = func(**kwargs)
-    logger.debug("{} - Response".format(method))
-    print(json.dumps(r, indent=4))
+    methods = [method] if isinstance(method, py23_compat.string_types) else method
+    logger.debug("{} - Attempting to call methods with kwargs: {}".format(methods, kwargs))
+    results = device.get_many([(m, kwargs) for m in methods])
+    logger.debug("{} - Response".format(methods))
+    if len(methods) == 1 and isinstance(results[0], types.GeneratorType):
+        # iter_* methods: print the entries as they come, one JSON document per line
+        for entry in results[0]:
+            print(json.dumps(to_plain(entry)))
+        return
+    # the records (optional_args getter_records) are printed as objects, not as arrays
+    results = [to_plain(list(r) if isinstance(r, types.GeneratorType) else r) for r in results]
+    if len(methods) == 1:
+        print(json.dumps(results[0], indent=4))
+    else:
+        print(json.dumps(dict(zip(methods, results)), indent=4))
 
 
 @debugging("compliance_report")
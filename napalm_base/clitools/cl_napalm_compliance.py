@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+'''
+NAPALM CLI Tools: compliance
+============================
+
+Checking the compliance of many devices from the shell.
+
+The inventory is a YAML (or JSON) file with a list of devices::
+
+    - hostname: edge01
+      driver: eos
+      optional_args:
+        port: 443
+    - hostname: core01
+      driver: junos
+      username: admin
+      password: secret
+
+The driver, username and password default to the command line options. A report is printed per
+device, as a JSON document per line, as soon as the device is done. The exit status is 0 when
+all the devices comply, 1 otherwise.
+'''
+from __future__ import absolute_import
+from __future__ import print_function
+from __future__ import unicode_literals
+
+# import helpers
+from napalm_base import compliance
+from napalm_base import validate
+from napalm_base.clitools.helpers import parse_optional_args
+
+# stdlib
+import sys
+import getpass
+import argparse
+
+
+def build_help():
+    parser = argparse.ArgumentParser(
+        description='Check the compliance of the devices of an inventory with a validation file '
+                    'using NAPALM. A JSON report is printed per device and per line.',
+    )
+    parser.add_argument(
+        dest='inventory',
+        action='store',
+        help='YAML or JSON file containing the list of devices.'
+    )
+    parser.add_argument(
+        dest='validation_file',
+        action='store',
+        help='Validation file containing resources desired states.'
+    )
+    parser.add_argument(
+        '--user', '-u',
+        dest='user',
+        action='store',
+        default=getpass.getuser(),
+        help='Default user for authenticating to the devices. Default: user running the script.'
+    )
+    parser.add_argument(
+        '--password', '-p',
+        dest='password',
+        action='store',
+        help='Default password for authenticating to the devices. If a device has no password '
+             'and you do not provide one in the CLI you will be prompted.',
+    )
+    parser.add_argument(
+        '--vendor', '-v',
+        dest='vendor',
+        action='store',
+        help='Default operating system of the devices.'
+    )
+    parser.add_argument(
+        '--optional_args', '-o',
+        dest='optional_args',
+        action='store',
+        help='String with comma separated key=value pairs passed via optional_args to the '
+             'drivers, updated with the optional_args of each device.',
+    )
+    parser.add_argument(
+        '--workers', '-w',
+        dest='workers',
+        action='store',
+        type=int,
+        default=10,
+        help='Maximum number of devices handled concurrently. Default: 10.'
+    )
+    parser.add_argument(
+        '--processes',
+        dest='processes',
+        action='store',
+        type=int,
+        help='Evaluate the reports in a pool of that many processes.'
+    )
+    parser.add_argument(
+        '--timeout', '-t',
+        dest='timeout',
+        action='store',
+        type=float,
+        help='Time in seconds allowed per device.'
+    )
+    return parser.parse_args()
+
+
+def load_inventory(filename, vendor=None, user=None, password=None, optional_args=None):
+    """Return the devices of the inventory file, with the defaults given."""
+    import yaml
+
+    with open(filename, 'r') as stream:
+        entries = yaml.safe_load(stream) or []
+
+    inventory = []
+    for entry in entries:
+        device_optional_args = dict(optional_args or {})
+        device_optional_args.update(entry.get('optional_args') or {})
+        inventory.append({
+            'driver': entry.get('driver', vendor),
+            'hostname': entry['hostname'],
+            'username': entry.get('username', user),
+            'password': entry.get('password', password),
+            'optional_args': device_optional_args,
+        })
+    return inventory
+
+
+def main():
+    args = build_help()
+    inventory = load_inventory(args.inventory, vendor=args.vendor, user=args.user,
+                               password=args.password,
+                               optional_args=parse_optional_args(args.optional_args))
+    if any(device['password'] is None for device in inventory):
+        password = getpass.getpass('Enter password: ')
+        for device in inventory:
+            if device['password'] is None:
+                device['password'] = password
+
+    plan = validate.compile_plan(validation_file=args.validation_file)
+    results = compliance.run_compliance(inventory, plan, max_workers=args.workers,
+                                        processes=args.processes, timeout=args.timeout)
+    sys.exit(0 if compliance.write_json_lines(results, sys.stdout) else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,207 @@
+# Copyright 2017 Dravetech AB. All rights reserved.
+#
+# The contents of this file are licensed under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with the
+# License. You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations under
+# the License.
+
+"""
+Columnar export of the output of the table getters.
+
+The columns and their types are taken from the models in `napalm_base.test.models`, so the
+output can be handed to analytics libraries without going through a list of dictionaries:
+
+.. code-block:: python
+
+    >>> columns = to_columns('get_arp_table', device.get_arp_table())
+    >>> pyarrow.table(columns)  # or pandas.DataFrame(columns)
+
+    >>> counters = to_structured_array('get_interfaces_counters',
+    ...                                device.get_interfaces_counters())
+    >>> counters['rx_octets'].sum()
+
+The getters returning a dictionary get an extra key column (e.g. "interface" for
+`get_interfaces_counters`). The output of getters returning records (see
+`napalm_base.records`) is accepted as well. NumPy is only required by the functions returning
+arrays.
+"""
+
+# Python3 support
+from __future__ import print_function
+from __future__ import unicode_literals
+
+# Python std lib
+import operator
+from collections import OrderedDict
+
+# local modules
+from napalm_base import records
+from napalm_base.test import models
+from napalm_base.utils import py23_compat
+
+
+# name of the column holding the keys of the getters returning a dictionary
+KEY_COLUMNS = {
+    'get_interfaces': 'interface',
+    'get_interfaces_counters': 'interface',
+    'get_route_to': 'prefix',
+}
+
+# NumPy dtype of the types used by the models, anything else is stored as an object
+_DTYPES = {
+    int: 'i8',
+    float: 'f8',
+    bool: '?',
+}
+
+
+def _numpy():
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError("numpy is required to build arrays, install it with "
+                          "'pip install numpy'")
+    return numpy
+
+
+def _schema(getter):
+    try:
+        model_name, shape = records.TABLE_GETTERS[getter]
+    except KeyError:
+        raise ValueError("{} can't be exported as columns, supported getters are: {}".format(
+            getter, ', '.join(sorted(records.TABLE_GETTERS))))
+    return getattr(models, model_name), shape
+
+
+def _rows(output, shape):
+    """Return the keys (`None` for lists) and the rows of `output` in matching order."""
+    if shape == 'list':
+        return None, list(output)
+    if shape == 'dict':
+        keys = list(output)
+        return keys, [output[key] for key in keys]
+    keys, rows = [], []
+    for key, key_rows in output.items():
+        keys.extend([key] * len(key_rows))
+        rows.extend(key_rows)
+    return keys, rows
+
+
+def _table(getter, output):
+    """Return the model, the sorted fields, the keys and the rows of the output of `getter`."""
+    model, shape = _schema(getter)
+    keys, rows = _rows(output, shape)
+    return model, sorted(model), keys, rows
+
+
+def _field_getter(fields, rows, selected):
+    """Return a function extracting the `selected` fields from each row, in that order."""
+    if rows and isinstance(rows[0], records.Record):
+        # the fields of the records are sorted as well
+        return operator.itemgetter(*[fields.index(field) for field in selected])
+    return operator.itemgetter(*selected)
+
+
+def to_columns(getter, output):
+    """
+    Return the output of `getter` as an ordered dictionary of columns (lists), accepted by
+    `pyarrow.table` or `pandas.DataFrame`.
+
+    :param getter: (str) Name of the getter, one of `napalm_base.records.TABLE_GETTERS`.
+    :param output: The output of the getter.
+    """
+    model, fields, keys, rows = _table(getter, output)
+    columns = OrderedDict()
+    if keys is not None:
+        columns[KEY_COLUMNS[getter]] = keys
+    for field in fields:
+        columns[field] = list(map(_field_getter(fields, rows, [field]), rows))
+    return columns
+
+
+def to_structured_array(getter, output):
+    """
+    Return the output of `getter` as a NumPy structured array, one element per row.
+
+    Integers, floats and booleans use the native dtypes (int64, float64 and bool), strings are
+    stored as fixed-width unicode and anything else (e.g. the protocol attributes of the routes)
+    as objects.
+
+    :param getter: (str) Name of the getter, one of `napalm_base.records.TABLE_GETTERS`.
+    :param output: The output of the getter.
+    """
+    numpy = _numpy()
+    model, fields, keys, rows = _table(getter, output)
+
+    columns = OrderedDict()
+    if keys is not None:
+        columns[KEY_COLUMNS[getter]] = numpy.array(keys, dtype='U')
+
+    # the fields sharing a native dtype are converted at once, as a 2-D block
+    blocks = OrderedDict()
+    for field in fields:
+        dtype = _DTYPES.get(model[field])
+        if dtype is not None:
+            blocks.setdefault(dtype, []).append(field)
+        else:
+            values = list(map(_field_getter(fields, rows, [field]), rows))
+            if model[field] is py23_compat.text_type:
+                columns[field] = numpy.array(values, dtype='U')
+            else:
+                columns[field] = numpy.empty(len(values), dtype='O')
+                columns[field][:] = values
+    for dtype, selected in blocks.items():
+        block = numpy.array(list(map(_field_getter(fields, rows, selected), rows)), dtype=dtype)
+        block = block.reshape(len(rows), len(selected))
+        for index, field in enumerate(selected):
+            columns[field] = block[:, index]
+
+    names = ([KEY_COLUMNS[getter]] if keys is not None else []) + fields
+    array = numpy.empty(len(rows), dtype=[(str(name), columns[name].dtype) for name in names])
+    for name in names:
+        array[str(name)] = columns[name]
+    return array
+
+
+def counter_rates(before, after, interval):
+    """
+    Compute the rate per second of every counter between two snapshots of
+    `get_interfaces_counters`.
+
+    Only the interfaces present in both snapshots are returned. The rate is NaN when it can't
+    be computed: the counter is not supported (-1) or it went backwards (reset or wrap).
+
+    :param before: The first snapshot, as returned by `get_interfaces_counters` or by
+        `to_structured_array`.
+    :param after: The second snapshot, in the same format.
+    :param interval: (float) Time in seconds between the snapshots.
+    :return: NumPy structured array with an "interface" field and a float64 field per counter.
+    """
+    numpy = _numpy()
+    if interval <= 0:
+        raise ValueError("The interval must be positive, got {}".format(interval))
+    if isinstance(before, dict):
+        before = to_structured_array('get_interfaces_counters', before)
+    if isinstance(after, dict):
+        after = to_structured_array('get_interfaces_counters', after)
+
+    interfaces, index_before, index_after = numpy.intersect1d(
+        before['interface'], after['interface'], assume_unique=True, return_indices=True)
+
+    counters = sorted(models.interface_counters)
+    rates = numpy.empty(len(interfaces), dtype=[(str('interface'), interfaces.dtype)] +
+                        [(str(name), 'f8') for name in counters])
+    rates['interface'] = interfaces
+    for name in counters:
+        first = before[name][index_before]
+        last = after[name][index_after]
+        valid = (first >= 0) & (last >= first)
+        rates[name] = numpy.where(valid, (last - first) / float(interval), numpy.nan)
+    return rates
@@ -0,0 +1,162 @@
+# Copyright 2017 Dravetech AB. All rights reserved.
+#
+# The contents of this file are licensed under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with the
+# License. You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations under
+# the License.
+
+"""
+Check the compliance of many devices with a validation plan.
+
+Example:
+
+.. code-block:: python
+
+    >>> plan = validate.compile_plan('validate.yml')
+    >>> results = run_compliance(inventory, plan, max_workers=50, processes=4)
+    >>> all_comply = write_json_lines(results, sys.stdout)
+
+The getters required by the plan are collected once per device, concurrently for up to
+`max_workers` devices (see `napalm_base.executor`). The reports are evaluated in the thread that
+collected the results or, with `processes`, in a pool of processes, which is worth it when the
+comparisons are CPU heavy (large tables, many devices).
+"""
+
+# Python3 support
+from __future__ import print_function
+from __future__ import unicode_literals
+
+# Python std lib
+import json
+from collections import namedtuple
+from concurrent import futures
+
+# local modules
+import napalm_base.exceptions
+import napalm_base.constants as c
+from napalm_base import executor
+from napalm_base import validate
+from napalm_base.utils import py23_compat
+
+
+class ComplianceResult(namedtuple('ComplianceResult', 'device report exception')):
+    """
+    The outcome of checking the compliance of a device.
+
+    * device - the `Device` of the inventory, see `napalm_base.executor`.
+    * report - the compliance report, as returned by `compliance_report`, `None` when an
+      exception prevented building it.
+    * exception - the exception that prevented building the report (connection failure,
+      timeout, getter failure), `None` otherwise.
+    """
+
+    __slots__ = ()
+
+    @property
+    def complies(self):
+        return self.exception is None and self.report["complies"]
+
+    def to_dict(self):
+        """Return the result as a dictionary that can be serialized to JSON."""
+        driver = self.device.driver
+        if not isinstance(driver, py23_compat.string_types):
+            driver = driver.__name__
+        exception = None
+        if self.exception is not None:
+            exception = "{}: {}".format(type(self.exception).__name__, self.exception)
+        return {
+            "hostname": self.device.hostname,
+            "driver": driver,
+            "complies": self.complies,
+            "report": self.report,
+            "exception": exception,
+        }
+
+    def to_json(self):
+        """Return the result as a JSON document on a single line."""
+        return json.dumps(self.to_dict(), default=py23_compat.text_type)
+
+
+def _evaluate(plan, actual_results):
+    return plan.evaluate(actual_results)
+
+
+def _check(device, plan, getters, driver_timeout, pool, processes):
+    with executor._connection(device, driver_timeout, pool) as connection:
+        actual_results = connection.get_many(getters, return_exceptions=True)
+        for result in actual_results:
+            if isinstance(result, napalm_base.exceptions.ConnectionException):
+                raise result
+
+    if processes is None:
+        report = _evaluate(plan, actual_results)
+    else:
+        report = processes.submit(_evaluate, plan, actual_results).result()
+    return ComplianceResult(device, report, None)
+
+
+def run_compliance(inventory, validation_plan, max_workers=10, processes=None, timeout=None,
+                   driver_timeout=c.TIMEOUT, pool=None):
+    """
+    Check the compliance of every device of `inventory` with `validation_plan` and yield a
+    `ComplianceResult` per device, as soon as each device is done.
+
+    :param inventory: Iterable of `napalm_base.executor.Device`, or of tuples/dictionaries with
+        the same fields: (driver, hostname, username, password[, optional_args]).
+    :param validation_plan: A `ValidationPlan` compiled with `validate.compile_plan`, the path
+        of a validation file or a validation source.
+    :param max_workers: (int) Maximum number of devices handled concurrently.
+    :param processes: (int) Evaluate the reports in a pool of that many processes, instead of
+        in the threads collecting the results.
+    :param timeout: (int) Time in seconds allowed per device, to collect the results and
+        evaluate the report, see `napalm_base.executor.run_getters`.
+    :param driver_timeout: (int) The `timeout` argument passed to the drivers.
+    :param pool: (DriverPool) Borrow the sessions from this pool instead of opening and closing
+        a new one for each device.
+    """
+    if isinstance(validation_plan, py23_compat.string_types):
+        plan = validate.compile_plan(validation_file=validation_plan)
+    else:
+        plan = validate.compile_plan(validation_source=validation_plan)
+    getters = plan.getters()
+    devices = [executor._as_device(entry) for entry in inventory]
+
+    process_pool = None
+    if processes is not None:
+        process_pool = futures.ProcessPoolExecutor(max_workers=processes)
+
+    def check(device):
+        return _check(device, plan, getters, driver_timeout, pool, process_pool)
+
+    def failed(device, exception):
+        return ComplianceResult(device, None, exception)
+
+    try:
+        for result in executor._run(devices, check, failed, max_workers, timeout):
+            yield result
+    finally:
+        if process_pool is not None:
+            process_pool.shutdown(wait=False)
+
+
+def write_json_lines(results, stream):
+    """
+    Write the `ComplianceResult` yielded by `run_compliance` to `stream`, one JSON document per
+    line, as soon as they are available.
+
+    :return: (bool) Whether all the devices comply.
+    """
+    complies = True
+    for result in results:
+        stream.write(result.to_json())
+        stream.write("\n")
+        stream.flush()
+        complies = complies and result.complies
+    return complies
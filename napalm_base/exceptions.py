@@ -59,6 +59,15 @@ class ConnectionClosedException(ConnectionException):
     pass
 
 
+class PoolExhaustedError(ConnectionException):
+    '''
+    No session could be obtained from the
+    connection pool before the timeout: all
+    the sessions allowed are in use.
+    '''
+    pass
+
+
 class ReplaceConfigException(Exception):
     pass
 
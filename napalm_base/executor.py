@@ -0,0 +1,212 @@
+# Copyright 2017 Dravetech AB. All rights reserved.
+#
+# The contents of this file are licensed under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with the
+# License. You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations under
+# the License.
+
+"""
+Run getters across many devices concurrently.
+
+Example:
+
+.. code-block:: python
+
+    >>> inventory = [
+    ...     ('eos', 'edge01', 'admin', 'secret', {'port': 443}),
+    ...     ('junos', 'core01', 'admin', 'secret'),
+    ... ]
+    >>> getters = ['get_facts', ('get_route_to', {'destination': '1.1.1.1'})]
+    >>> for result in run_getters(inventory, getters, max_workers=50, timeout=120):
+    ...     if result.exception:
+    ...         print(result.device.hostname, 'failed:', result.exception)
+    ...     else:
+    ...         print(result.device.hostname, result.results['get_facts']['os_version'])
+"""
+
+# Python3 support
+from __future__ import print_function
+from __future__ import unicode_literals
+
+# Python std lib
+import time
+from collections import namedtuple
+from contextlib import contextmanager
+from concurrent import futures
+
+# local modules
+import napalm_base.exceptions
+import napalm_base.constants as c
+from napalm_base.utils import py23_compat
+
+
+class Device(namedtuple('Device', 'driver hostname username password optional_args')):
+    """
+    A device of the inventory.
+
+    `driver` is either a driver name, as accepted by `get_network_driver`, or a driver class.
+    """
+
+    __slots__ = ()
+
+    def __new__(cls, driver, hostname, username, password, optional_args=None):
+        return super(Device, cls).__new__(cls, driver, hostname, username, password,
+                                          optional_args or {})
+
+
+class DeviceResult(namedtuple('DeviceResult', 'device results errors exception')):
+    """
+    The outcome of running the getters on a device.
+
+    * device - the `Device` of the inventory.
+    * results - dictionary with the output of each getter that succeeded, keyed by getter name.
+    * errors - dictionary with the exception raised by each getter that failed.
+    * exception - the exception that prevented running the getters at all (connection failure,
+      timeout), `None` otherwise.
+    """
+
+    __slots__ = ()
+
+
+def _as_device(entry):
+    if isinstance(entry, Device):
+        return entry
+    if isinstance(entry, dict):
+        return Device(**entry)
+    return Device(*entry)
+
+
+def _as_getter(getter):
+    """Return a (name, kwargs) tuple out of a getter name or a (name, kwargs) tuple."""
+    if isinstance(getter, py23_compat.string_types):
+        return getter, {}
+    name, kwargs = getter
+    return name, kwargs or {}
+
+
+@contextmanager
+def _connection(device, driver_timeout, pool):
+    """Open a session to `device`, or borrow one from `pool`, for the duration of the block."""
+    driver = device.driver
+    if isinstance(driver, py23_compat.string_types):
+        from napalm_base import get_network_driver
+        driver = get_network_driver(driver)
+
+    if pool is not None:
+        with pool.connection(driver, device.hostname, device.username, device.password,
+                             timeout=driver_timeout,
+                             optional_args=device.optional_args) as connection:
+            yield connection
+    else:
+        connection = driver(device.hostname, device.username, device.password,
+                            timeout=driver_timeout, optional_args=device.optional_args)
+        connection.open()
+        try:
+            yield connection
+        finally:
+            connection.close()
+
+
+def _collect(device, getters, driver_timeout, pool):
+    results, errors = {}, {}
+    with _connection(device, driver_timeout, pool) as connection:
+        for name, kwargs in getters:
+            try:
+                results[name] = getattr(connection, name)(**kwargs)
+            except napalm_base.exceptions.ConnectionException:
+                raise
+            except Exception as e:
+                errors[name] = e
+    return DeviceResult(device, results, errors, None)
+
+
+def _run(devices, task, failed, max_workers, timeout):
+    """
+    Call `task(device)` for every device in a pool of threads and yield the results as soon as
+    they are available.
+
+    `failed(device, exception)` builds the result of the devices whose task raised an exception
+    or exceeded `timeout`, see `run_getters`.
+    """
+    started = {}  # index of the device in the inventory -> time a worker picked it
+    pending = {}  # future -> index of the device in the inventory
+    executor = futures.ThreadPoolExecutor(max_workers=max_workers)
+
+    def run(index):
+        started[index] = time.time()
+        try:
+            return task(devices[index])
+        except Exception as e:
+            return failed(devices[index], e)
+
+    try:
+        for index in range(len(devices)):
+            pending[executor.submit(run, index)] = index
+
+        while pending:
+            wait_for = None
+            if timeout is not None:
+                deadlines = [started[i] + timeout for i in pending.values() if i in started]
+                wait_for = max(min(deadlines) - time.time(), 0) if deadlines else timeout
+
+            done, _ = futures.wait(pending, timeout=wait_for,
+                                   return_when=futures.FIRST_COMPLETED)
+            for future in done:
+                pending.pop(future)
+                yield future.result()
+
+            if timeout is not None:
+                now = time.time()
+                for future, index in list(pending.items()):
+                    if index in started and now - started[index] >= timeout:
+                        pending.pop(future)
+                        exception = napalm_base.exceptions.ConnectTimeoutError(
+                            "{} didn't complete in {} seconds".format(devices[index].hostname,
+                                                                      timeout))
+                        yield failed(devices[index], exception)
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+def run_getters(inventory, getters, max_workers=10, timeout=None, driver_timeout=c.TIMEOUT,
+                pool=None):
+    """
+    Run `getters` on every device of `inventory` and yield a `DeviceResult` per device, as soon
+    as each device is done.
+
+    :param inventory: Iterable of `Device`, or of tuples/dictionaries with the same fields:
+        (driver, hostname, username, password[, optional_args]).
+    :param getters: List of getter names or (getter name, kwargs) tuples. A getter can be
+        requested only once.
+    :param max_workers: (int) Maximum number of devices handled concurrently.
+    :param timeout: (int) Time in seconds allowed per device, from the moment a worker starts
+        with it. When exceeded, a `DeviceResult` with a `ConnectTimeoutError` exception is
+        yielded. The worker can't be interrupted, so it stays busy until the driver returns.
+    :param driver_timeout: (int) The `timeout` argument passed to the drivers.
+    :param pool: (DriverPool) Borrow the sessions from this pool instead of opening and closing
+        a new one for each device.
+    """
+    getters = [_as_getter(g) for g in getters]
+    names = [name for name, _ in getters]
+    if len(set(names)) != len(names):
+        raise ValueError("Each getter can be requested only once: {}".format(names))
+
+    devices = [_as_device(entry) for entry in inventory]
+
+    def collect(device):
+        return _collect(device, getters, driver_timeout, pool)
+
+    def failed(device, exception):
+        return DeviceResult(device, {}, {}, exception)
+
+    for result in _run(devices, collect, failed, max_workers, timeout):
+        yield result
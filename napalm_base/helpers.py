@@ -6,14 +6,15 @@ from __future__ import unicode_literals
 
 # std libs
 import os
+import re
 import sys
+import hashlib
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
 
-# third party libs
-import jinja2
-import jtextfsm as textfsm
-from netaddr import EUI
-from netaddr import mac_unix
-from netaddr import IPAddress
+# third party libs (jinja2, jtextfsm and netaddr) are imported on first use,
+# as they are expensive to import and not needed by most of the users of this module
 
 # local modules
 import napalm_base.exceptions
@@ -24,50 +25,182 @@ from napalm_base.utils import py23_compat
 # ----------------------------------------------------------------------------------------------------------------------
 # helper classes -- will not be exported
 # ----------------------------------------------------------------------------------------------------------------------
-class _MACFormat(mac_unix):
-    pass
+_MACFormat = None
 
 
-_MACFormat.word_fmt = '%.2X'
+def _mac_format():
+    """Return the netaddr dialect used by `mac`, defining it on first use."""
+    global _MACFormat
+    if _MACFormat is None:
+        from netaddr import mac_unix
+
+        class _MACFormat(mac_unix):
+            pass
+
+        _MACFormat.word_fmt = '%.2X'
+    return _MACFormat
+
+
+# Compiled templates are reused across calls to `load_template`: the Jinja2 environments are
+# cached per search path (each one keeping its compiled templates) and the string templates
+# per content hash.
+STRING_TEMPLATE_CACHE_SIZE = 256
+
+_template_cache_lock = threading.Lock()
+_jinja_environments = {}  # search path -> jinja2.Environment
+_string_templates = OrderedDict()  # source hash -> jinja2.Template, least recently used first
+_template_bytecode_cache = os.getenv('NAPALM_TEMPLATE_BYTECODE_CACHE') or None
+
+
+def set_template_bytecode_cache(directory):
+    """
+    Store the bytecode of the compiled file templates in `directory`, so new processes (e.g.
+    workers of a pool) don't have to compile them again. `None` disables it.
+
+    It can be set as well with the `NAPALM_TEMPLATE_BYTECODE_CACHE` environment variable.
+    """
+    global _template_bytecode_cache
+    with _template_cache_lock:
+        _template_bytecode_cache = directory
+        _jinja_environments.clear()
+
+
+def _jinja_environment(search_path):
+    """Return the Jinja2 environment loading the templates from `search_path`."""
+    key = tuple(search_path)
+    environment = _jinja_environments.get(key)
+    if environment is not None:
+        return environment
+
+    import jinja2
+
+    with _template_cache_lock:
+        environment = _jinja_environments.get(key)
+        if environment is None:
+            bytecode_cache = None
+            if _template_bytecode_cache is not None:
+                if not os.path.isdir(_template_bytecode_cache):
+                    os.makedirs(_template_bytecode_cache)
+                bytecode_cache = jinja2.FileSystemBytecodeCache(_template_bytecode_cache)
+            environment = jinja2.Environment(loader=jinja2.FileSystemLoader(search_path),
+                                             bytecode_cache=bytecode_cache)
+            for filter_name, filter_function in CustomJinjaFilters.filters().items():
+                environment.filters[filter_name] = filter_function
+            _jinja_environments[key] = environment
+    return environment
+
+
+def _string_template(template_source):
+    """Return the compiled template of `template_source`."""
+    key = hashlib.sha1(template_source.encode('utf-8')).hexdigest()
+    with _template_cache_lock:
+        template = _string_templates.pop(key, None)
+        if template is not None:
+            _string_templates[key] = template
+            return template
+
+    import jinja2
+
+    template = jinja2.Template(template_source)
+    with _template_cache_lock:
+        _string_templates[key] = template
+        while len(_string_templates) > STRING_TEMPLATE_CACHE_SIZE:
+            _string_templates.popitem(last=False)
+    return template
+
+
+# Compiled TextFSM templates: path -> (mtime, lowercased header, [idle parsers]). A parser is
+# used by one caller at a time and reset before each use.
+TEXTFSM_IDLE_PARSERS = 8
+
+_textfsm_cache_lock = threading.Lock()
+_textfsm_parsers = {}
+
+
+# Fast paths of `macs` and `ips`, for the formats whose normalization doesn't need netaddr. The
+# other values go through `mac` and `ip`, memoized in bounded LRU caches.
+NORMALIZE_CACHE_SIZE = 65536
+
+_MAC_CANONICAL = re.compile(r'^[0-9A-F]{2}(?::[0-9A-F]{2}){5}\Z')
+_MAC_COMMON = re.compile(r'^(?:[0-9A-Fa-f]{2}(?P<sep>[:-])[0-9A-Fa-f]{2}'
+                         r'(?:(?P=sep)[0-9A-Fa-f]{2}){4}'
+                         r'|[0-9A-Fa-f]{4}\.[0-9A-Fa-f]{4}\.[0-9A-Fa-f]{4}'
+                         r'|[0-9A-Fa-f]{12})\Z')
+_IPV4_CANONICAL = re.compile(r'^(?:25[0-5]|2[0-4][0-9]|1[0-9]{2}|[1-9]?[0-9])'
+                             r'(?:\.(?:25[0-5]|2[0-4][0-9]|1[0-9]{2}|[1-9]?[0-9])){3}\Z')
+
+
+def _lru(function, maxsize):
+    """Memoize `function` in a thread-safe LRU cache of `maxsize` entries."""
+    cache = OrderedDict()
+    lock = threading.Lock()
+
+    def cached(*args):
+        with lock:
+            try:
+                result = cache.pop(args)
+            except KeyError:
+                pass
+            else:
+                cache[args] = result
+                return result
+        result = function(*args)
+        with lock:
+            cache[args] = result
+            if len(cache) > maxsize:
+                cache.popitem(last=False)
+        return result
+    cached.cache = cache
+    return cached
+
+
+# compiled XPath expressions used by find_txt, cleared when full
+XPATH_CACHE_SIZE = 1024
+
+_xpath_cache = {}
+
+# as_number results of the ASN strings, cleared when full
+AS_NUMBER_CACHE_SIZE = 4096
+
+_as_number_cache = {}
 
 
 # ----------------------------------------------------------------------------------------------------------------------
 # callable helpers
 # ----------------------------------------------------------------------------------------------------------------------
-def load_template(cls, template_name, template_source=None, template_path=None,
-                  openconfig=False, **template_vars):
+def _render(driver_class, template_name, template_source, template_path, openconfig,
+            template_vars_list):
+    """Render the template once per dictionary of `template_vars_list`, compiling it once."""
+    import jinja2
+
     try:
         search_path = []
         if isinstance(template_source, py23_compat.string_types):
-            template = jinja2.Template(template_source)
+            template = _string_template(template_source)
         else:
             if template_path is not None:
                 if (isinstance(template_path, py23_compat.string_types) and
                         os.path.isdir(template_path) and os.path.isabs(template_path)):
                     # append driver name at the end of the custom path
-                    search_path.append(os.path.join(template_path, cls.__module__.split('.')[-1]))
+                    search_path.append(os.path.join(template_path,
+                                                    driver_class.__module__.split('.')[-1]))
                 else:
                     raise IOError("Template path does not exist: {}".format(template_path))
             else:
                 # Search modules for template paths
                 search_path = [os.path.dirname(os.path.abspath(sys.modules[c.__module__].__file__))
-                               for c in cls.__class__.mro() if c is not object]
+                               for c in driver_class.mro() if c is not object]
 
             if openconfig:
                 search_path = ['{}/oc_templates'.format(s) for s in search_path]
             else:
                 search_path = ['{}/templates'.format(s) for s in search_path]
 
-            loader = jinja2.FileSystemLoader(search_path)
-            environment = jinja2.Environment(loader=loader)
-
-            for filter_name, filter_function in CustomJinjaFilters.filters().items():
-                environment.filters[filter_name] = filter_function
-
+            environment = _jinja_environment(search_path)
             template = environment.get_template('{template_name}.j2'.format(
                 template_name=template_name
             ))
-        configuration = template.render(**template_vars)
+        return [template.render(**template_vars) for template_vars in template_vars_list]
     except jinja2.exceptions.TemplateNotFound:
         raise napalm_base.exceptions.TemplateNotImplemented(
             "Config template {template_name}.j2 not found in search path: {sp}".format(
@@ -82,23 +215,65 @@ def load_template(cls, template_name, template_source=None, template_path=None,
                 error=jinjaerr.message
             )
         )
+
+
+def load_template(cls, template_name, template_source=None, template_path=None,
+                  openconfig=False, **template_vars):
+    configuration, = _render(cls.__class__, template_name, template_source, template_path,
+                             openconfig, [template_vars])
     return cls.load_merge_candidate(config=configuration)
 
 
-def textfsm_extractor(cls, template_name, raw_text):
-    """
-    Applies a TextFSM template over a raw text and return the matching table.
+def _render_chunk(args):
+    """Entry point of the worker processes of `render_templates`."""
+    driver_class, template_name, template_source, template_path, openconfig, chunk = args
+    keys = [key for key, _ in chunk]
+    configurations = _render(driver_class, template_name, template_source, template_path,
+                             openconfig, [template_vars for _, template_vars in chunk])
+    return list(zip(keys, configurations))
 
-    Main usage of this method will be to extract data form a non-structured output
-    from a network device and return the values in a table format.
 
-    :param cls: Instance of the driver class
-    :param template_name: Specifies the name of the template to be used
-    :param raw_text: Text output as the devices prompts on the CLI
-    :return: table-like list of entries
+def render_templates(driver_class, template_name, template_vars, template_source=None,
+                     template_path=None, openconfig=False, processes=None, chunksize=500):
     """
-    textfsm_data = list()
-    cls.__class__.__name__.replace('Driver', '')
+    Render a template once per set of variables, without loading anything on a device.
+
+    The template is compiled once (per worker process when `processes` is set).
+
+    :param driver_class: The driver class, used to find the templates.
+    :param template_name: Identifies the template name.
+    :param template_vars: Dictionary of dictionaries with the arguments of each rendering, keyed
+        by an identifier (e.g. the hostname), or a list of dictionaries.
+    :param template_source: (optional) Custom config template, instead of `template_name`.
+    :param template_path: (optional) Absolute path to directory for the configuration templates.
+    :param openconfig: (bool) Look for the template in the OpenConfig templates.
+    :param processes: (int) Render in a pool of that many processes, for very large batches.
+    :param chunksize: (int) Number of renderings sent at once to each worker process.
+    :return: Dictionary with the rendered configurations, keyed like `template_vars` (by
+        position for a list).
+    """
+    if isinstance(template_vars, dict):
+        items = list(template_vars.items())
+    else:
+        items = list(enumerate(template_vars))
+
+    if not processes or len(items) <= chunksize:
+        return dict(_render_chunk((driver_class, template_name, template_source, template_path,
+                                   openconfig, items)))
+
+    from concurrent import futures
+
+    chunks = [(driver_class, template_name, template_source, template_path, openconfig,
+               items[i:i + chunksize]) for i in range(0, len(items), chunksize)]
+    configurations = {}
+    with futures.ProcessPoolExecutor(max_workers=processes) as executor:
+        for rendered in executor.map(_render_chunk, chunks):
+            configurations.update(rendered)
+    return configurations
+
+
+def _textfsm_template_path(cls, template_name):
+    """Return the directory and the path of the TextFSM template `template_name` of `cls`."""
     current_dir = os.path.dirname(os.path.abspath(sys.modules[cls.__module__].__file__))
     template_dir_path = '{current_dir}/utils/textfsm_templates'.format(
         current_dir=current_dir
@@ -107,35 +282,242 @@ def textfsm_extractor(cls, template_name, raw_text):
         template_dir_path=template_dir_path,
         template_name=template_name
     )
+    return template_dir_path, template_path
+
+
+@contextmanager
+def _textfsm_parser(template_dir_path, template_name, template_path):
+    """
+    Yield the lowercased header and a reset parser for the TextFSM template at `template_path`.
+
+    The parsers are compiled once per version (mtime) of the template file, and given back to
+    the cache after use.
+    """
+    import jtextfsm as textfsm
 
     try:
-        fsm_handler = textfsm.TextFSM(open(template_path))
-    except IOError:
+        mtime = os.path.getmtime(template_path)
+    except (IOError, OSError):
         raise napalm_base.exceptions.TemplateNotImplemented(
             "TextFSM template {template_name}.tpl is not defined under {path}".format(
                 template_name=template_name,
                 path=template_dir_path
             )
         )
-    except textfsm.TextFSMTemplateError as tfte:
-        raise napalm_base.exceptions.TemplateRenderException(
-            "Wrong format of TextFSM template {template_name}: {error}".format(
-                template_name=template_name,
-                error=py23_compat.text_type(tfte)
+
+    parser = None
+    with _textfsm_cache_lock:
+        cached = _textfsm_parsers.get(template_path)
+        if cached is not None and cached[0] == mtime:
+            header, idle = cached[1], cached[2]
+            if idle:
+                parser = idle.pop()
+
+    if parser is None:
+        try:
+            with open(template_path) as template_file:
+                parser = textfsm.TextFSM(template_file)
+        except IOError:
+            raise napalm_base.exceptions.TemplateNotImplemented(
+                "TextFSM template {template_name}.tpl is not defined under {path}".format(
+                    template_name=template_name,
+                    path=template_dir_path
+                )
             )
-        )
+        except textfsm.TextFSMTemplateError as tfte:
+            raise napalm_base.exceptions.TemplateRenderException(
+                "Wrong format of TextFSM template {template_name}: {error}".format(
+                    template_name=template_name,
+                    error=py23_compat.text_type(tfte)
+                )
+            )
+        header = [column.lower() for column in parser.header]
+        with _textfsm_cache_lock:
+            cached = _textfsm_parsers.get(template_path)
+            if cached is None or cached[0] != mtime:
+                _textfsm_parsers[template_path] = (mtime, header, [])
+
+    parser.Reset()
+    yield header, parser
+
+    # not reached when the parsing failed, the parser is dropped
+    with _textfsm_cache_lock:
+        cached = _textfsm_parsers.get(template_path)
+        if cached is not None and cached[0] == mtime and \
+                len(cached[2]) < TEXTFSM_IDLE_PARSERS:
+            cached[2].append(parser)
+
+
+def textfsm_extractor(cls, template_name, raw_text):
+    """
+    Applies a TextFSM template over a raw text and return the matching table.
+
+    Main usage of this method will be to extract data form a non-structured output
+    from a network device and return the values in a table format.
+
+    The compiled templates are cached and reloaded when the template file changes.
+
+    :param cls: Instance of the driver class
+    :param template_name: Specifies the name of the template to be used
+    :param raw_text: Text output as the devices prompts on the CLI
+    :return: table-like list of entries
+    """
+    template_dir_path, template_path = _textfsm_template_path(cls, template_name)
+    return _textfsm_parse(template_dir_path, template_name, template_path, raw_text)
+
+
+def _textfsm_parse(template_dir_path, template_name, template_path, raw_text):
+    with _textfsm_parser(template_dir_path, template_name, template_path) as (header, parser):
+        objects = parser.ParseText(raw_text)
+    return [dict(zip(header, obj)) for obj in objects]
+
+
+def _textfsm_chunk(args):
+    """Entry point of the worker processes of `textfsm_extractor_many`."""
+    jobs, return_exceptions = args
+    results = []
+    for source, template_name, raw_text in jobs:
+        try:
+            if isinstance(source, py23_compat.string_types):
+                template_dir_path = source
+                template_path = os.path.join(source, '{}.tpl'.format(template_name))
+            else:
+                template_dir_path, template_path = _textfsm_template_path(source, template_name)
+            results.append(_textfsm_parse(template_dir_path, template_name, template_path,
+                                          raw_text))
+        except Exception as e:
+            if not return_exceptions:
+                raise
+            results.append(e)
+    return results
+
+
+def textfsm_extractor_many(jobs, processes=None, chunksize=None, return_exceptions=False):
+    """
+    Applies TextFSM templates over many raw texts, optionally in a pool of processes, and
+    returns the matching tables in the same order as `jobs`.
+
+    Each worker process compiles a template once and reuses it for all its jobs.
+
+    :param jobs: List of (source, template name, raw text) tuples. The source is either the
+        driver class (or instance), as for `textfsm_extractor`, or the directory of the template.
+    :param processes: (int) Number of worker processes. By default, the jobs are parsed in the
+        current process.
+    :param chunksize: (int) Number of jobs sent at once to each worker process. By default, the
+        jobs are split in four chunks per process.
+    :param return_exceptions: (bool) If True, the exception raised by a job is returned in place
+        of its table, instead of being raised.
+    :return: List of tables (lists of entries)
+
+    Example:
+
+    .. code-block:: python
+
+        >>> textfsm_extractor_many([
+        ...     (IOSDriver, 'show_mac_address', output) for output in outputs
+        ... ], processes=8)
+    """
+    jobs = list(jobs)
+    if not processes or len(jobs) < 2:
+        return _textfsm_chunk((jobs, return_exceptions))
 
-    objects = fsm_handler.ParseText(raw_text)
+    if chunksize is None:
+        chunksize = max(1, -(-len(jobs) // (processes * 4)))
+    chunks = [(jobs[i:i + chunksize], return_exceptions) for i in range(0, len(jobs), chunksize)]
 
-    for obj in objects:
-        index = 0
-        entry = {}
-        for entry_value in obj:
-            entry[fsm_handler.header[index].lower()] = entry_value
-            index += 1
-        textfsm_data.append(entry)
+    from concurrent import futures
 
-    return textfsm_data
+    results = []
+    with futures.ProcessPoolExecutor(max_workers=processes) as executor:
+        for chunk_results in executor.map(_textfsm_chunk, chunks):
+            results.extend(chunk_results)
+    return results
+
+
+def _textfsm_completed(result, fillup):
+    """
+    Return how many records at the start of `result` are completed, i.e. are not filled up
+    anymore by the records to come: with the `Fillup` values at the positions `fillup`, the
+    records up to the last one that has each of these values.
+    """
+    completed = len(result)
+    for index in fillup:
+        for position in range(completed - 1, -1, -1):
+            if result[position][index]:
+                completed = position + 1
+                break
+        else:
+            return 0
+    return completed
+
+
+def iter_textfsm_extractor(cls, template_name, lines):
+    """
+    Applies a TextFSM template over the lines of a raw text and yields each entry of the
+    matching table as soon as it is complete.
+
+    Unlike `textfsm_extractor`, the whole output doesn't need to be held in memory, e.g. when
+    it is spooled to a file. The compiled templates are shared with `textfsm_extractor`.
+
+    With `Fillup` values, an entry is only yielded once the values filled up from the
+    following entries are known, so the entries are the same as with `textfsm_extractor`.
+
+    This drives the parser line by line with private members of `textfsm.TextFSM` (`_CheckLine`,
+    `_result`, `_cur_state_name` and `_AppendRecord`), as of jtextfsm 0.3.1.
+
+    :param cls: Instance of the driver class
+    :param template_name: Specifies the name of the template to be used
+    :param lines: Iterable of lines (with or without line terminator), such as a file object, or
+        the raw text as a string
+    :return: generator of entries
+
+    Example:
+
+    .. code-block:: python
+
+        >>> with open('show_mac_address-table.txt') as output:
+        ...     for entry in iter_textfsm_extractor(device, 'mac_address_table', output):
+        ...         print(entry['mac'])
+    """
+    if isinstance(lines, py23_compat.string_types):
+        lines = lines.splitlines()
+
+    template_dir_path, template_path = _textfsm_template_path(cls, template_name)
+    with _textfsm_parser(template_dir_path, template_name, template_path) as (header, parser):
+        # same loop as TextFSM.ParseText, but draining the completed records after each line
+        result = parser._result
+        fillup = [i for i, value in enumerate(parser.values) if 'Fillup' in value.OptionNames()]
+        for line in lines:
+            parser._CheckLine(line.rstrip('\r\n'))
+            if result:
+                completed = _textfsm_completed(result, fillup)
+                for obj in result[:completed]:
+                    yield dict(zip(header, obj))
+                del result[:completed]
+            if parser._cur_state_name in ('End', 'EOF'):
+                break
+
+        if parser._cur_state_name != 'End' and 'EOF' not in parser.states:
+            # Implicit EOF performs Next.Record operation
+            parser._AppendRecord()
+        for obj in result:
+            yield dict(zip(header, obj))
+        del result[:]
+
+
+def _xpath(path):
+    """Return the compiled `lxml.etree.XPath` of the string `path`, compiling it once."""
+    try:
+        return _xpath_cache[path]
+    except KeyError:
+        pass
+    from lxml import etree
+
+    compiled = etree.XPath(path)
+    if len(_xpath_cache) >= XPATH_CACHE_SIZE:
+        _xpath_cache.clear()
+    _xpath_cache[path] = compiled
+    return compiled
 
 
 def find_txt(xml_tree, path, default=''):
@@ -143,14 +525,19 @@ def find_txt(xml_tree, path, default=''):
     Extracts the text value from an XML tree, using XPath.
     In case of error, will return a default value.
 
+    String paths are compiled once and then reused.
+
     :param xml_tree: the XML Tree object. Assumed is <type 'lxml.etree._Element'>.
-    :param path:     XPath to be applied, in order to extract the desired data.
+    :param path:     XPath to be applied, in order to extract the desired data. Either a string
+                     or a precompiled `lxml.etree.XPath` object.
     :param default:  Value to be returned in case of error.
     :return: a str value.
     """
     value = ''
     try:
-        xpath_applied = xml_tree.xpath(path)  # will consider the first match only
+        if not callable(path):
+            path = _xpath(path)
+        xpath_applied = path(xml_tree)  # will consider the first match only
         if len(xpath_applied) and xpath_applied[0] is not None:
             xpath_result = xpath_applied[0]
             if isinstance(xpath_result, type(xml_tree)):
@@ -162,6 +549,26 @@ def find_txt(xml_tree, path, default=''):
     return py23_compat.text_type(value)
 
 
+def find_txt_many(xml_tree, paths, default=''):
+    """
+    Extracts several text values from an XML tree, as `find_txt` would for each one.
+
+    :param xml_tree: the XML Tree object. Assumed is <type 'lxml.etree._Element'>.
+    :param paths:    dictionary of XPaths (strings or precompiled `lxml.etree.XPath`), keyed by
+                     the name of the field.
+    :param default:  Value to be returned for the fields that can't be extracted.
+    :return: a dictionary with the str values, keyed like `paths`.
+
+    Example:
+
+    .. code-block:: python
+
+        >>> find_txt_many(interface, {'name': 'name', 'mtu': 'mtu', 'description': 'description'})
+        {'name': u'ge-0/0/0', 'mtu': u'1514', 'description': u''}
+    """
+    return {field: find_txt(xml_tree, path, default) for field, path in paths.items()}
+
+
 def convert(to, who, default=u''):
     """
     Converts data to a specific datatype.
@@ -180,6 +587,25 @@ def convert(to, who, default=u''):
         return default
 
 
+def convert_many(to, values, default=u''):
+    """
+    Converts many values to a specific datatype, the same way as `convert`.
+
+    All the values are converted at once, falling back to converting them one by one, with
+    the default value for the ones that fail, only when needed.
+
+    :param to:      datatype to be casted to.
+    :param values:  iterable of values to cast.
+    :param default: value to return in place of the values that can't be casted.
+    :return: a list with the casted values.
+    """
+    values = list(values)
+    try:
+        return [default if who is None else to(who) for who in values]
+    except:  # noqa
+        return [convert(to, who, default=default) for who in values]
+
+
 def mac(raw):
     """
     Converts a raw string to a standardised MAC Address EUI Format.
@@ -215,7 +641,9 @@ def mac(raw):
             flat_raw=flat_raw,
             zeros_stuffed='0'*(12-len(flat_raw))
         )
-    return py23_compat.text_type(EUI(raw, dialect=_MACFormat))
+    from netaddr import EUI
+
+    return py23_compat.text_type(EUI(raw, dialect=_mac_format()))
 
 
 def ip(addr, version=None):
@@ -241,17 +669,140 @@ def ip(addr, version=None):
         >>> ip('2001:0dB8:85a3:0000:0000:8A2e:0370:7334')
         u'2001:db8:85a3::8a2e:370:7334'
     """
+    from netaddr import IPAddress
+
     addr_obj = IPAddress(addr)
     if version and addr_obj.version != version:
         raise ValueError("{} is not an ipv{} address".format(addr, version))
     return py23_compat.text_type(addr_obj)
 
 
-def as_number(as_number_val):
-    """Convert AS Number to standardized asplain notation as an integer."""
+_mac_cached = _lru(mac, NORMALIZE_CACHE_SIZE)
+_ip_cached = _lru(ip, NORMALIZE_CACHE_SIZE)
+
+
+def _normalize_mac(raw):
+    """Return `mac(raw)`, using the fast paths when possible."""
+    if not isinstance(raw, py23_compat.text_type):
+        raw = py23_compat.text_type(raw)
+    if _MAC_CANONICAL.match(raw):
+        return raw
+    if _MAC_COMMON.match(raw):
+        flat = raw.replace(':', '').replace('-', '').replace('.', '').upper()
+        return ':'.join((flat[0:2], flat[2:4], flat[4:6], flat[6:8], flat[8:10], flat[10:12]))
+    return _mac_cached(raw)
+
+
+def _normalize_ip(addr, version=None):
+    """Return `ip(addr, version)`, using the fast paths when possible."""
+    if not isinstance(addr, py23_compat.text_type):
+        addr = py23_compat.text_type(addr)
+    if version != 6 and _IPV4_CANONICAL.match(addr):
+        return addr
+    return _ip_cached(addr, version)
+
+
+def macs(raw_values):
+    """
+    Converts many raw strings to standardised MAC Addresses, the same way as `mac`.
+
+    The common formats (EUI-48 with ':' or '-' separators, Cisco dotted and bare hexadecimal)
+    are converted without netaddr; the other values are converted by `mac`, with the results
+    memoized.
+
+    :param raw_values: iterable of raw strings containing MAC Addresses
+    :return: a list of strings with the MAC Addresses in EUI format
+
+    Example:
+
+    .. code-block:: python
+
+        >>> macs(['0123.4567.89ab', '01-23-45-67-89-ac'])
+        [u'01:23:45:67:89:AB', u'01:23:45:67:89:AC']
+    """
+    return [_normalize_mac(raw) for raw in raw_values]
+
+
+def ips(addrs, version=None):
+    """
+    Converts many raw strings to valid IP addresses, the same way as `ip`.
+
+    IPv4 addresses already in the standard format are returned as they are; the other values
+    are converted by `ip`, with the results memoized.
+
+    :param addrs: iterable of raw strings containing IP Addresses
+    :param version: (optional) insist on a specific IP address version.
+    :type version: int.
+    :return: a list of strings containing the IP Addresses in a standard format
+
+    Example:
+
+    .. code-block:: python
+
+        >>> ips(['172.17.17.1', '2001:0dB8:85a3:0000:0000:8A2e:0370:7334'])
+        [u'172.17.17.1', u'2001:db8:85a3::8a2e:370:7334']
+    """
+    return [_normalize_ip(addr, version) for addr in addrs]
+
+
+def freeze(value):
+    """
+    Returns a hashable version of `value`, converting dictionaries, lists and sets recursively.
+
+    Useful to build cache keys out of arguments such as `optional_args` or getter kwargs.
+
+    Example:
+
+    .. code-block:: python
+
+        >>> freeze({'port': 22, 'profile': ['eos']})
+        ((u'port', 22), (u'profile', (u'eos',)))
+    """
+    if isinstance(value, dict):
+        return tuple(sorted((k, freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(v) for v in value)
+    if isinstance(value, set):
+        return frozenset(freeze(v) for v in value)
+    return value
+
+
+def _as_number(as_number_val):
     as_number_str = py23_compat.text_type(as_number_val)
     if '.' in as_number_str:
         big, little = as_number_str.split('.')
         return (int(big) << 16) + int(little)
     else:
         return int(as_number_str)
+
+
+def as_number(as_number_val):
+    """Convert AS Number to standardized asplain notation as an integer."""
+    if type(as_number_val) is int:
+        return as_number_val
+    if not isinstance(as_number_val, py23_compat.string_types):
+        return _as_number(as_number_val)
+    # strings only, other types could compare equal to them (e.g. 1.0 and 1)
+    try:
+        return _as_number_cache[as_number_val]
+    except KeyError:
+        pass
+    result = _as_number(as_number_val)
+    if len(_as_number_cache) >= AS_NUMBER_CACHE_SIZE:
+        _as_number_cache.clear()
+    _as_number_cache[as_number_val] = result
+    return result
+
+
+def as_numbers(as_number_values):
+    """
+    Convert many AS Numbers to standardized asplain notation, the same way as `as_number`.
+
+    Example:
+
+    .. code-block:: python
+
+        >>> as_numbers(['64001', '1.100', 65000])
+        [64001, 65636, 65000]
+    """
+    return [as_number(as_number_val) for as_number_val in as_number_values]
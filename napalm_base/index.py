@@ -0,0 +1,231 @@
+# Copyright 2017 Dravetech AB. All rights reserved.
+#
+# The contents of this file are licensed under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with the
+# License. You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations under
+# the License.
+
+"""
+Hash indexes over the output of `get_mac_address_table`, `get_arp_table` and
+`get_interfaces_ip`, replacing linear scans of the tables.
+
+Example:
+
+.. code-block:: python
+
+    >>> index = TableIndex(mac_address_table=device.get_mac_address_table(),
+    ...                    arp_table=device.get_arp_table(),
+    ...                    interfaces_ip=device.get_interfaces_ip())
+    >>> [entry['interface'] for entry in index.mac_table(mac='0001.0203.0405')]
+    [u'Ethernet12']
+    >>> [entry['ip'] for entry in index.arp_table(vlan=100)]
+    [u'10.0.0.12', u'10.0.0.31']
+    >>> index.longest_prefix_match('10.0.0.12')
+    {'interface': u'Vlan100', 'ip': u'10.0.0.1', 'prefix_length': 24}
+
+MAC addresses and IP addresses are normalized with `napalm_base.helpers.mac` and
+`napalm_base.helpers.ip`, both when building the index and when querying it.
+"""
+
+# Python3 support
+from __future__ import print_function
+from __future__ import unicode_literals
+
+# Python std lib
+import socket
+import operator
+import binascii
+from collections import defaultdict
+
+# local modules
+from napalm_base import helpers
+from napalm_base import records
+
+
+def _fields(rows, *names):
+    """Return a function extracting the fields `names` from the rows (dictionaries or records)."""
+    if rows and isinstance(rows[0], records.Record):
+        return operator.attrgetter(*names)
+    return operator.itemgetter(*names)
+
+
+def _address(ip):
+    """Return the version, the number of bits and the integer value of the address `ip`."""
+    family, version, bits = socket.AF_INET, 4, 32
+    if ':' in ip:
+        family, version, bits = socket.AF_INET6, 6, 128
+    return version, bits, int(binascii.hexlify(socket.inet_pton(family, ip)), 16)
+
+
+class TableIndex(object):
+    """
+    Index the rows of the MAC address table and of the ARP table by MAC address, IP address,
+    interface and VLAN, and the addresses of the interfaces by prefix.
+
+    The rows are returned as they were given (dictionaries or records), in the order they were
+    added. Queries are answered in constant time, except for the longest prefix match which
+    depends on the number of distinct prefix lengths.
+
+    :param mac_address_table: The output of `get_mac_address_table`.
+    :param arp_table: The output of `get_arp_table`.
+    :param interfaces_ip: The output of `get_interfaces_ip`.
+    """
+
+    def __init__(self, mac_address_table=None, arp_table=None, interfaces_ip=None):
+        # same output as helpers.mac and helpers.ip, with the fast paths of helpers.macs/ips
+        self._mac = helpers._normalize_mac
+        self._ip = helpers._normalize_ip
+
+        # key -> [(row, normalized mac, interface, vlan or ip), ...]
+        self._mac_by_mac = defaultdict(list)
+        self._mac_by_interface = defaultdict(list)
+        self._mac_by_vlan = defaultdict(list)
+        self._arp_by_ip = defaultdict(list)
+        self._arp_by_mac = defaultdict(list)
+        self._arp_by_interface = defaultdict(list)
+        # version -> {prefix length -> {network -> (interface, ip, prefix length)}}
+        self._prefixes = {4: defaultdict(dict), 6: defaultdict(dict)}
+        self._prefix_lengths = {4: [], 6: []}
+
+        if mac_address_table:
+            self.add_mac_address_table(mac_address_table)
+        if arp_table:
+            self.add_arp_table(arp_table)
+        if interfaces_ip:
+            self.add_interfaces_ip(interfaces_ip)
+
+    def add_mac_address_table(self, mac_address_table):
+        """Index the rows of the output of `get_mac_address_table`."""
+        mac_address_table = list(mac_address_table)
+        fields = _fields(mac_address_table, 'mac', 'interface', 'vlan')
+        mac = self._mac
+        by_mac, by_interface, by_vlan = (self._mac_by_mac, self._mac_by_interface,
+                                         self._mac_by_vlan)
+        for row in mac_address_table:
+            raw_mac, interface, vlan = fields(row)
+            entry = (row, mac(raw_mac), interface, vlan)
+            by_mac[entry[1]].append(entry)
+            by_interface[interface].append(entry)
+            by_vlan[vlan].append(entry)
+
+    def add_arp_table(self, arp_table):
+        """Index the rows of the output of `get_arp_table`."""
+        arp_table = list(arp_table)
+        fields = _fields(arp_table, 'mac', 'interface', 'ip')
+        mac, ip = self._mac, self._ip
+        by_ip, by_mac, by_interface = (self._arp_by_ip, self._arp_by_mac,
+                                       self._arp_by_interface)
+        for row in arp_table:
+            raw_mac, interface, raw_ip = fields(row)
+            entry = (row, mac(raw_mac), interface, ip(raw_ip))
+            by_ip[entry[3]].append(entry)
+            by_mac[entry[1]].append(entry)
+            by_interface[interface].append(entry)
+
+    def add_interfaces_ip(self, interfaces_ip):
+        """Index the prefixes of the output of `get_interfaces_ip`."""
+        for interface, families in interfaces_ip.items():
+            for addresses in families.values():
+                for address, details in addresses.items():
+                    prefix_length = details.get('prefix_length')
+                    if not isinstance(prefix_length, int):
+                        continue  # e.g. 'N/A'
+                    address = self._ip(address)
+                    version, bits, value = _address(address)
+                    network = value >> (bits - prefix_length)
+                    self._prefixes[version][prefix_length].setdefault(
+                        network, {'interface': interface, 'ip': address,
+                                  'prefix_length': prefix_length})
+        for version, prefixes in self._prefixes.items():
+            self._prefix_lengths[version] = sorted(prefixes, reverse=True)
+
+    @staticmethod
+    def _query(buckets, predicates):
+        """Return the rows of the smallest bucket matching all the `predicates`."""
+        if not buckets:
+            raise TypeError("At least one criterion is required")
+        smallest = min(buckets, key=len)
+        return [entry[0] for entry in smallest
+                if all(entry[position] == value for position, value in predicates)]
+
+    def mac_table(self, mac=None, interface=None, vlan=None):
+        """
+        Return the rows of the MAC address table matching all the criteria given.
+
+        :param mac: (str) MAC address, in any format accepted by `helpers.mac`.
+        :param interface: (str) Interface name.
+        :param vlan: (int) VLAN ID.
+        """
+        buckets, predicates = [], []
+        if mac is not None:
+            mac = self._mac(mac)
+            buckets.append(self._mac_by_mac.get(mac, ()))
+            predicates.append((1, mac))
+        if interface is not None:
+            buckets.append(self._mac_by_interface.get(interface, ()))
+            predicates.append((2, interface))
+        if vlan is not None:
+            buckets.append(self._mac_by_vlan.get(vlan, ()))
+            predicates.append((3, vlan))
+        return self._query(buckets, predicates)
+
+    def arp_table(self, ip=None, mac=None, interface=None, vlan=None):
+        """
+        Return the rows of the ARP table matching all the criteria given.
+
+        :param ip: (str) IP address, in any format accepted by `helpers.ip`.
+        :param mac: (str) MAC address, in any format accepted by `helpers.mac`.
+        :param interface: (str) Interface name.
+        :param vlan: (int) VLAN ID, the rows whose MAC address was learned in that VLAN
+            according to the MAC address table.
+        """
+        buckets, predicates = [], []
+        if ip is not None:
+            ip = self._ip(ip)
+            buckets.append(self._arp_by_ip.get(ip, ()))
+            predicates.append((3, ip))
+        if mac is not None:
+            mac = self._mac(mac)
+            buckets.append(self._arp_by_mac.get(mac, ()))
+            predicates.append((1, mac))
+        if interface is not None:
+            buckets.append(self._arp_by_interface.get(interface, ()))
+            predicates.append((2, interface))
+        if vlan is None:
+            return self._query(buckets, predicates)
+
+        macs = set(entry[1] for entry in self._mac_by_vlan.get(vlan, ()))
+        if not buckets:
+            # ordered as the MAC addresses in the MAC address table
+            rows, seen = [], set()
+            for entry in self._mac_by_vlan.get(vlan, ()):
+                if entry[1] not in seen:
+                    seen.add(entry[1])
+                    rows.extend(arp[0] for arp in self._arp_by_mac.get(entry[1], ()))
+            return rows
+        smallest = min(buckets, key=len)
+        return [entry[0] for entry in smallest if entry[1] in macs and
+                all(entry[position] == value for position, value in predicates)]
+
+    def longest_prefix_match(self, address):
+        """
+        Return the interface address whose prefix is the most specific one containing
+        `address`, or `None`.
+
+        :param address: (str) IPv4 or IPv6 address.
+        :return: A dictionary with the keys "interface", "ip" and "prefix_length".
+        """
+        version, bits, value = _address(self._ip(address))
+        prefixes = self._prefixes[version]
+        for prefix_length in self._prefix_lengths[version]:
+            match = prefixes[prefix_length].get(value >> (bits - prefix_length))
+            if match is not None:
+                return dict(match)
+        return None
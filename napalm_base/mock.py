@@ -19,16 +19,15 @@ from __future__ import unicode_literals
 from napalm_base.base import NetworkDriver
 import napalm_base.exceptions
 
-import inspect
 import json
 import os
 import re
-
-
-from pydoc import locate
+import time
 
 
 def raise_exception(result):
+    from pydoc import locate
+
     exc = locate(result["exception"])
     if exc:
         raise exc(*result.get("args", []), **result.get("kwargs", {}))
@@ -38,12 +37,17 @@ def raise_exception(result):
 
 def is_mocked_method(method):
     mocked_methods = []
+    not_mocked_methods = ["get_many"]
+    if method in not_mocked_methods:
+        return False
     if method.startswith("get_") or method in mocked_methods:
         return True
     return False
 
 
-def mocked_method(path, name, count):
+def mocked_method(path, name, count, latency=0):
+    import inspect
+
     parent_method = getattr(NetworkDriver, name)
     parent_method_args = inspect.getargspec(parent_method)
     modifier = 0 if 'self' not in parent_method_args.args else 1
@@ -60,6 +64,8 @@ def mocked_method(path, name, count):
         if unexpected:
             raise TypeError("{} got an unexpected keyword argument '{}'".format(name,
                                                                                 unexpected[0]))
+        if latency:
+            time.sleep(latency)
         return mocked_data(path, name, count)
 
     return _mocked_method
@@ -100,6 +106,8 @@ class MockDriver(NetworkDriver):
         Supported optional_args:
             * path(str) - path to where the mocked files are located
             * profile(list) - List of profiles to assign
+            * latency(float) - seconds to wait in `open`, `cli` and every getter, to simulate
+              a slow device
         """
         self.hostname = hostname
         self.username = username
@@ -107,6 +115,7 @@ class MockDriver(NetworkDriver):
         self.path = optional_args["path"]
         self.profile = optional_args.get("profile", [])
         self.fail_on_open = optional_args.get("fail_on_open", False)
+        self.latency = optional_args.get("latency", 0)
 
         self.opened = False
         self.calls = {}
@@ -127,6 +136,8 @@ class MockDriver(NetworkDriver):
             raise napalm_base.exceptions.ConnectionClosedException("connection closed")
 
     def open(self):
+        if self.latency:
+            time.sleep(self.latency)
         if self.fail_on_open:
             raise napalm_base.exceptions.ConnectionException("You told me to do this")
         self.opened = True
@@ -139,6 +150,8 @@ class MockDriver(NetworkDriver):
 
     def cli(self, commands):
         count = self._count_calls("cli")
+        if self.latency:
+            time.sleep(self.latency)
         result = {}
         regexp = re.compile('[^a-zA-Z0-9]+')
         for i, c in enumerate(commands):
@@ -190,10 +203,19 @@ class MockDriver(NetworkDriver):
         """This one is only useful for junos."""
         return list(self.cli([get]).values())[0]
 
-    def __getattribute__(self, name):
-        if is_mocked_method(name):
-            self._raise_if_closed()
-            count = self._count_calls(name)
-            return mocked_method(self.path, name, count)
-        else:
-            return object.__getattribute__(self, name)
+
+def _mocked_getter(name):
+    def getter(self, *args, **kwargs):
+        self._raise_if_closed()
+        count = self._count_calls(name)
+        return mocked_method(self.path, name, count, self.latency)(*args, **kwargs)
+    getter.__name__ = str(name)
+    getter.__doc__ = getattr(NetworkDriver, name).__doc__
+    return getter
+
+
+# The getters are regular methods of the class, so the wrappers set on the instances (getter
+# cache, records) take precedence over them, as with any other driver.
+for _name in dir(NetworkDriver):
+    if is_mocked_method(_name) and callable(getattr(NetworkDriver, _name)):
+        setattr(MockDriver, _name, _mocked_getter(_name))
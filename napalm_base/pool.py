@@ -0,0 +1,283 @@
+# Copyright 2017 Dravetech AB. All rights reserved.
+#
+# The contents of this file are licensed under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with the
+# License. You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations under
+# the License.
+
+"""
+Pool of open NetworkDriver instances.
+
+Instead of opening and closing a session on every polling cycle:
+
+.. code-block:: python
+
+    >>> with driver(hostname, username, password, optional_args=optional_args) as device:
+    ...     device.get_facts()
+
+sessions can be borrowed from a pool, which keeps them open between cycles:
+
+.. code-block:: python
+
+    >>> pool = DriverPool(max_sessions=500, max_sessions_per_host=2, idle_timeout=300)
+    >>> with pool.connection(driver, hostname, username, password,
+    ...                      optional_args=optional_args) as device:
+    ...     device.get_facts()
+"""
+
+# Python3 support
+from __future__ import print_function
+from __future__ import unicode_literals
+
+# Python std lib
+import time
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+
+# local modules
+import napalm_base.exceptions
+import napalm_base.constants as c
+from napalm_base.helpers import freeze
+
+
+class _Session(object):
+    """A driver instance managed by the pool."""
+
+    __slots__ = ('key', 'hostname', 'device', 'last_used')
+
+    def __init__(self, key, hostname, device):
+        self.key = key
+        self.hostname = hostname
+        self.device = device
+        self.last_used = time.time()
+
+
+class DriverPool(object):
+    """
+    Hands out open driver instances keyed by (driver class, hostname, username, password,
+    optional_args).
+
+    :param max_sessions: (int) Maximum number of sessions, idle or in use, kept by the pool. When
+        reached, the least recently used idle session is closed to make room for a new one.
+    :param max_sessions_per_host: (int) Maximum number of sessions, idle or in use, per hostname.
+    :param idle_timeout: (int) Time in seconds after which an idle session is closed.
+    :param health_check: (bool) Whether to check `is_alive()` before reusing an idle session.
+    :param acquire_timeout: (int) Time in seconds to wait for a session when the limits are
+        reached and no idle session can be evicted. `None` waits forever.
+    """
+
+    def __init__(self, max_sessions=100, max_sessions_per_host=1, idle_timeout=300,
+                 health_check=True, acquire_timeout=c.TIMEOUT):
+        self.max_sessions = max_sessions
+        self.max_sessions_per_host = max_sessions_per_host
+        self.idle_timeout = idle_timeout
+        self.health_check = health_check
+        self.acquire_timeout = acquire_timeout
+
+        self._lock = threading.Condition()
+        self._idle = OrderedDict()  # id(session) -> session, least recently used first
+        self._idle_by_key = {}      # key -> [session, ...], most recently used last
+        self._busy = {}             # id(device) -> session
+        self._per_host = {}         # hostname -> number of sessions
+        self._total = 0
+
+    def __len__(self):
+        return self._total
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        self.close_all()
+
+    @staticmethod
+    def _close_device(device):
+        try:
+            device.close()
+        except Exception:
+            pass
+
+    def _forget(self, session):
+        """Account for a session that is not managed anymore. Must hold the lock."""
+        self._total -= 1
+        self._per_host[session.hostname] -= 1
+        if not self._per_host[session.hostname]:
+            del self._per_host[session.hostname]
+        self._lock.notify_all()
+
+    def _take_idle(self, session):
+        """Remove `session` from the idle sessions. Must hold the lock."""
+        del self._idle[id(session)]
+        sessions = self._idle_by_key[session.key]
+        sessions.remove(session)
+        if not sessions:
+            del self._idle_by_key[session.key]
+
+    def _evict(self, hostname=None):
+        """Take the least recently used idle session, of `hostname` if set. Must hold the lock."""
+        for session in self._idle.values():
+            if hostname is None or session.hostname == hostname:
+                self._take_idle(session)
+                self._forget(session)
+                return session
+        return None
+
+    def _expired(self):
+        """Take the idle sessions that exceeded the idle timeout. Must hold the lock."""
+        expired = []
+        if self.idle_timeout is None:
+            return expired
+        deadline = time.time() - self.idle_timeout
+        for session in list(self._idle.values()):
+            if session.last_used > deadline:
+                break  # sessions are sorted by last usage
+            self._take_idle(session)
+            self._forget(session)
+            expired.append(session)
+        return expired
+
+    def _is_alive(self, device):
+        if not self.health_check:
+            return True
+        try:
+            return device.is_alive()['is_alive']
+        except Exception:
+            return False
+
+    def acquire(self, driver, hostname, username, password, timeout=c.TIMEOUT,
+                optional_args=None):
+        """
+        Return an open instance of `driver`, reusing an idle session when possible.
+
+        The instance must be given back with `release`, or use `connection` instead.
+
+        :raise PoolExhaustedError: No session could be made available in `acquire_timeout`.
+        """
+        key = (driver, hostname, username, password, timeout, freeze(optional_args or {}))
+        deadline = None if self.acquire_timeout is None else time.time() + self.acquire_timeout
+
+        while True:
+            to_close = []
+            session = None
+            with self._lock:
+                to_close.extend(self._expired())
+                while True:
+                    if key in self._idle_by_key:
+                        session = self._idle_by_key[key][-1]
+                        self._take_idle(session)
+                        break
+
+                    if self._per_host.get(hostname, 0) >= self.max_sessions_per_host:
+                        evicted = self._evict(hostname)
+                    elif self._total >= self.max_sessions:
+                        evicted = self._evict()
+                    else:
+                        # reserve the slot, the session is opened outside the lock
+                        self._total += 1
+                        self._per_host[hostname] = self._per_host.get(hostname, 0) + 1
+                        break
+
+                    if evicted is not None:
+                        to_close.append(evicted)
+                        continue
+
+                    remaining = None if deadline is None else deadline - time.time()
+                    if remaining is not None and remaining <= 0:
+                        for evicted in to_close:
+                            self._close_device(evicted.device)
+                        raise napalm_base.exceptions.PoolExhaustedError(
+                            "No session available for {} after {} seconds".format(
+                                hostname, self.acquire_timeout))
+                    self._lock.wait(remaining)
+
+            for evicted in to_close:
+                self._close_device(evicted.device)
+
+            if session is None:
+                break
+            if self._is_alive(session.device):
+                session.last_used = time.time()
+                with self._lock:
+                    self._busy[id(session.device)] = session
+                return session.device
+
+            # the session is dead, forget about it and try again
+            self._close_device(session.device)
+            with self._lock:
+                self._forget(session)
+
+        try:
+            device = driver(hostname, username, password, timeout=timeout,
+                            optional_args=optional_args)
+            device.open()
+        except Exception:
+            with self._lock:
+                self._forget(_Session(key, hostname, None))
+            raise
+
+        with self._lock:
+            self._busy[id(device)] = _Session(key, hostname, device)
+        return device
+
+    def release(self, device, discard=False):
+        """
+        Give back a device obtained with `acquire`.
+
+        :param discard: (bool) Close the session instead of keeping it for reuse.
+        """
+        with self._lock:
+            session = self._busy.pop(id(device))
+            if not discard:
+                session.last_used = time.time()
+                self._idle[id(session)] = session
+                self._idle_by_key.setdefault(session.key, []).append(session)
+                self._lock.notify_all()
+                return
+            self._forget(session)
+        self._close_device(device)
+
+    @contextmanager
+    def connection(self, driver, hostname, username, password, timeout=c.TIMEOUT,
+                   optional_args=None):
+        """
+        Context manager borrowing a session from the pool.
+
+        The session is discarded when a `ConnectionException` is raised within the block.
+        """
+        device = self.acquire(driver, hostname, username, password, timeout=timeout,
+                              optional_args=optional_args)
+        try:
+            yield device
+        except napalm_base.exceptions.ConnectionException:
+            self.release(device, discard=True)
+            raise
+        except BaseException:
+            self.release(device)
+            raise
+        else:
+            self.release(device)
+
+    def close_idle(self):
+        """Close the idle sessions that exceeded the idle timeout."""
+        with self._lock:
+            expired = self._expired()
+        for session in expired:
+            self._close_device(session.device)
+
+    def close_all(self):
+        """Close all the idle sessions. Sessions in use are not affected."""
+        with self._lock:
+            sessions = list(self._idle.values())
+            for session in sessions:
+                self._take_idle(session)
+                self._forget(session)
+        for session in sessions:
+            self._close_device(session.device)
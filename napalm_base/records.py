@@ -0,0 +1,204 @@
+# Copyright 2017 Dravetech AB. All rights reserved.
+#
+# The contents of this file are licensed under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with the
+# License. You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations under
+# the License.
+
+"""
+Compact record types for the fixed-schema rows returned by the getters.
+
+The record classes are namedtuples generated from the models in `napalm_base.test.models`. A
+record takes less than half the memory of the equivalent dictionary, which matters when
+holding large tables (MAC, ARP, routes) for thousands of devices.
+
+Example:
+
+.. code-block:: python
+
+    >>> ArpEntry = record_class('arp_table')
+    >>> entry = ArpEntry.from_dict({'interface': 'Ethernet1', 'mac': '5C:5E:AB:DA:3C:F0',
+    ...                             'ip': '172.17.17.1', 'age': 1454496274.84})
+    >>> entry.ip
+    u'172.17.17.1'
+    >>> entry.to_dict()['mac']
+    u'5C:5E:AB:DA:3C:F0'
+
+Getters can return records instead of dictionaries, either with
+`optional_args={'getter_records': True}` or with `NetworkDriver.enable_getter_records`.
+"""
+
+# Python3 support
+from __future__ import print_function
+from __future__ import unicode_literals
+
+# Python std lib
+import re
+import weakref
+import functools
+import threading
+from collections import namedtuple
+
+# local modules
+from napalm_base.test import models
+
+
+# getter -> (model name, shape of the output)
+#   list: list of rows
+#   dict: dictionary of rows
+#   dict_of_lists: dictionary of lists of rows
+TABLE_GETTERS = {
+    'get_arp_table': ('arp_table', 'list'),
+    'get_ipv6_neighbors_table': ('ipv6_neighbor', 'list'),
+    'get_mac_address_table': ('mac_address_table', 'list'),
+    'get_interfaces': ('interface', 'dict'),
+    'get_interfaces_counters': ('interface_counters', 'dict'),
+    'get_route_to': ('route', 'dict_of_lists'),
+}
+
+_IDENTIFIER = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*$')
+
+_record_classes = {}
+_record_classes_lock = threading.Lock()
+
+
+class Record(object):
+    """Methods shared by all the record classes."""
+
+    __slots__ = ()
+
+    @classmethod
+    def from_dict(cls, row):
+        """Build a record from a dictionary following the model."""
+        return cls._make([row[field] for field in cls._fields])
+
+    def to_dict(self):
+        """Return the dictionary equivalent to the record."""
+        return dict(zip(self._fields, self))
+
+    def __reduce__(self):
+        # the classes are generated, so they are pickled by model name
+        return _record, (self.model_name, tuple(self))
+
+
+def _record(model_name, values):
+    return record_class(model_name)._make(values)
+
+
+def _class_name(model_name):
+    return str(''.join(part.capitalize() for part in model_name.split('_')) + 'Record')
+
+
+def record_class(model_name):
+    """
+    Return the record class for the model `model_name` of `napalm_base.test.models`.
+
+    The fields are sorted alphabetically. Classes are generated once and then reused.
+
+    :raise ValueError: The model does not exist or can't be represented as a record.
+    """
+    cls = _record_classes.get(model_name)
+    if cls is not None:
+        return cls
+
+    model = getattr(models, model_name, None)
+    if not isinstance(model, dict) or not model:
+        raise ValueError("{} is not a model".format(model_name))
+    fields = sorted(model)
+    if not all(_IDENTIFIER.match(f) for f in fields):
+        raise ValueError("The fields of {} can't be used as attributes: {}".format(model_name,
+                                                                                   fields))
+
+    with _record_classes_lock:
+        if model_name not in _record_classes:
+            base = namedtuple(_class_name(model_name), fields)
+            _record_classes[model_name] = type(base.__name__, (Record, base),
+                                               {str('__slots__'): (), str('model'): model,
+                                                str('model_name'): model_name})
+        return _record_classes[model_name]
+
+
+def to_records(output, model_name, shape='list'):
+    """
+    Convert the output of a getter to records.
+
+    :param output: The output of the getter.
+    :param model_name: (str) The model of the rows, e.g. "mac_address_table".
+    :param shape: (str) "list", "dict" or "dict_of_lists", see `TABLE_GETTERS`.
+    """
+    from_dict = record_class(model_name).from_dict
+    if shape == 'list':
+        return [from_dict(row) for row in output]
+    if shape == 'dict':
+        return {key: from_dict(row) for key, row in output.items()}
+    if shape == 'dict_of_lists':
+        return {key: [from_dict(row) for row in rows] for key, rows in output.items()}
+    raise ValueError("Unknown shape {}".format(shape))
+
+
+def to_dicts(output, shape='list'):
+    """Convert the records returned by `to_records` back to dictionaries."""
+    if shape == 'list':
+        return [record.to_dict() for record in output]
+    if shape == 'dict':
+        return {key: record.to_dict() for key, record in output.items()}
+    if shape == 'dict_of_lists':
+        return {key: [record.to_dict() for record in records]
+                for key, records in output.items()}
+    raise ValueError("Unknown shape {}".format(shape))
+
+
+def to_plain(value):
+    """
+    Return `value` with the records it contains, at any depth, converted to dictionaries.
+
+    Useful to serialize the output of any getter, or to process it with code expecting
+    dictionaries.
+    """
+    if isinstance(value, Record):
+        return value.to_dict()
+    if isinstance(value, list):
+        return [to_plain(v) for v in value]
+    if isinstance(value, dict):
+        return {k: to_plain(v) for k, v in value.items()}
+    return value
+
+
+def _records_getter(call, wrapped, model_name, shape):
+    @functools.wraps(wrapped)
+    def getter(*args, **kwargs):
+        return to_records(call(*args, **kwargs), model_name, shape)
+    return getter
+
+
+def _bound(ref, function):
+    """Call `function` with the device behind the weak reference `ref`."""
+    def call(*args, **kwargs):
+        return function(ref(), *args, **kwargs)
+    return call
+
+
+def install(device):
+    """
+    Make the table getters of `device` (see `TABLE_GETTERS`) return records.
+
+    The wrappers are set as attributes of the instance, on top of any wrapper already there
+    (e.g. the getter cache).
+    """
+    # weak reference, the wrappers are stored in the device itself
+    ref = weakref.ref(device)
+    for name, (model_name, shape) in TABLE_GETTERS.items():
+        wrapped = device.__dict__.get(name)
+        if wrapped is not None:
+            call = wrapped
+        else:
+            wrapped = getattr(type(device), name)
+            call = _bound(ref, wrapped)
+        setattr(device, name, _records_getter(call, wrapped, model_name, shape))
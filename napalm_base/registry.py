@@ -0,0 +1,244 @@
+# Copyright 2017 Dravetech AB. All rights reserved.
+#
+# The contents of this file are licensed under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with the
+# License. You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations under
+# the License.
+
+"""
+Process-wide registry of network drivers.
+
+`get_network_driver` stores every class it resolves here, so subsequent lookups for the same
+driver (e.g. "ios-xr", "iosxr" or "napalm_iosxr") skip the module import and the member scan.
+Plugins can also register their drivers upfront.
+
+Drivers can also be advertised by any installed distribution through the ``napalm.drivers``
+entry-point group, e.g. in ``setup.py``:
+
+.. code-block:: python
+
+    entry_points={
+        'napalm.drivers': [
+            'iosxr = napalm_iosxr.iosxr:IOSXRDriver',
+        ],
+    }
+
+The entry points are read once, cached on disk (see `NAPALM_CACHE_DIR`) and the driver module is
+only imported when the driver is requested.
+"""
+
+# Python3 support
+from __future__ import print_function
+from __future__ import unicode_literals
+
+# Python std lib
+import os
+import sys
+import json
+import hashlib
+import importlib
+import threading
+
+# local modules
+from napalm_base.exceptions import ModuleImportError
+from napalm_base.utils import py23_compat
+
+
+ENTRY_POINT_GROUP = 'napalm.drivers'
+
+NAPALM_CACHE_DIR = os.getenv('NAPALM_CACHE_DIR',
+                             default=os.path.join(os.path.expanduser('~'), '.cache', 'napalm'))
+
+# normalized name -> driver class or "module:attribute" reference, imported on first lookup
+_DRIVERS = {}
+_DRIVERS_LOCK = threading.RLock()
+_ENTRY_POINTS_LOADED = False
+
+
+def normalize_driver_name(name, prepend=True):
+    """
+    Return the name of the library implementing the driver `name`.
+
+    Example:
+
+    .. code-block:: python
+
+        >>> normalize_driver_name('IOS-XR')
+        u'napalm_iosxr'
+        >>> normalize_driver_name('napalm_eos')
+        u'napalm_eos'
+    """
+    if not (isinstance(name, py23_compat.string_types) and len(name) > 0):
+        raise ModuleImportError('Please provide a valid driver name.')
+    # Only lowercase allowed
+    name = name.lower()
+    # Try to not raise error when users requests IOS-XR for e.g.
+    name = name.replace('-', '')
+    # Can also request using napalm_[SOMETHING]
+    if 'napalm_' not in name and prepend is True:
+        name = 'napalm_{name}'.format(name=name)
+    return name
+
+
+def _import_driver(reference):
+    """Import a driver referenced as "module:attribute"."""
+    module_name, _, attribute = reference.partition(':')
+    try:
+        driver = importlib.import_module(module_name)
+        for attr in attribute.split('.'):
+            driver = getattr(driver, attr)
+    except (ImportError, AttributeError):
+        raise ModuleImportError(
+            'Cannot import "{reference}". Is the library installed?'.format(reference=reference))
+    return driver
+
+
+def _iter_entry_points():
+    """Yield (name, "module:attribute") for every entry point of the drivers group."""
+    try:
+        from importlib import metadata
+    except ImportError:
+        metadata = None
+
+    if metadata is not None:
+        entry_points = metadata.entry_points()
+        if hasattr(entry_points, 'select'):
+            entry_points = entry_points.select(group=ENTRY_POINT_GROUP)
+        else:
+            entry_points = entry_points.get(ENTRY_POINT_GROUP, [])
+        for entry_point in entry_points:
+            yield entry_point.name, entry_point.value
+    else:
+        import pkg_resources
+        for entry_point in pkg_resources.iter_entry_points(ENTRY_POINT_GROUP):
+            yield entry_point.name, '{}:{}'.format(entry_point.module_name,
+                                                   '.'.join(entry_point.attrs))
+
+
+def _sys_path_fingerprint():
+    """Return a digest that changes whenever a distribution is installed or removed."""
+    digest = hashlib.sha1()
+    for path in sys.path:
+        try:
+            mtime = os.stat(path or '.').st_mtime
+        except OSError:
+            mtime = None
+        digest.update('{}:{}\n'.format(path, mtime).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def _entry_points_cache_file():
+    return os.path.join(NAPALM_CACHE_DIR, 'drivers.json')
+
+
+def discover_network_drivers(use_cache=True):
+    """
+    Return a dictionary with the drivers advertised through the `napalm.drivers` entry points.
+
+    The keys are the normalized driver names and the values the "module:attribute" references.
+    Nothing is imported. The result is cached on disk and reused as long as `sys.path` does not
+    change.
+    """
+    fingerprint = _sys_path_fingerprint()
+    cache_file = _entry_points_cache_file()
+
+    if use_cache:
+        try:
+            with open(cache_file) as f:
+                cached = json.load(f)
+            if cached.get('fingerprint') == fingerprint:
+                return cached['drivers']
+        except (IOError, OSError, ValueError, KeyError, AttributeError):
+            pass
+
+    drivers = {normalize_driver_name(name): reference
+               for name, reference in _iter_entry_points()}
+
+    if use_cache:
+        try:
+            if not os.path.isdir(NAPALM_CACHE_DIR):
+                os.makedirs(NAPALM_CACHE_DIR)
+            tmp_file = '{}.{}'.format(cache_file, os.getpid())
+            with open(tmp_file, 'w') as f:
+                json.dump({'fingerprint': fingerprint, 'drivers': drivers}, f)
+            os.rename(tmp_file, cache_file)
+        except (IOError, OSError):
+            pass  # read-only home, etc. Not a problem, we'll just scan again next time
+    return drivers
+
+
+def _load_entry_points():
+    global _ENTRY_POINTS_LOADED
+    if _ENTRY_POINTS_LOADED:
+        return
+    with _DRIVERS_LOCK:
+        if not _ENTRY_POINTS_LOADED:
+            for name, reference in discover_network_drivers().items():
+                # explicit registrations win over entry points
+                _DRIVERS.setdefault(name, reference)
+            _ENTRY_POINTS_LOADED = True
+
+
+def register_network_driver(name, driver, prepend=True):
+    """
+    Register the class `driver` under the name `name`.
+
+    `driver` can also be a "module:attribute" string, in which case the module is imported only
+    when the driver is requested for the first time.
+
+    Registered drivers are returned by `get_network_driver` without scanning any module.
+    Registering an existing name overrides the previous entry.
+    """
+    with _DRIVERS_LOCK:
+        _DRIVERS[normalize_driver_name(name, prepend=prepend)] = driver
+
+
+def lookup_network_driver(name, prepend=True):
+    """
+    Return the class registered under `name` or `None`.
+
+    Drivers advertised through entry points are taken into account and imported on demand.
+    """
+    name = normalize_driver_name(name, prepend=prepend)
+    driver = _DRIVERS.get(name)
+    if driver is None and not _ENTRY_POINTS_LOADED:
+        _load_entry_points()
+        driver = _DRIVERS.get(name)
+    if isinstance(driver, py23_compat.string_types):
+        with _DRIVERS_LOCK:
+            driver = _DRIVERS[name] = _import_driver(driver)
+    return driver
+
+
+def list_network_drivers():
+    """
+    Return a dictionary with the registered drivers, keyed by the normalized name.
+
+    Drivers not imported yet are represented by their "module:attribute" reference.
+    """
+    _load_entry_points()
+    with _DRIVERS_LOCK:
+        return dict(_DRIVERS)
+
+
+def invalidate_network_driver(name=None, prepend=True):
+    """
+    Remove the driver registered under `name` from the registry.
+
+    When `name` is not specified, the whole registry is cleared and the entry points will be
+    read again on the next lookup.
+    """
+    global _ENTRY_POINTS_LOADED
+    with _DRIVERS_LOCK:
+        if name is None:
+            _DRIVERS.clear()
+            _ENTRY_POINTS_LOADED = False
+        else:
+            _DRIVERS.pop(normalize_driver_name(name, prepend=prepend), None)
@@ -275,6 +275,11 @@ class BaseTestGetters(object):
                 for neighbor in neighbor_list:
                     assert helpers.test_model(models.peer_details, neighbor)
 
+        for vrf, remote_as, neighbor in self.device.iter_bgp_neighbors_detail():
+            assert isinstance(vrf, text_type)
+            assert isinstance(remote_as, int)
+            assert helpers.test_model(models.peer_details, neighbor)
+
         return get_bgp_neighbors_detail
 
     @wrap_test_cases
@@ -286,6 +291,9 @@ class BaseTestGetters(object):
         for arp_entry in get_arp_table:
             assert helpers.test_model(models.arp_table, arp_entry)
 
+        for arp_entry in self.device.iter_arp_table():
+            assert helpers.test_model(models.arp_table, arp_entry)
+
         return get_arp_table
 
     @wrap_test_cases
@@ -297,6 +305,9 @@ class BaseTestGetters(object):
         for entry in get_ipv6_neighbors_table:
             assert helpers.test_model(models.ipv6_neighbor, entry)
 
+        for entry in self.device.iter_ipv6_neighbors_table():
+            assert helpers.test_model(models.ipv6_neighbor, entry)
+
         return get_ipv6_neighbors_table
 
     @wrap_test_cases
@@ -359,6 +370,9 @@ class BaseTestGetters(object):
         for mac_table_entry in get_mac_address_table:
             assert helpers.test_model(models.mac_address_table, mac_table_entry)
 
+        for mac_table_entry in self.device.iter_mac_address_table():
+            assert helpers.test_model(models.mac_address_table, mac_table_entry)
+
         return get_mac_address_table
 
     @wrap_test_cases
@@ -374,6 +388,10 @@ class BaseTestGetters(object):
             for route in routes:
                 assert helpers.test_model(models.route, route)
 
+        for prefix, route in self.device.iter_route_to(destination=destination,
+                                                       protocol=protocol):
+            assert helpers.test_model(models.route, route)
+
         return get_route_to
 
     @wrap_test_cases
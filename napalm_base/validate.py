@@ -2,23 +2,64 @@
 Validation methods for the NAPALM base.
 
 See: https://napalm.readthedocs.io/en/latest/validate.html
+
+A validation file or source can be compiled once with `compile_plan` and the resulting
+`ValidationPlan` reused for any number of devices, from any number of threads:
+
+.. code-block:: python
+
+    >>> plan = compile_plan('validate.yml')
+    >>> for device in devices:
+    ...     report = device.compliance_report(validation_source=plan)
+
+Strings are matched as regular expressions, unless they are marked as literal, either with
+`Literal` or with the "literal" mode, which applies to the nested values as well:
+
+.. code-block:: yaml
+
+    - get_facts:
+        _mode: literal
+        os_version: 7.0(3)I2(2d)
 """
 from __future__ import unicode_literals
 
-import yaml
-
 from napalm_base.exceptions import ValidationException
+from napalm_base.helpers import freeze
+from napalm_base.records import Record
 from napalm_base.utils import py23_compat
 
 import copy
+import itertools
+import numbers
+import operator
 import re
+from collections import namedtuple
 
 
 # We put it here to compile it only once
-numeric_compare_regex = re.compile("^(<|>|<=|>=|==|!=)(\d+(\.\d+){0,1})$")
+numeric_compare_regex = re.compile("^(<|>|<=|>=|==|!=)(\\d+(\\.\\d+){0,1})$")
+# '^literal$', the literal made of characters without special meaning or escaped punctuation
+_anchored_literal_regex = re.compile(r'^\^((?:\\[^A-Za-z0-9\n]|[^.^$*+?{}\[\]\\|()\n])*)\$$')
+_unescape_regex = re.compile(r'\\(.)')
+
+# compiled regular expressions, shared by all the plans and cleared when full
+REGEX_CACHE_SIZE = 4096
+
+_regex_cache = {}
+
+_numeric_operators = {
+    "<": operator.lt,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "<=": operator.le,
+    "==": operator.eq,
+    "!=": operator.ne,
+}
 
 
 def _get_validation_file(validation_file):
+    import yaml
+
     try:
         with open(validation_file, 'r') as stream:
             try:
@@ -30,8 +71,34 @@ def _get_validation_file(validation_file):
     return validation_source
 
 
+class Literal(py23_compat.text_type):
+    """A string compared for equality with the actual value instead of matched as a regex."""
+
+    __slots__ = ()
+
+
+def _regex(pattern):
+    """Return the compiled regular expression `pattern`, compiling it once."""
+    try:
+        return _regex_cache[pattern]
+    except KeyError:
+        pass
+    compiled = re.compile(pattern)
+    if len(_regex_cache) >= REGEX_CACHE_SIZE:
+        _regex_cache.clear()
+    _regex_cache[pattern] = compiled
+    return compiled
+
+
+def _search(pattern, value):
+    """Match `value` against the regular expression, or the `Literal`, `pattern`."""
+    if isinstance(pattern, Literal):
+        return pattern == value
+    return _regex(pattern).search(value)
+
+
 def _mode(mode_string):
-    mode = {'strict': False}
+    mode = {'strict': False, 'literal': False}
 
     for m in mode_string.split():
         if m not in mode.keys():
@@ -40,32 +107,120 @@ def _mode(mode_string):
     return mode
 
 
+def _exact_value(value):
+    """
+    Return how `value`, as expected value of a key, is compared by `_compare_getter`, when it
+    only matches equal values:
+
+    * ('eq', value) for numbers, booleans and None, matching `actual == value`.
+    * ('text', literal, value) for strings anchored at both ends without other regex syntax,
+      such as '^10\\.0\\.0\\.1$', matching `text_type(actual)` equal to the literal (or to the
+      literal followed by a newline, as `$` does) and `actual == value`.
+
+    Return `None` for any other value (regexes, numeric comparisons, nested structures).
+    """
+    if isinstance(value, py23_compat.string_types):
+        match = _anchored_literal_regex.match(value)
+        if match:
+            return 'text', _unescape_regex.sub(r'\1', match.group(1)), value
+        return None
+    if value is None or isinstance(value, numbers.Real) and value == value:  # not NaN
+        return 'eq', value
+    return None
+
+
+def _index_key(kind, value):
+    """Return the key of an actual value in the indexes of `_compare_getter_list`."""
+    if kind == 'text':
+        value = py23_compat.text_type(value)
+        return value[:-1] if value.endswith('\n') else value
+    return value
+
+
+def _exact_keys(exact):
+    """Return the index keys of the actual values matching the expected `exact` value."""
+    if exact[0] == 'text':
+        return {exact[1], _index_key('text', exact[2])}
+    return {exact[1]}
+
+
+def _list_index(dst, fields):
+    """Return the positions of the elements of `dst`, bucketed by their values of `fields`."""
+    index = {}
+    for position, dst_element in enumerate(dst):
+        try:
+            key = tuple(_index_key(kind, dst_element[field]) for field, kind in fields)
+            index.setdefault(key, []).append(position)
+        except (KeyError, TypeError):
+            pass  # missing or unhashable value, the element can't match an exact value
+    return index
+
+
+def _candidates(src_element, dst, indexes):
+    """
+    Return the positions, in ascending order, of the elements of `dst` that may match
+    `src_element`, or `None` if all of them have to be compared.
+
+    When some keys of `src_element` are only matched by equal values (see `_exact_value`), only
+    the elements of `dst` with those values can match, which are found in a hash index built
+    once per set of keys.
+    """
+    exact = src_element.exact_fields
+    if not exact:
+        return None
+
+    fields = tuple((field, value[0]) for field, value in exact)
+    index = indexes.get(fields)
+    if index is None:
+        index = indexes[fields] = _list_index(dst, fields)
+
+    positions = []
+    for key in itertools.product(*[_exact_keys(value) for _, value in exact]):
+        positions.extend(index.get(key, ()))
+    return sorted(set(positions))
+
+
+def _as_dicts(dst):
+    """Return the list `dst` with its records (see `napalm_base.records`) as dictionaries."""
+    if any(isinstance(dst_element, Record) for dst_element in dst):
+        return [dst_element.to_dict() if isinstance(dst_element, Record) else dst_element
+                for dst_element in dst]
+    return dst
+
+
 def _compare_getter_list(src, dst, mode):
     result = {"complies": True, "present": [], "missing": [], "extra": []}
+    dst = _as_dicts(dst)
+
+    # The elements of dst are matched greedily: each element of src takes the first element of
+    # dst matching it that was not taken yet. The elements that can't match are skipped using
+    # hash indexes when possible, see `_candidates`.
+    indexed = all(isinstance(dst_element, dict) for dst_element in dst)
+    indexes = {}
+    taken = [False] * len(dst)
     for src_element in src:
         found = False
 
-        i = 0
-        while True:
-            try:
-                intermediate_match = _compare_getter(src_element, dst[i])
-                if isinstance(intermediate_match, dict) and intermediate_match["complies"] or \
-                   not isinstance(intermediate_match, dict) and intermediate_match:
-                    found = True
-                    result["present"].append(src_element)
-                    dst.pop(i)
-                    break
-                else:
-                    i += 1
-            except IndexError:
+        positions = _candidates(src_element, dst, indexes) if indexed else None
+        if positions is None:
+            positions = range(len(dst))
+        for i in positions:
+            if taken[i]:
+                continue
+            intermediate_match = src_element.compare(dst[i])
+            if isinstance(intermediate_match, dict) and intermediate_match["complies"] or \
+               not isinstance(intermediate_match, dict) and intermediate_match:
+                found = True
+                result["present"].append(copy.deepcopy(src_element.source))
+                taken[i] = True
                 break
 
         if not found:
             result["complies"] = False
-            result["missing"].append(src_element)
+            result["missing"].append(copy.deepcopy(src_element.source))
 
-    if mode["strict"] and dst:
-        result["extra"] = dst
+    if mode["strict"] and not all(taken):
+        result["extra"] = [dst_element for dst_element, t in zip(dst, taken) if not t]
         result["complies"] = False
 
     return result
@@ -73,13 +228,16 @@ def _compare_getter_list(src, dst, mode):
 
 def _compare_getter_dict(src, dst, mode):
     result = {"complies": True, "present": {}, "missing": [], "extra": []}
-    dst = copy.deepcopy(dst)  # Otherwise we are going to modify a "live" object
+    seen = set()  # the keys of dst compared, dst itself is not modified
+    if isinstance(dst, Record):
+        dst = dst.to_dict()
 
-    for key, src_element in src.items():
+    for key, src_element in src.items:
         try:
-            dst_element = dst.pop(key)
+            dst_element = dst[key]
+            seen.add(key)
             result["present"][key] = {}
-            intermediate_result = _compare_getter(src_element, dst_element)
+            intermediate_result = src_element.compare(dst_element)
 
             if isinstance(intermediate_result, dict):
                 nested = True
@@ -92,7 +250,7 @@ def _compare_getter_dict(src, dst, mode):
                 complies = intermediate_result
                 nested = False
                 if not complies:
-                    result["present"][key]["expected_value"] = src_element
+                    result["present"][key]["expected_value"] = copy.deepcopy(src_element.source)
                     result["present"][key]["actual_value"] = dst_element
 
             if not complies:
@@ -104,47 +262,162 @@ def _compare_getter_dict(src, dst, mode):
             result["missing"].append(key)
             result["complies"] = False
 
-    if mode["strict"] and dst:
-        result["extra"] = list(dst.keys())
+    if mode["strict"] and len(dst) > len(seen):
+        result["extra"] = [key for key in dst if key not in seen]
         result["complies"] = False
 
     return result
 
 
-def _compare_getter(src, dst):
-    if isinstance(src, py23_compat.string_types):
-        src = py23_compat.text_type(src)
+class _Expected(object):
+    """
+    An expected value compiled by `_compile`, compared with the actual value by `compare`.
 
-    if isinstance(src, dict):
-        mode = _mode(src.pop('_mode', ''))
-        if 'list' in src.keys():
-            if not isinstance(dst, list):
-                # This can happen with nested lists
-                return False
+    `source` is the value as written in the validation source, without the `_mode` keys, and
+    is what the reports show. The compiled values are never modified once built.
+    """
 
-            return _compare_getter_list(src['list'], dst, mode)
-        return _compare_getter_dict(src, dst, mode)
+    # the (key, exact value) pairs of the dictionaries, see _candidates
+    exact_fields = ()
 
-    elif isinstance(src, py23_compat.string_types):
-        if src.startswith('<') or src.startswith('>'):
-            cmp_result = compare_numeric(src, dst)
-            return cmp_result
-        else:
-            m = re.search(src, py23_compat.text_type(dst))
-            if m:
-                return bool(m)
-            else:
-                return src == dst
+    def __init__(self, source):
+        self.source = source
+        # see _exact_value, None for the strings that are not anchored literals and the
+        # nested structures
+        self.exact = _exact_value(source)
+
+    def compare(self, dst):
+        return self.source == dst
+
+
+class _Pattern(_Expected):
+    """A string, matched as a regular expression or compared for equality."""
 
-    elif(type(src) == type(dst) == list):
-        pairs = zip(src, dst)
+    def __init__(self, source):
+        super(_Pattern, self).__init__(source)
+        try:
+            self.regex = _regex(source)
+        except re.error as e:
+            raise ValidationException("Invalid regular expression {!r}: {}".format(source, e))
+
+    def compare(self, dst):
+        return bool(self.regex.search(py23_compat.text_type(dst))) or self.source == dst
+
+
+class _Literal(_Expected):
+    """A string compared for equality with the text of the actual value."""
+
+    def __init__(self, source):
+        super(_Literal, self).__init__(py23_compat.text_type(source))
+        self.exact = ('text', self.source, self.source)
+
+    def compare(self, dst):
+        return py23_compat.text_type(dst) == self.source
+
+
+class _Numeric(_Expected):
+    """A numeric comparison such as '<5' or '>=2.5', see `compare_numeric`."""
+
+    def __init__(self, source):
+        super(_Numeric, self).__init__(source)
+        match = numeric_compare_regex.match(source)
+        if not match:
+            raise ValidationException("Invalid numeric comparison {!r}".format(source))
+        self.operator = _numeric_operators[match.group(1)]
+        self.operand = float(match.group(2))
+
+    def compare(self, dst):
+        return self.operator(float(dst), self.operand)
+
+
+class _Pairs(_Expected):
+    """A list given as is, its dictionaries matched pairwise against those of the actual list."""
+
+    def __init__(self, source, literal):
+        super(_Pairs, self).__init__(source)
+        self.literal = literal
+
+    def compare(self, dst):
+        if type(dst) is not list:
+            return self.source == dst
+        pairs = zip(self.source, _as_dicts(dst))
         diff_lists = [[(k, x[k], y[k])
-                      for k in x if not re.search(x[k], y[k])]
+                      for k in x if not self._search(x[k], y[k])]
                       for x, y in pairs if x != y]
         return empty_tree(diff_lists)
 
-    else:
-        return src == dst
+    def _search(self, pattern, value):
+        if self.literal:
+            return pattern == value
+        return _search(pattern, value)
+
+
+class _Dict(_Expected):
+    """A dictionary, whose keys are compared one by one."""
+
+    def __init__(self, source, mode, items):
+        super(_Dict, self).__init__(source)
+        self.mode = mode
+        self.items = items
+        self.exact_fields = tuple(sorted(((key, value.exact) for key, value in items
+                                          if value.exact is not None),
+                                         key=lambda field: py23_compat.text_type(field[0])))
+
+    def compare(self, dst):
+        return _compare_getter_dict(self, dst, self.mode)
+
+
+class _List(_Expected):
+    """A dictionary with a 'list' key, whose elements are matched against the actual list."""
+
+    def __init__(self, source, mode, elements):
+        super(_List, self).__init__(source)
+        self.mode = mode
+        self.elements = elements
+
+    def compare(self, dst):
+        if not isinstance(dst, list):
+            # This can happen with nested lists
+            return False
+        return _compare_getter_list(self.elements, dst, self.mode)
+
+
+def _compile(src, literal=False):
+    """
+    Compile the expected value `src` to an `_Expected`, without modifying it.
+
+    :param literal: (bool) Compare the strings for equality, as in the "literal" mode.
+    """
+    if isinstance(src, Literal):
+        return _Literal(src)
+    if isinstance(src, py23_compat.string_types):
+        src = py23_compat.text_type(src)
+        if literal:
+            return _Literal(src)
+        if src.startswith('<') or src.startswith('>'):
+            return _Numeric(src)
+        return _Pattern(src)
+
+    if isinstance(src, dict):
+        mode = _mode(src.get('_mode', ''))
+        literal = literal or mode['literal']
+        if 'list' in src:
+            elements = tuple(_compile(src_element, literal) for src_element in src['list'])
+            source = {key: value for key, value in src.items() if key != '_mode'}
+            source['list'] = [src_element.source for src_element in elements]
+            return _List(source, mode, elements)
+        items = tuple((key, _compile(value, literal)) for key, value in src.items()
+                      if key != '_mode')
+        return _Dict({key: value.source for key, value in items}, mode, items)
+
+    if type(src) is list:
+        return _Pairs(copy.deepcopy(src), literal)
+
+    return _Expected(src)
+
+
+def _compare_getter(src, dst):
+    return _compile(src).compare(dst)
 
 
 def compare_numeric(src_num, dst_num):
@@ -156,15 +429,7 @@ def compare_numeric(src_num, dst_num):
         error = "Failed numeric comparison. Collected: {}. Expected: {}".format(dst_num, src_num)
         raise ValueError(error)
 
-    operand = {
-        "<": "__lt__",
-        ">": "__gt__",
-        ">=": "__ge__",
-        "<=": "__le__",
-        "==": "__eq__",
-        "!=": "__ne__",
-    }
-    return getattr(dst_num, operand[match.group(1)])(float(match.group(2)))
+    return _numeric_operators[match.group(1)](dst_num, float(match.group(2)))
 
 
 def empty_tree(input_list):
@@ -175,27 +440,105 @@ def empty_tree(input_list):
     return True
 
 
-def compliance_report(cls, validation_file=None, validation_source=None):
-    report = {}
+ValidationCheck = namedtuple('ValidationCheck', ['key', 'getter', 'kwargs', 'expected'])
+
+
+class ValidationPlan(namedtuple('ValidationPlan', ['checks'])):
+    """
+    A validation file or source compiled by `compile_plan`.
+
+    The modes, regular expressions and numeric comparisons are parsed once, and the plan is
+    never modified, so it can be shared by any number of devices and threads, or pickled to be
+    evaluated in other processes.
+
+    :param checks: Tuple of `ValidationCheck` (key in the report, getter, kwargs of the getter
+        as a tuple of items, compiled expected result), in the order of the validation source.
+    """
+
+    __slots__ = ()
+
+    def _requests(self):
+        """
+        Return the distinct (getter, kwargs) of the checks, and the position of the request of
+        each check.
+        """
+        requests, positions, seen = [], [], {}
+        for check in self.checks:
+            key = (check.getter, freeze(check.kwargs))
+            if key not in seen:
+                seen[key] = len(requests)
+                requests.append((check.getter, dict(copy.deepcopy(check.kwargs))))
+            positions.append(seen[key])
+        return requests, positions
+
+    def getters(self):
+        """
+        Return the getters to call, as expected by `NetworkDriver.get_many`.
+
+        A getter requested by several checks with the same kwargs is called once.
+        """
+        return self._requests()[0]
+
+    def evaluate(self, actual_results):
+        """
+        Return the compliance report, given the results of the getters in the order of
+        `getters()`.
+
+        An exception instead of a result skips the check when it is a `NotImplementedError`
+        and is raised otherwise.
+        """
+        # the actual results are not modified by the comparisons, so they can be shared
+        actual_results = [actual_results[position] for position in self._requests()[1]]
+
+        report = {}
+        for check, actual_result in zip(self.checks, actual_results):
+            if isinstance(actual_result, NotImplementedError):
+                report[check.key] = {"skipped": True, "reason": "NotImplemented"}
+            elif isinstance(actual_result, Exception):
+                raise actual_result
+            else:
+                report[check.key] = check.expected.compare(actual_result)
+
+        complies = all([e.get("complies", True) for e in report.values()])
+        report["skipped"] = [k for k, v in report.items() if v.get("skipped", False)]
+        report["complies"] = complies
+        return report
+
+
+def compile_plan(validation_file=None, validation_source=None):
+    """
+    Compile a validation file or source to a `ValidationPlan`.
+
+    The validation source is not modified. A `ValidationPlan` given as either argument is
+    returned as is.
+
+    :param validation_file: Path to the file containing compliance definition.
+    :param validation_source: List containing compliance rules.
+    :raise ValidationException: The file or source is not valid.
+    """
+    for plan in (validation_file, validation_source):
+        if isinstance(plan, ValidationPlan):
+            return plan
     if validation_file:
         validation_source = _get_validation_file(validation_file)
 
+    checks = []
     for validation_check in validation_source:
         for getter, expected_results in validation_check.items():
             if getter == "get_config":
                 # TBD
                 pass
             else:
+                expected_results = dict(expected_results)
                 key = expected_results.pop("_name", "") or getter
+                kwargs = copy.deepcopy(expected_results.pop('_kwargs', {}))
+                checks.append(ValidationCheck(key, getter, tuple(sorted(kwargs.items())),
+                                              _compile(expected_results)))
+    return ValidationPlan(tuple(checks))
+
+
+def compliance_report(cls, validation_file=None, validation_source=None):
+    plan = compile_plan(validation_file, validation_source)
 
-                try:
-                    kwargs = expected_results.pop('_kwargs', {})
-                    actual_results = getattr(cls, getter)(**kwargs)
-                    report[key] = _compare_getter(expected_results, actual_results)
-                except NotImplementedError:
-                    report[key] = {"skipped": True, "reason": "NotImplemented"}
-
-    complies = all([e.get("complies", True) for e in report.values()])
-    report["skipped"] = [k for k, v in report.items() if v.get("skipped", False)]
-    report["complies"] = complies
-    return report
+    actual_results = cls.get_many(plan.getters(), return_exceptions=True)
+    return plan.evaluate(actual_results)
@@ -34,12 +34,17 @@ setup(
     url="https://github.com/napalm-automation/napalm-base",
     include_package_data=True,
     install_requires=reqs,
+    # conditional dependencies, the markers in requirements.txt are dropped by str(ir.req)
+    extras_require={
+        ':python_version < "3"': ['futures'],
+    },
     entry_points={
         'console_scripts': [
             'cl_napalm_configure=napalm_base.clitools.cl_napalm_configure:main',
             'cl_napalm_test=napalm_base.clitools.cl_napalm_test:main',
             'cl_napalm_validate=napalm_base.clitools.cl_napalm_validate:main',
             'napalm=napalm_base.clitools.cl_napalm:main',
+            'napalm_compliance=napalm_base.clitools.cl_napalm_compliance:main',
         ],
     }
 )
@@ -0,0 +1,14 @@
+"""Fixtures shared by the unit tests."""
+from __future__ import unicode_literals
+
+import pytest
+
+from napalm_base import registry
+
+
+@pytest.fixture(autouse=True)
+def napalm_cache_dir(tmpdir, monkeypatch):
+    """Keep the cache of the driver registry out of the home directory."""
+    cache_dir = str(tmpdir.join('napalm-cache'))
+    monkeypatch.setattr(registry, 'NAPALM_CACHE_DIR', cache_dir)
+    return cache_dir
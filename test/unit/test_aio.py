@@ -0,0 +1,94 @@
+"""Test the asyncio front-end."""
+
+# Python3 support
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import os
+import sys
+import time
+
+import pytest
+
+from napalm_base import get_network_driver
+import napalm_base.exceptions
+
+if sys.version_info < (3, 5):
+    pytest.skip("asyncio front-end requires Python 3.5", allow_module_level=True)
+
+import asyncio  # noqa
+from napalm_base.aio import AsyncNetworkDriver, gather_getter  # noqa
+
+
+BASE_PATH = os.path.dirname(__file__)
+
+
+driver = get_network_driver("mock")
+optional_args = {
+    "path": os.path.join(BASE_PATH, "test_mock_driver"),
+    "profile": ["eos"],
+}
+
+
+def _device(hostname="blah", **kwargs):
+    return driver(hostname, "bleh", "blih", optional_args=dict(optional_args, **kwargs))
+
+
+class TestAsyncNetworkDriver(object):
+    """Test AsyncNetworkDriver."""
+
+    def setup_method(self, method):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+
+    def teardown_method(self, method):
+        self.loop.close()
+
+    def test_getters(self):
+        d = AsyncNetworkDriver(_device())
+        self.loop.run_until_complete(d.open())
+        facts = self.loop.run_until_complete(d.get_facts())
+        assert facts["hostname"] == "localhost"
+        result = self.loop.run_until_complete(d.cli(["a_command", "b_command"]))
+        assert result["a_command"] == "result command a\n"
+        assert self.loop.run_until_complete(d.is_alive()) == {"is_alive": True}
+        self.loop.run_until_complete(d.close())
+        assert d.device.is_alive() == {"is_alive": False}
+
+        with pytest.raises(AttributeError):
+            d.not_a_getter
+
+    def test_context_manager(self):
+        d = AsyncNetworkDriver(_device())
+        self.loop.run_until_complete(d.__aenter__())
+        assert d.device.is_alive() == {"is_alive": True}
+        self.loop.run_until_complete(d.__aexit__(None, None, None))
+        assert d.device.is_alive() == {"is_alive": False}
+
+    def test_exception(self):
+        d = AsyncNetworkDriver(_device())
+        with pytest.raises(napalm_base.exceptions.ConnectionClosedException):
+            self.loop.run_until_complete(d.get_facts())
+
+    def test_cancellation(self):
+        d = AsyncNetworkDriver(_device(latency=0.2))
+        d.device.opened = True
+        task = self.loop.create_task(d.get_facts())
+        self.loop.call_later(0.05, task.cancel)
+        with pytest.raises(asyncio.CancelledError):
+            self.loop.run_until_complete(task)
+        assert d.device.is_alive() == {"is_alive": True}
+        # the device is closed as soon as the blocking call is over
+        time.sleep(0.5)
+        assert d.device.is_alive() == {"is_alive": False}
+
+    def test_gather_getter(self):
+        devices = [_device("device{}".format(i), latency=0.2) for i in range(20)]
+        devices.append(_device("broken", fail_on_open=True))
+        start = time.time()
+        results = self.loop.run_until_complete(gather_getter(devices, "get_facts",
+                                                             concurrency=20))
+        assert time.time() - start < 2
+        assert [r["hostname"] for r in results[:-1]] == ["localhost"] * 20
+        assert isinstance(results[-1], napalm_base.exceptions.ConnectionException)
+        assert not any(d.is_alive()["is_alive"] for d in devices)
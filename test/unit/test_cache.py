@@ -0,0 +1,102 @@
+"""Test the cache of the getters."""
+
+# Python3 support
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import time
+
+from napalm_base.base import NetworkDriver
+
+
+class FakeDriver(NetworkDriver):
+    """Count the calls to the device."""
+
+    def __init__(self, hostname, username, password, timeout=60, optional_args=None):
+        self.calls = 0
+
+    def get_facts(self):
+        self.calls += 1
+        return {"hostname": "localhost", "calls": self.calls}
+
+    def get_route_to(self, destination='', protocol=''):
+        self.calls += 1
+        return {destination: [{"protocol": protocol}]}
+
+    def load_merge_candidate(self, filename=None, config=None):
+        pass
+
+    def commit_config(self):
+        pass
+
+
+def _device(**cache_args):
+    return FakeDriver("blah", "bleh", "blih", optional_args={"getter_cache": cache_args or True})
+
+
+class TestGetterCache(object):
+    """Test the getter cache."""
+
+    def test_disabled_by_default(self):
+        d = FakeDriver("blah", "bleh", "blih", optional_args={})
+        assert d.get_facts()["calls"] == 1
+        assert d.get_facts()["calls"] == 2
+        assert not hasattr(d, "getter_cache")
+
+    def test_hit(self):
+        d = _device()
+        assert d.get_facts()["calls"] == 1
+        assert d.get_facts()["calls"] == 1
+        assert d.getter_cache.stats() == {
+            "hits": 1, "misses": 1, "size": 1,
+            "getters": {"get_facts": {"hits": 1, "misses": 1}},
+        }
+
+    def test_kwargs(self):
+        d = _device()
+        d.get_route_to("1.1.1.1", protocol="bgp")
+        d.get_route_to(destination="2.2.2.2", protocol="bgp")
+        d.get_route_to("1.1.1.1", protocol="bgp")
+        assert d.calls == 2
+
+    def test_copy(self):
+        d = _device()
+        d.get_facts()["hostname"] = "changed"
+        assert d.get_facts()["hostname"] == "localhost"
+
+    def test_ttl(self):
+        d = _device(ttl=0.05, ttls={"get_route_to": 0})
+        d.get_facts()
+        d.get_route_to()
+        d.get_route_to()
+        assert d.calls == 3
+        time.sleep(0.1)
+        assert d.get_facts()["calls"] == 4
+
+    def test_lru(self):
+        d = _device(maxsize=2)
+        d.get_route_to("1")
+        d.get_route_to("2")
+        d.get_route_to("1")
+        d.get_route_to("3")  # evicts "2"
+        assert len(d.getter_cache) == 2
+        d.get_route_to("1")
+        assert d.calls == 3
+        d.get_route_to("2")
+        assert d.calls == 4
+
+    def test_invalidation(self):
+        d = _device()
+        d.get_facts()
+        d.load_merge_candidate(config="hostname changed")
+        assert len(d.getter_cache) == 0
+        d.get_facts()
+        d.commit_config()
+        assert d.get_facts()["calls"] == 3
+
+    def test_enable(self):
+        d = FakeDriver("blah", "bleh", "blih")
+        d.enable_getter_cache(ttl=10)
+        d.get_facts()
+        d.get_facts()
+        assert d.calls == 1
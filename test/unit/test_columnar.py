@@ -0,0 +1,96 @@
+"""Test the columnar export of the getters."""
+
+# Python3 support
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import pytest
+
+from napalm_base import columnar
+from napalm_base import records
+
+
+ARP_TABLE = [
+    {'interface': 'Ethernet1', 'mac': '5C:5E:AB:DA:3C:F0', 'ip': '172.17.17.1', 'age': 12.0},
+    {'interface': 'Ethernet2', 'mac': '5C:5E:AB:DA:3C:FF', 'ip': '172.17.17.2', 'age': 13.0},
+]
+
+
+def counters(**values):
+    row = dict.fromkeys(['tx_errors', 'rx_errors', 'tx_discards', 'rx_discards',
+                         'tx_octets', 'rx_octets', 'tx_unicast_packets', 'rx_unicast_packets',
+                         'tx_multicast_packets', 'rx_multicast_packets',
+                         'tx_broadcast_packets', 'rx_broadcast_packets'], 0)
+    row.update(values)
+    return row
+
+
+class TestColumns(object):
+    """Test to_columns."""
+
+    def test_list(self):
+        columns = columnar.to_columns('get_arp_table', ARP_TABLE)
+        assert list(columns) == ['age', 'interface', 'ip', 'mac']
+        assert columns['ip'] == ['172.17.17.1', '172.17.17.2']
+        assert columns['age'] == [12.0, 13.0]
+
+    def test_records(self):
+        table = records.to_records(ARP_TABLE, 'arp_table')
+        assert columnar.to_columns('get_arp_table', table) == \
+            columnar.to_columns('get_arp_table', ARP_TABLE)
+
+    def test_dict(self):
+        columns = columnar.to_columns('get_interfaces_counters',
+                                      {'Ethernet1': counters(rx_octets=10)})
+        assert list(columns)[0] == 'interface'
+        assert columns['interface'] == ['Ethernet1']
+        assert columns['rx_octets'] == [10]
+
+    def test_unsupported_getter(self):
+        with pytest.raises(ValueError):
+            columnar.to_columns('get_facts', {})
+
+
+class TestArrays(object):
+    """Test the NumPy arrays."""
+
+    def setup_method(self, method):
+        self.numpy = pytest.importorskip('numpy')
+
+    def test_structured_array(self):
+        array = columnar.to_structured_array('get_arp_table', ARP_TABLE)
+        assert array.dtype['age'] == self.numpy.float64
+        assert array.dtype['ip'].kind == 'U'
+        assert list(array['mac']) == ['5C:5E:AB:DA:3C:F0', '5C:5E:AB:DA:3C:FF']
+
+        array = columnar.to_structured_array('get_mac_address_table', [{
+            'mac': '00:1C:58:29:4A:71', 'interface': 'Ethernet47', 'vlan': 100, 'static': False,
+            'active': True, 'moves': 1, 'last_move': 1454417742.58}])
+        assert array.dtype['vlan'] == self.numpy.int64
+        assert array.dtype['static'] == self.numpy.bool_
+        assert array['vlan'][0] == 100
+
+    def test_empty(self):
+        assert len(columnar.to_structured_array('get_arp_table', [])) == 0
+
+    def test_counter_rates(self):
+        before = {
+            'Ethernet1': counters(rx_octets=1000, tx_octets=500, rx_errors=-1),
+            'Ethernet2': counters(rx_octets=5000),
+            'Ethernet3': counters(),
+        }
+        after = {
+            'Ethernet2': counters(rx_octets=10),  # reset
+            'Ethernet1': counters(rx_octets=3000, tx_octets=500, rx_errors=-1),
+            'Ethernet4': counters(),
+        }
+        rates = columnar.counter_rates(before, columnar.to_structured_array(
+            'get_interfaces_counters', after), 10)
+        assert list(rates['interface']) == ['Ethernet1', 'Ethernet2']
+        assert list(rates['rx_octets'][:1]) == [200.0]
+        assert rates['tx_octets'][0] == 0.0
+        assert self.numpy.isnan(rates['rx_errors'][0])
+        assert self.numpy.isnan(rates['rx_octets'][1])
+
+        with pytest.raises(ValueError):
+            columnar.counter_rates(before, after, 0)
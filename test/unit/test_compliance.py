@@ -0,0 +1,150 @@
+"""Test the fleet compliance runner."""
+
+# Python3 support
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import io
+import os
+import sys
+import json
+
+import pytest
+
+from napalm_base import compliance
+from napalm_base import validate
+from napalm_base.clitools import cl_napalm_compliance
+from napalm_base.mock import MockDriver
+import napalm_base.exceptions
+
+
+BASE_PATH = os.path.join(os.path.dirname(__file__), "test_compliance")
+VALIDATION_FILE = os.path.join(BASE_PATH, "validate.yml")
+
+
+def _device(hostname, data, **optional_args):
+    optional_args = dict({"path": os.path.join(BASE_PATH, data)}, **optional_args)
+    return ("mock", hostname, "user", "pass", optional_args)
+
+
+INVENTORY = [
+    _device("edge01", "compliant"),
+    _device("edge02", "non_compliant"),
+    _device("edge03", "compliant", fail_on_open=True),
+]
+
+
+def _by_hostname(results):
+    return {result.device.hostname: result for result in results}
+
+
+def _expected_report(data):
+    device = MockDriver("localhost", "user", "pass",
+                        optional_args={"path": os.path.join(BASE_PATH, data)})
+    device.open()
+    return device.compliance_report(VALIDATION_FILE)
+
+
+class TestRunCompliance(object):
+    """Test run_compliance."""
+
+    @pytest.mark.parametrize("processes", [None, 2])
+    def test_reports(self, processes):
+        plan = validate.compile_plan(VALIDATION_FILE)
+        results = _by_hostname(compliance.run_compliance(INVENTORY, plan, processes=processes))
+        assert sorted(results) == ["edge01", "edge02", "edge03"]
+
+        edge01 = results["edge01"]
+        assert edge01.exception is None
+        assert edge01.complies
+        assert edge01.report == _expected_report("compliant")
+        # get_facts is collected once for both checks, there is no mocked data for a second call
+        assert edge01.report["get_facts"]["complies"]
+        assert edge01.report["get_facts_vendor"]["complies"]
+        assert edge01.report["skipped"] == ["get_bgp_neighbors"]
+
+        edge02 = results["edge02"]
+        assert not edge02.complies
+        assert edge02.report == _expected_report("non_compliant")
+        assert edge02.report["get_facts"]["present"]["interface_list"]["diff"]["extra"] == \
+            ["Ethernet2"]
+
+        edge03 = results["edge03"]
+        assert not edge03.complies
+        assert edge03.report is None
+        assert isinstance(edge03.exception, napalm_base.exceptions.ConnectionException)
+
+    @pytest.mark.parametrize("processes", [None, 2])
+    def test_records(self, processes):
+        inventory = [_device("edge01", "compliant", getter_records=True),
+                     _device("edge02", "non_compliant", getter_records=True)]
+        results = _by_hostname(compliance.run_compliance(inventory, VALIDATION_FILE,
+                                                         processes=processes))
+        assert results["edge01"].complies
+        assert results["edge01"].report == _expected_report("compliant")
+        assert not results["edge02"].complies
+        assert results["edge02"].report == _expected_report("non_compliant")
+        # the extra entries are reported as dictionaries
+        extra = results["edge02"].report["get_arp_table"]["extra"]
+        assert [entry["ip"] for entry in extra] == ["10.0.0.2"]
+        json.loads(results["edge02"].to_json())
+
+    def test_validation_file(self):
+        results = _by_hostname(compliance.run_compliance(INVENTORY[:1], VALIDATION_FILE))
+        assert results["edge01"].report == _expected_report("compliant")
+
+    def test_timeout(self):
+        result, = compliance.run_compliance([_device("edge01", "compliant", latency=1)],
+                                            VALIDATION_FILE, timeout=0.1)
+        assert isinstance(result.exception, napalm_base.exceptions.ConnectTimeoutError)
+        assert not result.complies
+
+    def test_json_lines(self):
+        stream = io.StringIO()
+        complies = compliance.write_json_lines(
+            compliance.run_compliance(INVENTORY, VALIDATION_FILE), stream)
+        assert not complies
+
+        lines = [json.loads(line) for line in stream.getvalue().splitlines()]
+        results = {line["hostname"]: line for line in lines}
+        assert sorted(results) == ["edge01", "edge02", "edge03"]
+        assert results["edge01"]["complies"] is True
+        assert results["edge01"]["driver"] == "mock"
+        assert results["edge01"]["report"] == _expected_report("compliant")
+        assert results["edge02"]["complies"] is False
+        assert results["edge03"]["report"] is None
+        assert results["edge03"]["exception"].startswith("ConnectionException: ")
+
+
+class TestCli(object):
+    """Test the napalm_compliance command."""
+
+    def _run(self, monkeypatch, tmpdir, devices, *options):
+        inventory = tmpdir.join("inventory.yml")
+        inventory.write(json.dumps(devices))
+        stdout = io.StringIO()
+        monkeypatch.setattr(sys, "stdout", stdout)
+        monkeypatch.setattr(sys, "argv", ["napalm_compliance", str(inventory), VALIDATION_FILE,
+                                          "--vendor", "mock", "--password", "pass"] +
+                            list(options))
+        with pytest.raises(SystemExit) as exit:
+            cl_napalm_compliance.main()
+        return exit.value.code, [json.loads(line) for line in stdout.getvalue().splitlines()]
+
+    def test_complies(self, monkeypatch, tmpdir):
+        devices = [{"hostname": "edge01",
+                    "optional_args": {"path": os.path.join(BASE_PATH, "compliant")}}]
+        code, lines = self._run(monkeypatch, tmpdir, devices)
+        assert code == 0
+        assert [line["hostname"] for line in lines] == ["edge01"]
+        assert lines[0]["report"] == _expected_report("compliant")
+
+    def test_does_not_comply(self, monkeypatch, tmpdir):
+        devices = [{"hostname": "edge01"}, {"hostname": "edge02", "driver": "mock",
+                                            "optional_args": {"latency": 0}}]
+        code, lines = self._run(monkeypatch, tmpdir, devices, "--workers", "2",
+                                "--optional_args",
+                                "path='{}'".format(os.path.join(BASE_PATH, "non_compliant")))
+        assert code == 1
+        assert sorted(line["hostname"] for line in lines) == ["edge01", "edge02"]
+        assert all(line["report"] == _expected_report("non_compliant") for line in lines)
@@ -0,0 +1,74 @@
+"""Test the concurrent execution of getters."""
+
+# Python3 support
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import os
+import time
+
+from napalm_base.executor import Device, run_getters
+from napalm_base.mock import MockDriver
+from napalm_base.pool import DriverPool
+import napalm_base.exceptions
+
+
+BASE_PATH = os.path.dirname(__file__)
+
+
+def _inventory(count, **optional_args):
+    optional_args = dict({"path": os.path.join(BASE_PATH, "test_mock_driver")}, **optional_args)
+    return [("mock", "device{}".format(i), "user", "pass", optional_args) for i in range(count)]
+
+
+class TestRunGetters(object):
+    """Test run_getters."""
+
+    def test_results(self):
+        results = list(run_getters(_inventory(3), ["get_facts", "get_route_to"]))
+        assert sorted(r.device.hostname for r in results) == ["device0", "device1", "device2"]
+        for result in results:
+            assert isinstance(result.device, Device)
+            assert result.exception is None
+            assert result.results["get_facts"]["hostname"] == "localhost"
+            assert isinstance(result.errors["get_route_to"], NotImplementedError)
+
+    def test_device_formats(self):
+        path = os.path.join(BASE_PATH, "test_mock_driver")
+        inventory = [
+            Device(MockDriver, "a", "user", "pass", {"path": path}),
+            {"driver": "mock", "hostname": "b", "username": "user", "password": "pass",
+             "optional_args": {"path": path}},
+        ]
+        results = list(run_getters(inventory, [("get_facts", {})]))
+        assert all(r.results["get_facts"]["hostname"] == "localhost" for r in results)
+
+    def test_concurrency(self):
+        start = time.time()
+        results = list(run_getters(_inventory(10, latency=0.2), ["get_facts"], max_workers=10))
+        # open + get_facts in every device, 0.4 seconds when run concurrently
+        assert time.time() - start < 2
+        assert len(results) == 10
+
+    def test_streaming(self):
+        inventory = _inventory(1, latency=0.5) + _inventory(1)
+        results = run_getters(inventory, ["get_facts"], max_workers=2)
+        assert next(results).device.optional_args.get("latency") is None
+        assert next(results).device.optional_args.get("latency") == 0.5
+
+    def test_timeout(self):
+        result, = run_getters(_inventory(1, latency=1), ["get_facts"], timeout=0.1)
+        assert isinstance(result.exception, napalm_base.exceptions.ConnectTimeoutError)
+        assert result.results == {}
+
+    def test_connection_error(self):
+        result, = run_getters(_inventory(1, fail_on_open=True), ["get_facts"])
+        assert isinstance(result.exception, napalm_base.exceptions.ConnectionException)
+
+    def test_pool(self):
+        with DriverPool() as pool:
+            list(run_getters(_inventory(2), ["get_facts"], pool=pool))
+            assert len(pool) == 2
+            results = list(run_getters(_inventory(2), ["get_facts"], pool=pool))
+            # the sessions are reused, so the second call of get_facts is mocked
+            assert all(r.results["get_facts"]["hostname"] == "changed_hostname" for r in results)
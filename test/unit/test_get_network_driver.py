@@ -2,10 +2,22 @@
 from __future__ import print_function
 from __future__ import unicode_literals
 
+import os
+import sys
+import shutil
+import tempfile
+import types
 import unittest
 from ddt import ddt, data
 
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+import napalm_base
 from napalm_base import get_network_driver
+from napalm_base import registry
 from napalm_base.base import NetworkDriver
 from napalm_base.exceptions import ModuleImportError
 
@@ -25,3 +37,99 @@ class TestGetNetworkDriver(unittest.TestCase):
     def test_get_wrong_network_driver(self, driver):
         """Check that inexisting driver throws ModuleImportError."""
         self.assertRaises(ModuleImportError, get_network_driver, driver, prepend=False)
+
+
+class FakeDriver(NetworkDriver):
+    """Driver used to test the registry."""
+
+    def __init__(self, hostname, username, password, timeout=60, optional_args=None):
+        pass
+
+
+class TestDriverRegistry(unittest.TestCase):
+    """Test the driver registry used by get_network_driver."""
+
+    def setUp(self):
+        napalm_base.invalidate_network_driver()
+        module = types.ModuleType(str('napalm_fakeos'))
+        module.FakeDriver = FakeDriver
+        sys.modules['napalm_fakeos'] = module
+
+    def tearDown(self):
+        napalm_base.invalidate_network_driver()
+        sys.modules.pop('napalm_fakeos', None)
+
+    def test_lookup_is_registered(self):
+        """Check that the resolved class is stored under the normalized name."""
+        self.assertIs(get_network_driver('fake-os'), FakeDriver)
+        self.assertEqual(napalm_base.list_network_drivers(), {'napalm_fakeos': FakeDriver})
+
+    def test_lookup_skips_import(self):
+        """Check that a registered driver is returned without importing the library again."""
+        get_network_driver('fakeos')
+        with mock.patch('importlib.import_module') as import_module:
+            self.assertIs(get_network_driver('FAKEOS'), FakeDriver)
+            self.assertIs(get_network_driver('napalm_fakeos'), FakeDriver)
+        self.assertFalse(import_module.called)
+
+    def test_register(self):
+        """Check that a driver can be registered upfront."""
+        napalm_base.register_network_driver('not-installed', FakeDriver)
+        self.assertIs(get_network_driver('notinstalled'), FakeDriver)
+        self.assertIs(get_network_driver('napalm_notinstalled'), FakeDriver)
+
+    def test_invalidate(self):
+        """Check that invalidated drivers are not returned anymore."""
+        napalm_base.register_network_driver('notinstalled', FakeDriver)
+        napalm_base.invalidate_network_driver('notinstalled')
+        self.assertNotIn('napalm_notinstalled', napalm_base.list_network_drivers())
+        self.assertRaises(ModuleImportError, get_network_driver, 'notinstalled')
+
+
+class TestEntryPointDiscovery(unittest.TestCase):
+    """Test the discovery of drivers through the napalm.drivers entry points."""
+
+    entry_points = [('fake-os', '{}:FakeDriver'.format(__name__)),
+                    ('broken', 'napalm_does_not_exist:Driver')]
+
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+        patchers = [
+            mock.patch.object(registry, 'NAPALM_CACHE_DIR', self.cache_dir),
+            mock.patch.object(registry, '_iter_entry_points', return_value=self.entry_points),
+        ]
+        self.iter_entry_points = patchers[1].start()
+        patchers[0].start()
+        for patcher in patchers:
+            self.addCleanup(patcher.stop)
+        napalm_base.invalidate_network_driver()
+        self.addCleanup(napalm_base.invalidate_network_driver)
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir)
+
+    def test_lazy_import(self):
+        """Check that entry points are listed without being imported."""
+        drivers = napalm_base.list_network_drivers()
+        self.assertEqual(drivers['napalm_fakeos'], '{}:FakeDriver'.format(__name__))
+        self.assertIs(get_network_driver('fake-os'), FakeDriver)
+        self.assertIs(napalm_base.list_network_drivers()['napalm_fakeos'], FakeDriver)
+
+    def test_broken_entry_point(self):
+        """Check that a broken entry point raises ModuleImportError."""
+        self.assertRaises(ModuleImportError, get_network_driver, 'broken')
+
+    def test_disk_cache(self):
+        """Check that entry points are read from the disk cache."""
+        self.assertEqual(registry.discover_network_drivers(), dict(
+            (registry.normalize_driver_name(name), reference)
+            for name, reference in self.entry_points))
+        self.assertEqual(self.iter_entry_points.call_count, 1)
+        self.assertTrue(os.path.exists(os.path.join(self.cache_dir, 'drivers.json')))
+
+        registry.discover_network_drivers()
+        self.assertEqual(self.iter_entry_points.call_count, 1)
+
+        with mock.patch.object(registry, '_sys_path_fingerprint', return_value='changed'):
+            registry.discover_network_drivers()
+        self.assertEqual(self.iter_entry_points.call_count, 2)
@@ -7,8 +7,12 @@ from __future__ import print_function
 from __future__ import unicode_literals
 
 # Python std lib
+import io
 import os
 import sys
+import random
+import shutil
+import tempfile
 import unittest
 
 # third party libs
@@ -40,8 +44,24 @@ except ImportError:
 import napalm_base.helpers
 import napalm_base.exceptions
 from napalm_base.base import NetworkDriver
+from napalm_base.utils import py23_compat
 from napalm_base.utils.string_parsers import convert_uptime_string_seconds
 
+_TEXTFSM_TEST_STRING = '''
+        Groups: 3 Peers: 3 Down peers: 0
+        Table          Tot Paths  Act Paths Suppressed    History Damp State    Pending
+        inet.0               947        310          0          0          0          0
+        inet6.0              849        807          0          0          0          0
+        Peer                     AS      InPkt     OutPkt    OutQ   Flaps Last Up/Dwn State|#Active/Received/Damped...  #noqa
+        10.247.68.182         65550     131725   28179233       0      11     6w3d17h Establ
+          inet.0: 4/5/1
+          inet6.0: 0/0/0
+        10.254.166.246        65550     136159   29104942       0       0      6w5d6h Establ
+          inet.0: 0/0/0
+          inet6.0: 7/8/1
+        192.0.2.100           65551    1269381    1363320       0       1      9w5d6h 2/3/0 0/0/0
+        '''
+
 
 class TestBaseHelpers(unittest.TestCase):
     """Test helpers functions."""
@@ -133,6 +153,70 @@ class TestBaseHelpers(unittest.TestCase):
                                 '__this_template_does_not_exist__',
                                 **_TEMPLATE_VARS)
 
+    def test_load_template_cache(self):
+        """
+        Tests the caches used by ```load_template```:
+
+            * check if the environment of a search path is reused
+            * check if string templates are compiled once
+            * check if the bytecode of the templates is stored when requested
+        """
+        napalm_base.helpers.load_template(self.network_driver, '__a_very_nice_template__',
+                                          peers=[])
+        environments = dict(napalm_base.helpers._jinja_environments)
+        napalm_base.helpers.load_template(self.network_driver, '__a_very_nice_template__',
+                                          peers=[])
+        self.assertEqual(environments, napalm_base.helpers._jinja_environments)
+
+        template_source = 'ntp server {{ server }}'
+        template = napalm_base.helpers._string_template(template_source)
+        self.assertIs(template, napalm_base.helpers._string_template(template_source))
+        self.assertTrue(napalm_base.helpers.load_template(self.network_driver, 'ntp',
+                                                          template_source=template_source,
+                                                          server='172.17.17.1'))
+
+        cache_dir = tempfile.mkdtemp()
+        try:
+            napalm_base.helpers.set_template_bytecode_cache(cache_dir)
+            self.assertTrue(napalm_base.helpers.load_template(self.network_driver,
+                                                              '__a_very_nice_template__',
+                                                              peers=[]))
+            self.assertTrue(os.listdir(cache_dir))
+        finally:
+            napalm_base.helpers.set_template_bytecode_cache(None)
+            shutil.rmtree(cache_dir)
+
+    def test_render_templates(self):
+        """
+        Tests the helper function ```render_templates```:
+
+            * check if the configurations are keyed like the variables
+            * check if a list of variables gives configurations keyed by position
+            * check if the batch can be rendered in a process pool
+            * check if raises TemplateNotImplemented when the template does not exist
+        """
+        configurations = FakeNetworkDriver.render_templates('__a_very_nice_template__', {
+            'edge01': {'peers': ['172.17.17.1']},
+            'edge02': {'peers': ['172.17.17.2', '172.17.17.3']},
+        })
+        self.assertEqual(sorted(configurations), ['edge01', 'edge02'])
+        self.assertIn('ntp peer 172.17.17.3', configurations['edge02'])
+        self.assertNotIn('172.17.17.3', configurations['edge01'])
+
+        template_source = 'ntp server {{ server }}'
+        template_vars = [{'server': '10.0.0.{}'.format(i)} for i in range(10)]
+        configurations = NetworkDriver.render_templates('ntp', template_vars,
+                                                        template_source=template_source)
+        self.assertEqual(configurations[3], 'ntp server 10.0.0.3')
+        self.assertEqual(configurations, napalm_base.helpers.render_templates(
+            NetworkDriver, 'ntp', template_vars, template_source=template_source, processes=2,
+            chunksize=3))
+
+        self.assertRaises(napalm_base.exceptions.TemplateNotImplemented,
+                          FakeNetworkDriver.render_templates,
+                          '__this_template_does_not_exist__',
+                          [{}])
+
     def test_textfsm_extractor(self):
         """
         Tests the helper function ```textfsm_extractor```:
@@ -144,21 +228,6 @@ class TestBaseHelpers(unittest.TestCase):
         """
 
         self.assertTrue(HAS_TEXTFSM)  # before anything else, let's see if TextFSM is available
-        _TEXTFSM_TEST_STRING = '''
-        Groups: 3 Peers: 3 Down peers: 0
-        Table          Tot Paths  Act Paths Suppressed    History Damp State    Pending
-        inet.0               947        310          0          0          0          0
-        inet6.0              849        807          0          0          0          0
-        Peer                     AS      InPkt     OutPkt    OutQ   Flaps Last Up/Dwn State|#Active/Received/Damped...  #noqa
-        10.247.68.182         65550     131725   28179233       0      11     6w3d17h Establ
-          inet.0: 4/5/1
-          inet6.0: 0/0/0
-        10.254.166.246        65550     136159   29104942       0       0      6w5d6h Establ
-          inet.0: 0/0/0
-          inet6.0: 7/8/1
-        192.0.2.100           65551    1269381    1363320       0       1      9w5d6h 2/3/0 0/0/0
-        '''
-
         self.assertRaises(napalm_base.exceptions.TemplateNotImplemented,
                           napalm_base.helpers.textfsm_extractor,
                           self.network_driver,
@@ -182,6 +251,127 @@ class TestBaseHelpers(unittest.TestCase):
                                                                     _TEXTFSM_TEST_STRING),
                               list)
 
+    def test_textfsm_extractor_cache(self):
+        """
+        Tests the cache of compiled templates used by ```textfsm_extractor```:
+
+            * check if the parser is reused and reset between calls
+            * check if the template is compiled again when the file changes
+        """
+        raw_text = _TEXTFSM_TEST_STRING
+        _, template_path = napalm_base.helpers._textfsm_template_path(
+            self.network_driver, '__a_very_nice_template__')
+
+        first = napalm_base.helpers.textfsm_extractor(self.network_driver,
+                                                      '__a_very_nice_template__', raw_text)
+        mtime, header, idle = napalm_base.helpers._textfsm_parsers[template_path]
+        self.assertEqual(len(idle), 1)
+        parser = idle[0]
+        second = napalm_base.helpers.textfsm_extractor(self.network_driver,
+                                                       '__a_very_nice_template__', raw_text)
+        self.assertTrue(first)
+        self.assertEqual(first, second)
+        self.assertEqual(napalm_base.helpers._textfsm_parsers[template_path][2], [parser])
+
+        os.utime(template_path, (mtime + 10, mtime + 10))
+        try:
+            self.assertEqual(first, napalm_base.helpers.textfsm_extractor(
+                self.network_driver, '__a_very_nice_template__', raw_text))
+            self.assertIsNot(napalm_base.helpers._textfsm_parsers[template_path][2][0], parser)
+        finally:
+            os.utime(template_path, (mtime, mtime))
+
+    def test_iter_textfsm_extractor(self):
+        """
+        Tests the helper function ```iter_textfsm_extractor```:
+
+            * check if the entries are the same as the ones of ```textfsm_extractor```
+            * check if accepts a list of lines, a file object and a string
+            * check if the entries are yielded before the whole output is read
+        """
+        expected = napalm_base.helpers.textfsm_extractor(self.network_driver,
+                                                         '__a_very_nice_template__',
+                                                         _TEXTFSM_TEST_STRING)
+        lines = _TEXTFSM_TEST_STRING.splitlines(True)
+        for source in (lines, io.StringIO(_TEXTFSM_TEST_STRING), _TEXTFSM_TEST_STRING):
+            self.assertEqual(list(napalm_base.helpers.iter_textfsm_extractor(
+                self.network_driver, '__a_very_nice_template__', source)), expected)
+
+        consumed = []
+
+        def read():
+            for line in lines:
+                consumed.append(line)
+                yield line
+
+        entries = napalm_base.helpers.iter_textfsm_extractor(self.network_driver,
+                                                             '__a_very_nice_template__', read())
+        self.assertEqual(next(entries), expected[0])
+        self.assertLess(len(consumed), len(lines))
+
+        self.assertRaises(napalm_base.exceptions.TemplateNotImplemented, list,
+                          napalm_base.helpers.iter_textfsm_extractor(
+                              self.network_driver, '__this_template_does_not_exist__', lines))
+
+    def test_iter_textfsm_extractor_fillup(self):
+        """
+        Tests the helper function ```iter_textfsm_extractor``` with ```Fillup``` values:
+
+            * check if the entries are the same as the ones of ```textfsm_extractor```
+            * check if the entries are yielded once their values are filled up
+        """
+        raw_text = 'mac a\nmac b\nvlan 10\nmac c\nvlan 20\nmac d\n'
+        expected = napalm_base.helpers.textfsm_extractor(self.network_driver,
+                                                         '__fillup_template__', raw_text)
+        self.assertEqual([(e['vlan'], e['mac']) for e in expected],
+                         [('10', 'a'), ('10', 'b'), ('10', ''), ('20', 'c'), ('20', ''),
+                          ('', 'd')])
+        self.assertEqual(list(napalm_base.helpers.iter_textfsm_extractor(
+            self.network_driver, '__fillup_template__', raw_text)), expected)
+
+        consumed = []
+
+        def read():
+            for line in raw_text.splitlines():
+                consumed.append(line)
+                yield line
+
+        entries = napalm_base.helpers.iter_textfsm_extractor(self.network_driver,
+                                                             '__fillup_template__', read())
+        self.assertEqual(next(entries), expected[0])
+        self.assertEqual(consumed, ['mac a', 'mac b', 'vlan 10'])
+
+    def test_textfsm_extractor_many(self):
+        """
+        Tests the helper function ```textfsm_extractor_many```:
+
+            * check if the tables are returned in the same order as the jobs
+            * check if the template can be given by directory or by driver
+            * check if the jobs can be parsed in a process pool
+            * check if the exceptions can be returned instead of raised
+        """
+        template_dir, _ = napalm_base.helpers._textfsm_template_path(self.network_driver, '')
+        expected = napalm_base.helpers.textfsm_extractor(self.network_driver,
+                                                         '__a_very_nice_template__',
+                                                         _TEXTFSM_TEST_STRING)
+        jobs = [
+            (FakeNetworkDriver, '__a_very_nice_template__', _TEXTFSM_TEST_STRING),
+            (template_dir, '__a_very_nice_template__', ''),
+            (template_dir, '__a_very_nice_template__', _TEXTFSM_TEST_STRING),
+        ]
+        self.assertEqual(napalm_base.helpers.textfsm_extractor_many(jobs),
+                         [expected, [], expected])
+        self.assertEqual(napalm_base.helpers.textfsm_extractor_many(jobs * 3, processes=2),
+                         [expected, [], expected] * 3)
+
+        jobs.append((template_dir, '__this_template_does_not_exist__', ''))
+        self.assertRaises(napalm_base.exceptions.TemplateNotImplemented,
+                          napalm_base.helpers.textfsm_extractor_many, jobs)
+        results = napalm_base.helpers.textfsm_extractor_many(jobs, processes=2, chunksize=1,
+                                                             return_exceptions=True)
+        self.assertEqual(results[:3], [expected, [], expected])
+        self.assertIsInstance(results[3], napalm_base.exceptions.TemplateNotImplemented)
+
     def test_convert(self):
         """
         Tests helper function ```convert```:
@@ -199,6 +389,18 @@ class TestBaseHelpers(unittest.TestCase):
         self.assertTrue(napalm_base.helpers.convert(str, None) == u'')
         # should return empty unicode
 
+    def test_convert_many(self):
+        """
+        Tests helper function ```convert_many```:
+
+            * check if the output is the same as ```convert``` for every value
+        """
+        values = ['1', '2.5', None, 'non-int-value', 3]
+        for to in (int, float, py23_compat.text_type):
+            self.assertEqual(napalm_base.helpers.convert_many(to, values, default=-1),
+                             [napalm_base.helpers.convert(to, who, default=-1) for who in values])
+        self.assertEqual(napalm_base.helpers.convert_many(int, iter(['1', '2'])), [1, 2])
+
     def test_find_txt(self):
 
         """
@@ -276,6 +478,21 @@ class TestBaseHelpers(unittest.TestCase):
 
         self.assertTrue(len(napalm_base.helpers.find_txt(_NOT_SPECIAL_CHILD2, '.')) > 0)
 
+        # precompiled XPath
+        self.assertEqual(napalm_base.helpers.find_txt(_XML_TREE, ET.XPath('stats/children')),
+                         '4')
+        self.assertIn('stats/parents', napalm_base.helpers._xpath_cache)
+
+        # invalid XPath returns the default value
+        self.assertEqual(napalm_base.helpers.find_txt(_XML_TREE, 'stats/[', 'oops'), 'oops')
+
+        self.assertEqual(napalm_base.helpers.find_txt_many(_XML_TREE, {
+            'parents': 'stats/parents',
+            'children': ET.XPath('stats/children'),
+            'lonely': 'parent3/@lonely',
+            'missing': 'parent100/child200',
+        }), {'parents': '3', 'children': '4', 'lonely': 'true', 'missing': ''})
+
     def test_mac(self):
 
         """
@@ -294,6 +511,70 @@ class TestBaseHelpers(unittest.TestCase):
         self.assertEqual(napalm_base.helpers.mac('0123.4567.89ab'), '01:23:45:67:89:AB')
         self.assertEqual(napalm_base.helpers.mac('123.4567.89ab'), '01:23:45:67:89:AB')
 
+    def test_macs(self):
+        """
+        Tests the helper function ```macs```:
+
+            * check if the output is the same as ```mac``` for many formats
+            * check if raises AddrFormatError when invalid MAC
+        """
+        rand = random.Random(42)
+        raw_values = ['a9:c5:2e:7b:6:', '123.4567.89ab', '1:2:3:4:5:6', '0123:4567:89ab',
+                      '0123-4567-89ab']
+        for _ in range(200):
+            octets = ['{:02x}'.format(rand.randint(0, 255)) for _ in range(6)]
+            if rand.random() < 0.5:
+                octets = [o.upper() for o in octets]
+            raw_values.extend([':'.join(octets), '-'.join(octets), ''.join(octets),
+                               '.'.join(''.join(octets[i:i + 2]) for i in (0, 2, 4))])
+        self.assertEqual(napalm_base.helpers.macs(raw_values),
+                         [napalm_base.helpers.mac(raw) for raw in raw_values])
+        self.assertEqual(napalm_base.helpers.macs(raw_values),
+                         [napalm_base.helpers.mac(raw) for raw in raw_values])
+        self.assertRaises(AddrFormatError, napalm_base.helpers.macs, ['0123456789ab', 'fake'])
+        self.assertRaises(AddrFormatError, napalm_base.helpers.macs, ['01-23:45:67:89:ab'])
+
+        # trailing whitespace, as in lines of CLI output
+        for raw in ('01:23:45:67:89:AB\n', '01:23:45:67:89:ab\n', '0123.4567.89ab\n',
+                    '0123456789ab\r\n', ' 01:23:45:67:89:AB', '01-23-45-67-89-ab \n'):
+            try:
+                expected = napalm_base.helpers.mac(raw)
+            except AddrFormatError:
+                self.assertRaises(AddrFormatError, napalm_base.helpers.macs, [raw])
+            else:
+                self.assertEqual(napalm_base.helpers.macs([raw]), [expected])
+
+    def test_ips(self):
+        """
+        Tests the helper function ```ips```:
+
+            * check if the output is the same as ```ip```
+            * check if calls using incorrect version raises ValueError
+        """
+        rand = random.Random(42)
+        addrs = ['2001:0dB8:85a3:0000:0000:8A2e:0370:7334', '2001:0DB8::0003', '::ffff:1.2.3.4',
+                 '0.0.0.0', '255.255.255.255']
+        for _ in range(200):
+            addrs.append('.'.join(str(rand.randint(0, 255)) for _ in range(4)))
+            addrs.append(':'.join('{:x}'.format(rand.randint(0, 3)) for _ in range(8)))
+        self.assertEqual(napalm_base.helpers.ips(addrs),
+                         [napalm_base.helpers.ip(addr) for addr in addrs])
+        self.assertEqual(napalm_base.helpers.ips(addrs[:2], version=6),
+                         ['2001:db8:85a3::8a2e:370:7334', '2001:db8::3'])
+        self.assertRaises(ValueError, napalm_base.helpers.ips, ['192.168.17.1'], version=6)
+        self.assertRaises(ValueError, napalm_base.helpers.ips, ['2001:db8::3'], version=4)
+        self.assertRaises(AddrFormatError, napalm_base.helpers.ips, ['fake'])
+
+        # trailing whitespace, as in lines of CLI output
+        for addr in ('10.0.0.1\n', '10.0.0.1\r\n', '10.0.0.1 ', ' 10.0.0.1',
+                     '255.255.255.255\n', '2001:db8::3\n'):
+            try:
+                expected = napalm_base.helpers.ip(addr)
+            except AddrFormatError:
+                self.assertRaises(AddrFormatError, napalm_base.helpers.ips, [addr])
+            else:
+                self.assertEqual(napalm_base.helpers.ips([addr]), [expected])
+
     def test_ip(self):
         """
         Tests the helper function ```ip```:
@@ -329,6 +610,15 @@ class TestBaseHelpers(unittest.TestCase):
         self.assertEqual(napalm_base.helpers.as_number('65535.65535'), 4294967295)
         self.assertEqual(napalm_base.helpers.as_number(64001), 64001)
 
+    def test_as_numbers(self):
+        """Test the as_numbers helper function."""
+        values = ['64001', '1.0', '1.100', 64001, '65535.65535', 1.0, '1.0']
+        self.assertEqual(napalm_base.helpers.as_numbers(values),
+                         [64001, 65536, 65636, 64001, 4294967295, 65536, 65536])
+        self.assertEqual(napalm_base.helpers.as_number(1), 1)
+        self.assertEqual(napalm_base.helpers.as_number(1.0), 65536)
+        self.assertRaises(ValueError, napalm_base.helpers.as_numbers, ['64001', 'AS64001'])
+
     def test_convert_uptime_string_seconds(self):
         """
         Tests the parser function ```convert_uptime_string_seconds```:
@@ -0,0 +1,52 @@
+"""Test the cost of importing napalm_base."""
+
+# Python3 support
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Cumulative import time of napalm_base, in microseconds.
+IMPORT_TIME_BUDGET = 100000
+
+# Dependencies that must only be imported when actually used.
+LAZY_DEPENDENCIES = ('jinja2', 'jtextfsm', 'netaddr', 'yaml', 'pkg_resources')
+
+
+def _run(statement, *options):
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    process = subprocess.Popen((sys.executable, ) + options + ('-c', statement), env=env,
+                               stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    stdout, stderr = process.communicate()
+    assert process.returncode == 0, stderr
+    return stdout.decode('utf-8'), stderr.decode('utf-8')
+
+
+class TestImportTime(object):
+    """Make sure napalm_base stays cheap to import."""
+
+    def test_lazy_dependencies(self):
+        statement = 'import sys, napalm_base; print(",".join(sorted(sys.modules)))'
+        imported = _run(statement)[0].strip().split(',')
+        assert not [m for m in LAZY_DEPENDENCIES if m in imported]
+
+    @pytest.mark.skipif(sys.version_info < (3, 7), reason="-X importtime requires Python 3.7")
+    def test_import_time_budget(self):
+        # warm up the bytecode cache so we measure the import and not the compilation
+        _run('import napalm_base')
+        timings = []
+        for _ in range(3):
+            stderr = _run('import napalm_base', '-X', 'importtime')[1]
+            for line in stderr.splitlines():
+                fields = [f.strip() for f in line.split('|')]
+                if len(fields) == 3 and fields[2] == 'napalm_base':
+                    timings.append(int(fields[1]))
+        assert timings
+        assert min(timings) < IMPORT_TIME_BUDGET, timings
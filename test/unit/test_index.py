@@ -0,0 +1,90 @@
+"""Test the indexes over the getters output."""
+
+# Python3 support
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import pytest
+from netaddr.core import AddrFormatError
+
+from napalm_base import records
+from napalm_base.index import TableIndex
+
+
+MAC_ADDRESS_TABLE = [
+    {'mac': '00:1C:58:29:4A:71', 'interface': 'Ethernet47', 'vlan': 100, 'static': False,
+     'active': True, 'moves': 1, 'last_move': 1454417742.58},
+    {'mac': '00:1C:58:29:4A:C1', 'interface': 'Ethernet48', 'vlan': 200, 'static': False,
+     'active': True, 'moves': 2, 'last_move': 1453191948.11},
+    {'mac': '00:1C:58:29:4A:C2', 'interface': 'Ethernet48', 'vlan': 100, 'static': False,
+     'active': True, 'moves': 1, 'last_move': 1453191948.11},
+]
+
+ARP_TABLE = [
+    {'interface': 'Vlan100', 'mac': '00:1c:58:29:4a:71', 'ip': '10.0.0.12', 'age': 1.0},
+    {'interface': 'Vlan200', 'mac': '00:1C:58:29:4A:C1', 'ip': '10.0.1.7', 'age': 2.0},
+    {'interface': 'Vlan100', 'mac': '001c.5829.4ac2', 'ip': '10.0.0.31', 'age': 3.0},
+    {'interface': 'Vlan300', 'mac': '00:1C:58:29:4A:FF', 'ip': '2001:DB8::1', 'age': 4.0},
+]
+
+INTERFACES_IP = {
+    'Vlan100': {'ipv4': {'10.0.0.1': {'prefix_length': 24}}},
+    'Vlan200': {'ipv4': {'10.0.1.1': {'prefix_length': 24}}},
+    'Loopback0': {'ipv4': {'10.0.0.0': {'prefix_length': 16}},
+                  'ipv6': {'2001:DB8::1': {'prefix_length': 64},
+                           'FE80::3': {'prefix_length': 'N/A'}}},
+}
+
+
+class TestTableIndex(object):
+    """Test TableIndex."""
+
+    def setup_method(self, method):
+        self.index = TableIndex(MAC_ADDRESS_TABLE, ARP_TABLE, INTERFACES_IP)
+
+    def test_mac_table(self):
+        assert self.index.mac_table(mac='001c.5829.4a71') == MAC_ADDRESS_TABLE[:1]
+        assert self.index.mac_table(interface='Ethernet48') == MAC_ADDRESS_TABLE[1:]
+        assert self.index.mac_table(vlan=100) == [MAC_ADDRESS_TABLE[0], MAC_ADDRESS_TABLE[2]]
+        assert self.index.mac_table(interface='Ethernet48', vlan=100) == MAC_ADDRESS_TABLE[2:]
+        assert self.index.mac_table(mac='00:1C:58:29:4A:71', vlan=200) == []
+        assert self.index.mac_table(vlan=4000) == []
+        with pytest.raises(TypeError):
+            self.index.mac_table()
+
+    def test_arp_table(self):
+        assert self.index.arp_table(ip='10.0.0.12') == ARP_TABLE[:1]
+        assert self.index.arp_table(ip='2001:db8:0::1') == ARP_TABLE[3:]
+        assert self.index.arp_table(mac='00:1C:58:29:4A:C2') == ARP_TABLE[2:3]
+        assert self.index.arp_table(interface='Vlan100') == [ARP_TABLE[0], ARP_TABLE[2]]
+
+    def test_arp_table_by_vlan(self):
+        assert [e['ip'] for e in self.index.arp_table(vlan=100)] == ['10.0.0.12', '10.0.0.31']
+        assert self.index.arp_table(vlan=100, ip='10.0.0.31') == ARP_TABLE[2:3]
+        assert self.index.arp_table(vlan=200, ip='10.0.0.31') == []
+
+    def test_longest_prefix_match(self):
+        assert self.index.longest_prefix_match('10.0.0.200') == {
+            'interface': 'Vlan100', 'ip': '10.0.0.1', 'prefix_length': 24}
+        assert self.index.longest_prefix_match('10.0.9.1')['interface'] == 'Loopback0'
+        assert self.index.longest_prefix_match('2001:db8::ffff')['interface'] == 'Loopback0'
+        assert self.index.longest_prefix_match('192.0.2.1') is None
+
+    def test_trailing_newline(self):
+        """The values are normalized as helpers.mac and helpers.ip do, newline included."""
+        mac_address_table = [dict(MAC_ADDRESS_TABLE[0], mac='00:1C:58:29:4A:71\n')]
+        arp_table = [dict(ARP_TABLE[0], mac='00:1c:58:29:4a:71\n')]
+        index = TableIndex(mac_address_table, arp_table)
+        assert index.mac_table(mac='00:1C:58:29:4A:71') == mac_address_table
+        assert index.arp_table(mac='001c.5829.4a71') == arp_table
+        assert index.arp_table(vlan=100) == arp_table
+
+        # helpers.ip rejects them, instead of indexing an address that can't be queried
+        with pytest.raises(AddrFormatError):
+            TableIndex(arp_table=[dict(ARP_TABLE[0], ip='10.0.0.12\n')])
+        with pytest.raises(AddrFormatError):
+            TableIndex(interfaces_ip={'Vlan100': {'ipv4': {'10.0.0.1\n': {'prefix_length': 24}}}})
+
+    def test_records(self):
+        index = TableIndex(records.to_records(MAC_ADDRESS_TABLE, 'mac_address_table'))
+        assert [e.interface for e in index.mac_table(vlan=100)] == ['Ethernet47', 'Ethernet48']
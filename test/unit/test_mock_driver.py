@@ -146,3 +146,41 @@ class TestMockDriver(object):
         d.compare_config() == "a_diff"
         d.commit_config()
         d.close()
+
+    def test_get_many(self):
+        d = driver("blah", "bleh", "blih", optional_args=optional_args)
+        d.open()
+        facts, route = d.get_many(["get_facts", ("get_route_to", {"destination": "1.1.1.1"})],
+                                  return_exceptions=True)
+        assert facts["hostname"] == "localhost"
+        assert isinstance(route, NotImplementedError)
+
+        with pytest.raises(NotImplementedError):
+            d.get_many(["get_facts", "get_route_to"])
+        d.close()
+
+    def test_iter_arp_table(self):
+        d = driver("blah", "bleh", "blih", optional_args=optional_args)
+        d.open()
+        entries = d.iter_arp_table()
+        assert next(entries)["ip"] == "172.17.17.1"
+        assert [e["ip"] for e in entries] == ["172.17.17.2"]
+        d.close()
+
+    def test_getter_cache(self):
+        d = driver("blah", "bleh", "blih",
+                   optional_args=dict(optional_args, getter_cache=True))
+        d.open()
+        assert d.get_facts()["hostname"] == "localhost"
+        # served from the cache, the mocked data of the second call is not used
+        assert d.get_facts()["hostname"] == "localhost"
+        assert d.getter_cache.stats()["hits"] == 1
+        d.close()
+
+    def test_getter_records(self):
+        d = driver("blah", "bleh", "blih",
+                   optional_args=dict(optional_args, getter_records=True))
+        d.open()
+        entries = d.get_arp_table()
+        assert [e.ip for e in entries] == ["172.17.17.1", "172.17.17.2"]
+        d.close()
@@ -0,0 +1,106 @@
+"""Test the pool of drivers."""
+
+# Python3 support
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import os
+
+import pytest
+
+from napalm_base import get_network_driver
+from napalm_base.pool import DriverPool
+import napalm_base.exceptions
+
+
+BASE_PATH = os.path.dirname(__file__)
+
+
+driver = get_network_driver("mock")
+optional_args = {
+    "path": os.path.join(BASE_PATH, "test_mock_driver"),
+    "profile": ["eos"],
+}
+
+
+def _acquire(pool, hostname="blah", **kwargs):
+    return pool.acquire(driver, hostname, "bleh", "blih",
+                        optional_args=kwargs.get("optional_args", optional_args))
+
+
+class TestDriverPool(object):
+    """Test DriverPool."""
+
+    def test_reuse(self):
+        pool = DriverPool()
+        d = _acquire(pool)
+        assert d.is_alive() == {u'is_alive': True}
+        pool.release(d)
+        assert _acquire(pool) is d
+        assert len(pool) == 1
+
+    def test_key(self):
+        pool = DriverPool(max_sessions_per_host=2)
+        d = _acquire(pool)
+        pool.release(d)
+        other_args = dict(optional_args, profile=["junos"])
+        assert _acquire(pool, optional_args=other_args) is not d
+        assert _acquire(pool, hostname="other") is not d
+
+    def test_health_check(self):
+        pool = DriverPool()
+        d = _acquire(pool)
+        pool.release(d)
+        d.close()
+        new = _acquire(pool)
+        assert new is not d
+        assert new.is_alive() == {u'is_alive': True}
+        assert len(pool) == 1
+
+    def test_idle_timeout(self):
+        pool = DriverPool(idle_timeout=0)
+        d = _acquire(pool)
+        pool.release(d)
+        pool.close_idle()
+        assert d.is_alive() == {u'is_alive': False}
+        assert len(pool) == 0
+
+    def test_lru_eviction(self):
+        pool = DriverPool(max_sessions=2)
+        devices = [_acquire(pool, hostname=h) for h in ("a", "b")]
+        for d in devices:
+            pool.release(d)
+        _acquire(pool, hostname="a")  # "b" becomes the least recently used
+        c = _acquire(pool, hostname="c")
+        assert devices[0].is_alive() == {u'is_alive': True}
+        assert devices[1].is_alive() == {u'is_alive': False}
+        assert c.is_alive() == {u'is_alive': True}
+        assert len(pool) == 2
+
+    def test_exhausted(self):
+        pool = DriverPool(max_sessions_per_host=1, acquire_timeout=0)
+        _acquire(pool)
+        with pytest.raises(napalm_base.exceptions.PoolExhaustedError):
+            _acquire(pool)
+
+    def test_connection(self):
+        with DriverPool() as pool:
+            with pool.connection(driver, "blah", "bleh", "blih",
+                                 optional_args=optional_args) as d:
+                assert d.is_alive() == {u'is_alive': True}
+            assert len(pool) == 1
+
+            with pytest.raises(napalm_base.exceptions.ConnectionClosedException):
+                with pool.connection(driver, "blah", "bleh", "blih",
+                                     optional_args=optional_args) as d:
+                    raise napalm_base.exceptions.ConnectionClosedException("boom")
+            assert len(pool) == 0
+            assert d.is_alive() == {u'is_alive': False}
+
+        assert len(pool) == 0
+
+    def test_failed_open(self):
+        pool = DriverPool()
+        with pytest.raises(napalm_base.exceptions.ConnectionException):
+            _acquire(pool, optional_args=dict(optional_args, fail_on_open=True))
+        assert len(pool) == 0
@@ -0,0 +1,93 @@
+"""Test the record types."""
+
+# Python3 support
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import pickle
+
+import pytest
+
+from napalm_base.base import NetworkDriver
+from napalm_base import records
+from napalm_base.test import helpers
+from napalm_base.test import models
+
+
+ARP_TABLE = [
+    {'interface': 'Ethernet1', 'mac': '5C:5E:AB:DA:3C:F0', 'ip': '172.17.17.1', 'age': 12.0},
+    {'interface': 'Ethernet2', 'mac': '5C:5E:AB:DA:3C:FF', 'ip': '172.17.17.2', 'age': 13.0},
+]
+
+ROUTE = {
+    'protocol': 'BGP', 'current_active': True, 'last_active': True, 'age': 1,
+    'next_hop': '192.0.2.1', 'outgoing_interface': 'Ethernet1', 'selected_next_hop': True,
+    'preference': 20, 'inactive_reason': '', 'routing_table': 'default',
+    'protocol_attributes': {'local_as': 65001},
+}
+
+
+class FakeDriver(NetworkDriver):
+    """Return static tables."""
+
+    def __init__(self, hostname, username, password, timeout=60, optional_args=None):
+        self.calls = 0
+
+    def get_arp_table(self):
+        self.calls += 1
+        return ARP_TABLE
+
+    def get_route_to(self, destination='', protocol=''):
+        return {'1.0.4.0/24': [ROUTE]}
+
+
+class TestRecords(object):
+    """Test the record types."""
+
+    def test_record_class(self):
+        cls = records.record_class('arp_table')
+        assert cls is records.record_class('arp_table')
+        assert cls._fields == ('age', 'interface', 'ip', 'mac')
+        entry = cls.from_dict(ARP_TABLE[0])
+        assert entry.ip == '172.17.17.1'
+        assert entry.to_dict() == ARP_TABLE[0]
+        assert helpers.test_model(models.arp_table, entry.to_dict())
+        assert not hasattr(entry, '__dict__')
+
+    def test_invalid_model(self):
+        with pytest.raises(ValueError):
+            records.record_class('not_a_model')
+        with pytest.raises(ValueError):
+            records.record_class('cpu')  # '%usage'
+
+    def test_conversions(self):
+        converted = records.to_records({'1.0.4.0/24': [ROUTE]}, 'route', 'dict_of_lists')
+        assert converted['1.0.4.0/24'][0].protocol == 'BGP'
+        assert records.to_dicts(converted, 'dict_of_lists') == {'1.0.4.0/24': [ROUTE]}
+        assert records.to_dicts(records.to_records(ARP_TABLE, 'arp_table')) == ARP_TABLE
+
+    def test_pickle(self):
+        entry = records.record_class('arp_table').from_dict(ARP_TABLE[0])
+        copied = pickle.loads(pickle.dumps(entry, pickle.HIGHEST_PROTOCOL))
+        assert copied == entry
+        assert type(copied) is type(entry)
+
+    def test_to_plain(self):
+        converted = records.to_records({'1.0.4.0/24': [ROUTE]}, 'route', 'dict_of_lists')
+        assert records.to_plain(converted) == {'1.0.4.0/24': [ROUTE]}
+        assert records.to_plain(records.to_records(ARP_TABLE, 'arp_table')) == ARP_TABLE
+        assert records.to_plain('172.17.17.1') == '172.17.17.1'
+
+    def test_getters(self):
+        d = FakeDriver('blah', 'bleh', 'blih', optional_args={'getter_records': True})
+        table = d.get_arp_table()
+        assert [e.mac for e in table] == ['5C:5E:AB:DA:3C:F0', '5C:5E:AB:DA:3C:FF']
+        assert [e.ip for e in d.iter_arp_table()] == ['172.17.17.1', '172.17.17.2']
+        assert [r.next_hop for _, r in d.iter_route_to()] == ['192.0.2.1']
+
+    def test_getters_with_cache(self):
+        d = FakeDriver('blah', 'bleh', 'blih', optional_args={'getter_records': True,
+                                                              'getter_cache': True})
+        assert d.get_arp_table()[0].interface == 'Ethernet1'
+        assert d.get_arp_table()[0].interface == 'Ethernet1'
+        assert d.calls == 1
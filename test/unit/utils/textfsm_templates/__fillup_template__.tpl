@@ -0,0 +1,6 @@
+Value Fillup VLAN (\d+)
+Value MAC (\S+)
+
+Start
+  ^mac ${MAC} -> Record
+  ^vlan ${VLAN} -> Record
@@ -1,4 +1,6 @@
 """Tests for the validate methods."""
+import copy
+
 import pytest
 
 from napalm_base import validate
@@ -273,6 +275,79 @@ _compare_getter = [
                                                          u'nested': False}}},
                             u'nested': True}}}
     ),
+    (
+        # literal values, matched through the index
+        {"list": [{"vlan": 20, "interface": "^Eth2$"}, {"vlan": 10, "interface": "^Eth1$"}]},
+        [{"vlan": 10, "interface": "Eth1"}, {"vlan": 10, "interface": "Eth2"},
+         {"vlan": 20, "interface": "Eth2"}],
+        {u'complies': True, u'extra': [], u'missing': [],
+         u'present': [{"vlan": 20, "interface": "^Eth2$"}, {"vlan": 10, "interface": "^Eth1$"}]}
+    ),
+    (
+        # regexes match substrings, the first matching element is taken
+        {"list": [{"vlan": 10, "interface": "Eth1"}, {"vlan": 10, "interface": "^Eth1$"}]},
+        [{"vlan": 10, "interface": "Eth12"}, {"vlan": 10, "interface": "Eth1"}],
+        {u'complies': True, u'extra': [], u'missing': [],
+         u'present': [{"vlan": 10, "interface": "Eth1"}, {"vlan": 10, "interface": "^Eth1$"}]}
+    ),
+    (
+        {"list": [{"vlan": 10, "interface": "^Eth1$"}, {"vlan": 10, "interface": "^Eth1$"}],
+         "_mode": "strict"},
+        [{"vlan": 10, "interface": "Eth1"}, {"vlan": 10, "interface": "Eth2"},
+         {"vlan": "10", "interface": "Eth1"}],
+        {u'complies': False, u'missing': [{"vlan": 10, "interface": "^Eth1$"}],
+         u'extra': [{"vlan": 10, "interface": "Eth2"}, {"vlan": "10", "interface": "Eth1"}],
+         u'present': [{"vlan": 10, "interface": "^Eth1$"}]}
+    ),
+    (
+        {"list": [{"ip": "^10\\.0\\.0\\.1$", "up": True}, {"ip": "^10.0.0.2$", "up": True}]},
+        [{"ip": "10.0.0.1", "up": False}, {"ip": "10.0.0.1\n", "up": 1},
+         {"ip": "10a0a0a2", "up": True}],
+        {u'complies': True, u'extra': [], u'missing': [],
+         u'present': [{"ip": "^10\\.0\\.0\\.1$", "up": True}, {"ip": "^10.0.0.2$", "up": True}]}
+    ),
+]
+
+_compare_getter += [
+    (
+        # the literal mode applies to the nested values
+        {"_mode": "literal", "os_version": "7.0(3)I2(2d)", "vlans": {"list": ["1.0"]},
+         "interfaces": {"Eth1": {"description": "a.c"}}},
+        {"os_version": "7.0(3)I2(2d)", "vlans": ["100", "1.0"],
+         "interfaces": {"Eth1": {"description": "abc"}}},
+        {u'complies': False, u'extra': [], u'missing': [],
+         u'present': {'os_version': {u'complies': True, u'nested': False},
+                      'vlans': {u'complies': True, u'nested': True},
+                      'interfaces': {u'complies': False, u'nested': True,
+                                     u'diff': {u'complies': False, u'extra': [], u'missing': [],
+                                               u'present': {'Eth1': {
+                                                   u'complies': False, u'nested': True,
+                                                   u'diff': {u'complies': False, u'extra': [],
+                                                             u'missing': [],
+                                                             u'present': {'description': {
+                                                                 u'complies': False,
+                                                                 u'nested': False,
+                                                                 u'expected_value': 'a.c',
+                                                                 u'actual_value': 'abc'}}}}}}}}}
+    ),
+    (
+        {"hostname": validate.Literal("n9k.$"), "uptime": validate.Literal("<10"),
+         "vendor": "^Cisco$"},
+        {"hostname": "n9k.$", "uptime": 5, "vendor": "Cisco"},
+        {u'complies': False, u'extra': [], u'missing': [],
+         u'present': {'hostname': {u'complies': True, u'nested': False},
+                      'uptime': {u'complies': False, u'nested': False,
+                                 u'expected_value': '<10', u'actual_value': 5},
+                      'vendor': {u'complies': True, u'nested': False}}}
+    ),
+    (
+        {"_mode": "strict", "list": [{"mac": validate.Literal("aa:bb"), "vlan": 1},
+                                     {"mac": validate.Literal("aa:bb"), "vlan": 1}]},
+        [{"mac": "aa:bb\n", "vlan": 1}, {"mac": "aa:bb", "vlan": 1}],
+        {u'complies': False, u'extra': [{"mac": "aa:bb\n", "vlan": 1}],
+         u'missing': [{"mac": "aa:bb", "vlan": 1}],
+         u'present': [{"mac": "aa:bb", "vlan": 1}]}
+    ),
 ]
 
 
@@ -300,3 +375,36 @@ class TestValidate:
             assert validate.compare_numeric("<1", "asdasd2")
         with pytest.raises(ValueError):
             assert validate.compare_numeric("<1", "2asdasd")
+
+    def test_regex_cache(self, monkeypatch):
+        monkeypatch.setattr(validate, 'REGEX_CACHE_SIZE', 3)
+        monkeypatch.setattr(validate, '_regex_cache', {})
+        for i in range(10):
+            assert validate._compare_getter({'a': '^{}$'.format(i)}, {'a': i})['complies']
+            assert len(validate._regex_cache) <= 3
+        assert validate._regex('^9$') is validate._regex('^9$')
+
+    def test__compare_getter_list_indexes_numbers(self, monkeypatch):
+        """The numbers, booleans and None are matched with the indexes, as the literals."""
+        calls = []
+
+        def _list_index(dst, fields):
+            calls.append(fields)
+            return list_index(dst, fields)
+
+        list_index = validate._list_index
+        monkeypatch.setattr(validate, '_list_index', _list_index)
+        src = {"_mode": "strict", "list": [{"vlan": vlan, "tagged": True, "name": None}
+                                           for vlan in range(100)]}
+        dst = [{"vlan": vlan, "tagged": True, "name": None} for vlan in reversed(range(101))]
+        result = validate._compare_getter(src, dst)
+        assert calls == [(("name", "eq"), ("tagged", "eq"), ("vlan", "eq"))]
+        assert result["present"] == src["list"]
+        assert result["extra"] == [{"vlan": 100, "tagged": True, "name": None}]
+
+    @pytest.mark.parametrize('src, dst, result', _compare_getter)
+    def test__compare_getter_keeps_dst(self, src, dst, result):
+        """The actual values are not modified by the comparison."""
+        original_dst = copy.deepcopy(dst)
+        validate._compare_getter(src, dst)
+        assert dst == original_dst
@@ -3,9 +3,14 @@ from __future__ import unicode_literals
 
 from napalm_base.base import NetworkDriver
 from napalm_base import constants as C
+from napalm_base import validate
+from napalm_base.exceptions import ValidationException
+import copy
 import json
+import pickle
 
 import os
+import pytest
 import yaml
 
 
@@ -143,6 +148,35 @@ class TestValidate:
 
         assert expected_report == actual_report, yaml.safe_dump(actual_report)
 
+    @pytest.mark.parametrize('case', ['non_strict_fail', 'non_strict_pass', 'simple_fail',
+                                      'strict_fail', 'strict_pass', 'strict_pass_skip'])
+    def test_plan(self, case):
+        """A compiled plan gives the same report for every device and leaves the source as is."""
+        mocked_data = os.path.join(BASEPATH, "mocked_data", case)
+        expected_report = _read_yaml(os.path.join(mocked_data, "report.yml"))
+        source = _read_yaml(os.path.join(mocked_data, "validate.yml"))
+        original_source = copy.deepcopy(source)
+
+        plan = validate.compile_plan(validation_source=source)
+        assert source == original_source
+        assert validate.compile_plan(plan) is plan
+
+        for plan in (plan, pickle.loads(pickle.dumps(plan))):
+            for _ in range(2):
+                actual_report = FakeDriver(mocked_data).compliance_report(validation_source=plan)
+                assert expected_report == actual_report, yaml.safe_dump(actual_report)
+            actual_report = FakeDriver(mocked_data).compliance_report(plan)
+            assert expected_report == actual_report, yaml.safe_dump(actual_report)
+
+    @pytest.mark.parametrize('source', [
+        [{'get_facts': {'uptime': '<1a1'}}],
+        [{'get_facts': {'hostname': '(unbalanced'}}],
+        [{'get_facts': {'_mode': 'unknown', 'hostname': 'n9k2'}}],
+    ])
+    def test_plan_invalid(self, source):
+        with pytest.raises(ValidationException):
+            validate.compile_plan(validation_source=source)
+
 
 class FakeDriver(NetworkDriver):
     """This is a fake NetworkDriver."""
@@ -156,7 +190,7 @@ class FakeDriver(NetworkDriver):
                 with open(filename, 'r') as f:
                     return json.loads(f.read())
             return func
-        if name.startswith("get_") or name in C.ACTION_TYPE_METHODS:
+        if name.startswith("get_") and name != "get_many" or name in C.ACTION_TYPE_METHODS:
             filename = os.path.join(self.path, "{}.json".format(name))
             return load_json(filename)
         elif name == "method_not_implemented":